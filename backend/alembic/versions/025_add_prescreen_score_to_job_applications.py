@@ -0,0 +1,30 @@
+"""Add prescreen_score to job_applications table.
+
+Revision ID: 025_add_prescreen_score
+Revises: 024_reset_opps_coopts
+Create Date: 2026-10-18
+
+Stores the local (CPU-only) provisional matching score computed at
+submission time, used to order applications before LLM scoring.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "025_add_prescreen_score"
+down_revision = "024_reset_opps_coopts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_applications",
+        sa.Column("prescreen_score", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_applications", "prescreen_score")
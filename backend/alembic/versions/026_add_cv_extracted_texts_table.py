@@ -0,0 +1,35 @@
+"""Add cv_extracted_texts table.
+
+Revision ID: 026_add_cv_extracted_texts
+Revises: 025_add_prescreen_score
+Create Date: 2026-10-18
+
+Content-addressed cache of extracted CV text (SHA-256 of the file bytes),
+so the same CV is not parsed again by the application form, the CV
+transformer or the CV generator.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "026_add_cv_extracted_texts"
+down_revision = "025_add_prescreen_score"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cv_extracted_texts",
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("page_count", sa.Integer(), nullable=False),
+        sa.Column("extractor_version", sa.String(20), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cv_extracted_texts")
@@ -0,0 +1,29 @@
+"""Add trigram index on turnoverit_skills names.
+
+Revision ID: 027_add_skills_trgm_index
+Revises: 026_add_cv_extracted_texts
+Create Date: 2026-10-18
+
+GIN pg_trgm index on lower(name) for the skills autocomplete
+(substring LIKE and similarity search).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "027_add_skills_trgm_index"
+down_revision = "026_add_cv_extracted_texts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_turnoverit_skills_name_trgm "
+        "ON turnoverit_skills USING gin (lower(name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_turnoverit_skills_name_trgm")
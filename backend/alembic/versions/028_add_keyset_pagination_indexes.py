@@ -0,0 +1,42 @@
+"""Add keyset pagination indexes on the HR and cooptation lists.
+
+Revision ID: 028_add_keyset_indexes
+Revises: 027_add_skills_trgm_index
+Create Date: 2026-10-18
+
+Indexes matching the list orderings (date DESC, id DESC), with the list
+filter as leading column, so a page after a cursor is an index range scan.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "028_add_keyset_indexes"
+down_revision = "027_add_skills_trgm_index"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_job_postings_created_at_id": "job_postings (created_at DESC, id DESC)",
+    "ix_job_postings_status_created_at_id": "job_postings (status, created_at DESC, id DESC)",
+    "ix_cooptations_submitted_at_id": "cooptations (submitted_at DESC, id DESC)",
+    "ix_cooptations_submitter_submitted_at_id": (
+        "cooptations (submitter_id, submitted_at DESC, id DESC)"
+    ),
+    "ix_cooptations_opportunity_submitted_at_id": (
+        "cooptations (opportunity_id, submitted_at DESC, id DESC)"
+    ),
+    "ix_job_applications_posting_created_at_id": (
+        "job_applications (job_posting_id, created_at DESC, id DESC)"
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, definition in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
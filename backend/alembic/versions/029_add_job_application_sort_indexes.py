@@ -0,0 +1,55 @@
+"""Add sort and filter indexes on job applications.
+
+Revision ID: 029_add_application_sort_indexes
+Revises: 028_add_keyset_indexes
+Create Date: 2026-10-18
+
+One index per sort of the posting applications list, matching the ORDER BY
+built by JobApplicationRepository (sort expression DESC NULLS LAST, then
+created_at DESC, id DESC): the first page of a posting is read in index
+order instead of sorting all its applications. The tjm and salary sorts are
+expression indexes on the same COALESCE as the repository.
+
+The status index serves the status filter with the date sort and, with
+is_read included, the per-status counts of a posting (index-only scan).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "029_add_application_sort_indexes"
+down_revision = "028_add_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_job_applications_posting_score": (
+        "job_applications (job_posting_id, matching_score DESC NULLS LAST, "
+        "created_at DESC, id DESC)"
+    ),
+    "ix_job_applications_posting_prescreen": (
+        "job_applications (job_posting_id, prescreen_score DESC NULLS LAST, "
+        "created_at DESC, id DESC)"
+    ),
+    "ix_job_applications_posting_tjm": (
+        "job_applications (job_posting_id, coalesce(tjm_desired, tjm_current) DESC NULLS LAST, "
+        "created_at DESC, id DESC)"
+    ),
+    "ix_job_applications_posting_salary": (
+        "job_applications (job_posting_id, "
+        "coalesce(salary_desired, salary_current) DESC NULLS LAST, created_at DESC, id DESC)"
+    ),
+    "ix_job_applications_posting_status_created_at_id": (
+        "job_applications (job_posting_id, status, created_at DESC, id DESC) INCLUDE (is_read)"
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, definition in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,103 @@
+"""Move job application CV text to application_documents.
+
+Revision ID: 030_add_application_documents
+Revises: 029_add_application_sort_indexes
+Create Date: 2026-10-18
+
+The extracted CV text (tens of KB) is only read to score or re-analyse an
+application, but it bloated every job_applications row read. It moves to a
+side table keyed by application id.
+
+The backfill walks the table by id range, BACKFILL_CHUNK_SIZE rows per
+statement (id > last id of the previous chunk), copying and clearing the
+texts of each chunk in its own transaction (autocommit block): rows are
+locked one chunk at a time instead of the whole table for the migration
+duration, and each chunk starts where the previous one ended. Texts
+written meanwhile by the running release are copied again in the
+transaction that drops the column, after locking the table, so none is
+lost (the drop is a catalog-only change in PostgreSQL).
+"""
+
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "030_add_application_documents"
+down_revision = "029_add_application_sort_indexes"
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 500
+
+MOVE_CHUNK = sa.text(
+    """
+    WITH chunk AS (
+        SELECT id, cv_text FROM job_applications
+        WHERE id > :last_id
+        ORDER BY id
+        LIMIT :chunk_size
+        FOR UPDATE
+    ), copied AS (
+        INSERT INTO application_documents (application_id, cv_text, created_at, updated_at)
+        SELECT id, cv_text, now(), now() FROM chunk
+        WHERE cv_text IS NOT NULL
+        ON CONFLICT (application_id) DO UPDATE SET cv_text = EXCLUDED.cv_text
+    ), cleared AS (
+        UPDATE job_applications SET cv_text = NULL
+        FROM chunk
+        WHERE job_applications.id = chunk.id AND chunk.cv_text IS NOT NULL
+    )
+    SELECT id FROM chunk ORDER BY id DESC LIMIT 1
+    """
+)
+
+COPY_REMAINING = sa.text(
+    """
+    INSERT INTO application_documents (application_id, cv_text, created_at, updated_at)
+    SELECT id, cv_text, now(), now() FROM job_applications
+    WHERE cv_text IS NOT NULL
+    ON CONFLICT (application_id) DO UPDATE SET cv_text = EXCLUDED.cv_text
+    """
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "application_documents",
+        sa.Column(
+            "application_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("job_applications.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("cv_text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+
+    last_id = UUID(int=0)
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while last_id is not None:
+            last_id = connection.execute(
+                MOVE_CHUNK, {"last_id": last_id, "chunk_size": BACKFILL_CHUNK_SIZE}
+            ).scalar()
+
+    # Same transaction as the drop: no write between the catch-up and the drop
+    op.execute("LOCK TABLE job_applications IN ACCESS EXCLUSIVE MODE")
+    op.execute(COPY_REMAINING)
+    op.drop_column("job_applications", "cv_text")
+
+
+def downgrade() -> None:
+    op.add_column("job_applications", sa.Column("cv_text", sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE job_applications SET cv_text = application_documents.cv_text "
+        "FROM application_documents "
+        "WHERE application_documents.application_id = job_applications.id"
+    )
+    op.drop_table("application_documents")
@@ -0,0 +1,151 @@
+"""Backfill prescreen_score of applications submitted before pre-scoring.
+
+Revision ID: 031_backfill_prescreen_scores
+Revises: 030_add_application_documents
+Create Date: 2026-10-18
+
+Applications created before 025 (or without extracted CV text) have no
+prescreen_score: they sorted last on sort_by=prescreen and were never
+picked by the pending analysis. They are scored once here, with the same
+local scorer as at submission (0 without CV text). The scoring below is a
+frozen copy of LocalMatchingScorer.score as of this revision: migrations
+do not import application code, so later scorer changes neither alter
+this backfill nor break upgrades from older databases.
+
+Rows are read BACKFILL_CHUNK_SIZE at a time by ascending id and each chunk
+is committed on its own (autocommit block).
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "031_backfill_prescreen_scores"
+down_revision = "030_add_application_documents"
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 500
+
+SELECT_CHUNK = sa.text(
+    """
+    SELECT ja.id, d.cv_text, p.skills, p.qualifications
+    FROM job_applications ja
+    JOIN job_postings p ON p.id = ja.job_posting_id
+    LEFT JOIN application_documents d ON d.application_id = ja.id
+    WHERE ja.prescreen_score IS NULL AND ja.id > :last_id
+    ORDER BY ja.id
+    LIMIT :chunk_size
+    """
+).columns(skills=sa.JSON)
+
+UPDATE_SCORE = sa.text(
+    "UPDATE job_applications SET prescreen_score = :score "
+    "WHERE id = :id AND prescreen_score IS NULL"
+)
+
+
+# Frozen copy of app.infrastructure.matching.local_scorer (revision 031)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9.+#]*[a-z0-9+#]")
+_STOPWORDS = frozenset(
+    (
+        "a au aux avec ce ces dans de des du elle en et il la le les leur mais ou par pas "
+        "pour que qui sa se ses son sur un une vos votre nous vous est sont etre avoir an ans "
+        "and the of to in for with on or is are be as at by "
+        "requis souhaite souhaitee experience connaissance connaissances maitrise bonne bon tres"
+    ).split()
+)
+_SKILLS_WEIGHT = 0.7
+_QUALIFICATIONS_WEIGHT = 0.3
+_K1 = 1.2
+_B = 0.75
+_AVERAGE_CV_TOKENS = 600
+_MAX_CV_CHARS = 10000
+
+
+def _tokenize(text: str, keep_stopwords: bool = False) -> list[str]:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    normalized = "".join(c for c in decomposed if not unicodedata.combining(c))
+    tokens = _TOKEN_PATTERN.findall(normalized)
+    if keep_stopwords:
+        return tokens
+    return [t for t in tokens if t not in _STOPWORDS and (len(t) > 1 or t in {"c", "r"})]
+
+
+def _prescreen_score(
+    cv_text: str | None, skills: list[str] | None, qualifications: str | None
+) -> int:
+    """Provisional score (0-100) of a CV for a job posting."""
+    if not cv_text:
+        return 0
+    all_tokens = _tokenize(cv_text[:_MAX_CV_CHARS], keep_stopwords=True)
+    cv_tokens = [t for t in all_tokens if t not in _STOPWORDS]
+    if not cv_tokens:
+        return 0
+
+    skill_score = None
+    if skills:
+        haystack = f" {' '.join(all_tokens)} "
+        matched = 0
+        for skill in skills:
+            skill_tokens = _tokenize(skill, keep_stopwords=True)
+            if skill_tokens and f" {' '.join(skill_tokens)} " in haystack:
+                matched += 1
+        skill_score = matched / len(skills)
+
+    qualifications_score = None
+    query_terms = set(_tokenize(qualifications or ""))
+    if query_terms:
+        frequencies = Counter(cv_tokens)
+        length_norm = 1 - _B + _B * len(cv_tokens) / _AVERAGE_CV_TOKENS
+        total = 0.0
+        for term in query_terms:
+            tf = frequencies.get(term, 0)
+            if tf:
+                total += tf * (_K1 + 1) / (tf + _K1 * length_norm) / (_K1 + 1)
+        qualifications_score = total / len(query_terms)
+
+    if skill_score is None and qualifications_score is None:
+        score = 0.0
+    elif skill_score is None:
+        score = qualifications_score
+    elif qualifications_score is None:
+        score = skill_score
+    else:
+        score = _SKILLS_WEIGHT * skill_score + _QUALIFICATIONS_WEIGHT * qualifications_score
+    return max(0, min(100, round(score * 100)))
+
+
+def upgrade() -> None:
+    last_id = UUID(int=0)
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            rows = connection.execute(
+                SELECT_CHUNK, {"last_id": last_id, "chunk_size": BACKFILL_CHUNK_SIZE}
+            ).all()
+            if not rows:
+                break
+            connection.execute(
+                UPDATE_SCORE,
+                [
+                    {
+                        "id": row.id,
+                        "score": _prescreen_score(row.cv_text, row.skills, row.qualifications),
+                    }
+                    for row in rows
+                ],
+            )
+            last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    # Backfilled scores are valid pre-scores: nothing to undo
+    pass
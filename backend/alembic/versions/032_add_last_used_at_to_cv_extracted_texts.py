@@ -0,0 +1,36 @@
+"""Add last_used_at to cv_extracted_texts table.
+
+Revision ID: 032_cv_extracted_texts_ttl
+Revises: 031_backfill_prescreen_scores
+Create Date: 2026-10-18
+
+Extracted texts are CV content: texts unused for CV_TEXT_CACHE_TTL_DAYS
+are no longer served and are purged on cache writes. Existing rows start
+from their creation date.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "032_cv_extracted_texts_ttl"
+down_revision = "031_backfill_prescreen_scores"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cv_extracted_texts",
+        sa.Column("last_used_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        "UPDATE cv_extracted_texts SET last_used_at = created_at WHERE created_at IS NOT NULL"
+    )
+    op.create_index("ix_cv_extracted_texts_last_used_at", "cv_extracted_texts", ["last_used_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cv_extracted_texts_last_used_at", table_name="cv_extracted_texts")
+    op.drop_column("cv_extracted_texts", "last_used_at")
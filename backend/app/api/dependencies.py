@@ -7,8 +7,8 @@ from fastapi import Depends, Header, HTTPException
 
 from app.dependencies import DbSession
 from app.domain.exceptions import InvalidTokenError
-from app.infrastructure.database.repositories import UserRepository
 from app.infrastructure.security.jwt import decode_token
+from app.infrastructure.security.principal import Principal, resolve_principal
 
 
 async def get_current_user_id(
@@ -38,6 +38,43 @@ async def get_current_user_id(
         raise HTTPException(status_code=401, detail=str(e))
 
 
+async def authenticate(
+    db: DbSession,
+    authorization: str,
+    require_active: bool = True,
+) -> Principal:
+    """Verify the bearer token and return the caller's principal.
+
+    The principal (role, active flag, Boond resource id) comes from the
+    principal cache, so most requests make no user query.
+
+    Args:
+        db: Database session, only used on a cache miss.
+        authorization: Authorization header (Bearer token).
+        require_active: Reject deactivated accounts.
+
+    Returns:
+        Authenticated principal.
+
+    Raises:
+        HTTPException: If not authenticated or account deactivated.
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Non authentifié")
+
+    token = authorization[7:]
+    payload = decode_token(token, expected_type="access")
+    principal = await resolve_principal(db, UUID(payload.sub))
+
+    if not principal:
+        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
+
+    if require_active and not principal.is_active:
+        raise HTTPException(status_code=403, detail="Compte désactivé")
+
+    return principal
+
+
 async def require_admin(
     db: DbSession,
     authorization: str = Header(default=""),
@@ -64,8 +101,7 @@ async def require_admin(
         raise HTTPException(status_code=401, detail=str(e))
 
     user_id = UUID(payload.sub)
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+    user = await resolve_principal(db, user_id)
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
@@ -102,8 +138,7 @@ async def require_admin_or_rh(
         raise HTTPException(status_code=401, detail=str(e))
 
     user_id = UUID(payload.sub)
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+    user = await resolve_principal(db, user_id)
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
@@ -140,8 +175,7 @@ async def require_admin_or_commercial(
         raise HTTPException(status_code=401, detail=str(e))
 
     user_id = UUID(payload.sub)
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+    user = await resolve_principal(db, user_id)
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
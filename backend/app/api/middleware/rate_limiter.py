@@ -1,12 +1,17 @@
-"""Rate limiting middleware using slowapi with Redis backend."""
+"""Route rate limits ("5/minute"), checked by the shared sliding window limiter.
+
+Limits are counted per route and per user (or client IP) by the Redis
+limiter of app.infrastructure.security.rate_limiter.
+"""
+
+from collections.abc import Callable
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
-from app.config import settings
+from app.infrastructure.security.rate_limiter import RateLimitExceeded, rate_limit
+
+RATE_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
 
 
 def get_client_ip(request: Request) -> str:
@@ -23,7 +28,7 @@ def get_client_ip(request: Request) -> str:
         return real_ip
 
     # Fall back to direct client IP
-    return get_remote_address(request)
+    return request.client.host if request.client else "127.0.0.1"
 
 
 def get_user_identifier(request: Request) -> str:
@@ -37,15 +42,28 @@ def get_user_identifier(request: Request) -> str:
     return f"ip:{get_client_ip(request)}"
 
 
-# Create limiter with Redis backend
-# Note: headers_enabled=False because enabling it requires adding Response parameter
-# to every rate-limited endpoint, which is more invasive
-limiter = Limiter(
-    key_func=get_user_identifier,
-    storage_uri=settings.REDIS_URL,
-    strategy="fixed-window",
-    headers_enabled=False,
-)
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Parse a rate such as "5/minute" or "10/hour" into (limit, window in seconds)."""
+    count, _, unit = rate.partition("/")
+    unit = unit.strip().lower().removesuffix("s")
+    if not count.strip().isdigit() or unit not in RATE_UNITS:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    return int(count), RATE_UNITS[unit]
+
+
+class Limiter:
+    """Decorators limiting routes to a rate, keyed by key_func(request)."""
+
+    def __init__(self, key_func: Callable[[Request], str]) -> None:
+        self._key_func = key_func
+
+    def limit(self, rate: str) -> Callable[[Callable], Callable]:
+        """Limit a route (which must take a `request: Request` argument) to a rate."""
+        limit, window = parse_rate(rate)
+        return rate_limit(limit=limit, window=window, key_func=self._key_func)
+
+
+limiter = Limiter(key_func=get_user_identifier)
 
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Response:
@@ -54,13 +72,11 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Res
         status_code=429,
         content={
             "detail": "Trop de requêtes. Veuillez réessayer plus tard.",
-            "retry_after": exc.detail,
+            "retry_after": exc.retry_after,
         },
         headers={
-            "Retry-After": str(exc.detail),
-            "X-RateLimit-Limit": request.state.view_rate_limit
-            if hasattr(request.state, "view_rate_limit")
-            else "unknown",
+            "Retry-After": str(exc.retry_after),
+            "X-RateLimit-Limit": str(exc.limit),
         },
     )
 
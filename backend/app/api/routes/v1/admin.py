@@ -1,11 +1,9 @@
 """Admin endpoints for system management."""
 
-from datetime import UTC
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import delete, select
 
 from app.api.dependencies import AdminUser
 from app.api.schemas.admin import (
@@ -52,19 +50,21 @@ from app.application.use_cases.admin.users import (
     UpdateUserCommand,
     UserNotFoundError,
 )
-from app.dependencies import AppSettings, AppSettingsSvc, DbSession
+from app.dependencies import AppSettings, AppSettingsSvc, DbSession, UnitOfWork
 from app.infrastructure.anonymizer.gemini_anonymizer import GeminiAnonymizer
 from app.infrastructure.anonymizer.job_posting_anonymizer import SKILLS_SYNC_INTERVAL
+from app.infrastructure.anonymizer.skills_snapshot import get_skills_store
 from app.infrastructure.boond.client import BoondClient
 from app.infrastructure.cache.redis import CacheService
-from app.infrastructure.database.models import TurnoverITSkillModel, TurnoverITSkillsMetadataModel
 from app.infrastructure.database.repositories import OpportunityRepository, UserRepository
+from app.infrastructure.security.principal import get_principal_cache
 from app.infrastructure.settings import (
     AVAILABLE_CLAUDE_MODELS,
     AVAILABLE_CV_AI_PROVIDERS,
     AVAILABLE_GEMINI_MODELS,
 )
 from app.infrastructure.turnoverit.client import TurnoverITClient
+from app.infrastructure.turnoverit.skills_sync import sync_skills_from_turnoverit
 
 router = APIRouter()
 
@@ -84,29 +84,49 @@ def get_get_user_use_case(db: DbSession) -> GetUserUseCase:
     return GetUserUseCase(user_repository=UserRepository(db))
 
 
-def get_update_user_use_case(db: DbSession) -> UpdateUserUseCase:
+def get_update_user_use_case(db: DbSession, unit_of_work: UnitOfWork) -> UpdateUserUseCase:
     """Factory for UpdateUserUseCase."""
-    return UpdateUserUseCase(user_repository=UserRepository(db))
+    return UpdateUserUseCase(
+        user_repository=UserRepository(db),
+        principal_cache=get_principal_cache(),
+        unit_of_work=unit_of_work,
+    )
 
 
-def get_change_role_use_case(db: DbSession) -> ChangeUserRoleUseCase:
+def get_change_role_use_case(db: DbSession, unit_of_work: UnitOfWork) -> ChangeUserRoleUseCase:
     """Factory for ChangeUserRoleUseCase."""
-    return ChangeUserRoleUseCase(user_repository=UserRepository(db))
+    return ChangeUserRoleUseCase(
+        user_repository=UserRepository(db),
+        principal_cache=get_principal_cache(),
+        unit_of_work=unit_of_work,
+    )
 
 
-def get_activate_user_use_case(db: DbSession) -> ActivateUserUseCase:
+def get_activate_user_use_case(db: DbSession, unit_of_work: UnitOfWork) -> ActivateUserUseCase:
     """Factory for ActivateUserUseCase."""
-    return ActivateUserUseCase(user_repository=UserRepository(db))
+    return ActivateUserUseCase(
+        user_repository=UserRepository(db),
+        principal_cache=get_principal_cache(),
+        unit_of_work=unit_of_work,
+    )
 
 
-def get_deactivate_user_use_case(db: DbSession) -> DeactivateUserUseCase:
+def get_deactivate_user_use_case(db: DbSession, unit_of_work: UnitOfWork) -> DeactivateUserUseCase:
     """Factory for DeactivateUserUseCase."""
-    return DeactivateUserUseCase(user_repository=UserRepository(db))
+    return DeactivateUserUseCase(
+        user_repository=UserRepository(db),
+        principal_cache=get_principal_cache(),
+        unit_of_work=unit_of_work,
+    )
 
 
-def get_delete_user_use_case(db: DbSession) -> DeleteUserUseCase:
+def get_delete_user_use_case(db: DbSession, unit_of_work: UnitOfWork) -> DeleteUserUseCase:
     """Factory for DeleteUserUseCase."""
-    return DeleteUserUseCase(user_repository=UserRepository(db))
+    return DeleteUserUseCase(
+        user_repository=UserRepository(db),
+        principal_cache=get_principal_cache(),
+        unit_of_work=unit_of_work,
+    )
 
 
 def get_boond_status_use_case(
@@ -722,7 +742,6 @@ async def test_cv_generator_beta(
 @router.get("/turnoverit/skills", response_model=TurnoverITSkillsResponse)
 async def get_turnoverit_skills(
     admin_id: AdminUser,
-    db: DbSession,
     search: str = Query(None, description="Search skills by name"),
 ):
     """Get cached Turnover-IT skills (admin only).
@@ -730,41 +749,20 @@ async def get_turnoverit_skills(
     Returns the list of skills cached from Turnover-IT API.
     Skills are synced automatically every 30 days.
     """
-    try:
-        # Get metadata
-        result = await db.execute(
-            select(TurnoverITSkillsMetadataModel).where(TurnoverITSkillsMetadataModel.id == 1)
-        )
-        metadata = result.scalar_one_or_none()
-
-        # Get skills
-        query = select(TurnoverITSkillModel).order_by(TurnoverITSkillModel.name)
-        if search:
-            query = query.where(TurnoverITSkillModel.name.ilike(f"%{search}%"))
-
-        result = await db.execute(query)
-        skills = result.scalars().all()
-
-        return TurnoverITSkillsResponse(
-            skills=[TurnoverITSkillResponse(name=s.name, slug=s.slug) for s in skills],
-            total=len(skills),
-            last_synced_at=metadata.last_synced_at if metadata else None,
-            sync_interval_days=SKILLS_SYNC_INTERVAL.days,
-        )
-    except Exception:
-        # Table might not exist yet
-        return TurnoverITSkillsResponse(
-            skills=[],
-            total=0,
-            last_synced_at=None,
-            sync_interval_days=SKILLS_SYNC_INTERVAL.days,
-        )
+    snapshot = await get_skills_store().get_snapshot()
+    skills = snapshot.search(search)
+
+    return TurnoverITSkillsResponse(
+        skills=[TurnoverITSkillResponse(**skill) for skill in skills],
+        total=len(skills),
+        last_synced_at=snapshot.version,
+        sync_interval_days=SKILLS_SYNC_INTERVAL.days,
+    )
 
 
 @router.post("/turnoverit/skills/sync", response_model=TurnoverITSyncResponse)
 async def sync_turnoverit_skills(
     admin_id: AdminUser,
-    db: DbSession,
     settings: AppSettings,
 ):
     """Force sync Turnover-IT skills from API (admin only).
@@ -775,58 +773,29 @@ async def sync_turnoverit_skills(
     client = TurnoverITClient(settings)
 
     try:
-        # Fetch all skills from API
-        skills = await client.fetch_all_skills()
-
-        if not skills:
-            return TurnoverITSyncResponse(
-                success=False,
-                synced_count=0,
-                message="Aucun skill récupéré depuis Turnover-IT. Vérifiez la clé API.",
-            )
-
-        # Clear existing skills
-        await db.execute(delete(TurnoverITSkillModel))
-
-        # Insert new skills
-        from datetime import datetime
-
-        for skill in skills:
-            skill_model = TurnoverITSkillModel(
-                name=skill["name"],
-                slug=skill["slug"],
-            )
-            db.add(skill_model)
-
-        # Update metadata
-        result = await db.execute(
-            select(TurnoverITSkillsMetadataModel).where(TurnoverITSkillsMetadataModel.id == 1)
-        )
-        metadata = result.scalar_one_or_none()
-
-        if metadata:
-            metadata.last_synced_at = datetime.now(UTC)
-            metadata.total_skills = len(skills)
-        else:
-            metadata = TurnoverITSkillsMetadataModel(
-                id=1,
-                last_synced_at=datetime.now(UTC),
-                total_skills=len(skills),
-            )
-            db.add(metadata)
-
-        await db.commit()
-
+        result = await sync_skills_from_turnoverit(client)
+    except Exception as e:
         return TurnoverITSyncResponse(
-            success=True,
-            synced_count=len(skills),
-            message=f"{len(skills)} skills synchronisés depuis Turnover-IT",
+            success=False,
+            synced_count=0,
+            message=f"Erreur lors de la synchronisation: {str(e)}",
         )
 
-    except Exception as e:
-        await db.rollback()
+    if result is None:
         return TurnoverITSyncResponse(
             success=False,
             synced_count=0,
-            message=f"Erreur lors de la synchronisation: {str(e)}",
+            message="Aucun skill récupéré depuis Turnover-IT. Vérifiez la clé API.",
         )
+
+    return TurnoverITSyncResponse(
+        success=True,
+        synced_count=result.total,
+        added_count=result.added,
+        updated_count=result.updated,
+        removed_count=result.removed,
+        message=(
+            f"{result.total} skills synchronisés depuis Turnover-IT "
+            f"({result.added} ajoutés, {result.updated} modifiés, {result.removed} supprimés)"
+        ),
+    )
@@ -193,13 +193,13 @@ async def list_cooptations(
     page_size: int = Query(20, ge=1, le=100),
     status: str | None = Query(None),
     opportunity_id: str | None = Query(None),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     authorization: str = Header(default=""),
 ):
     """List all cooptations with optional filters."""
     get_user_id_from_auth(authorization)
 
     cooptation_repo = CooptationRepository(db)
-    user_repo = UserRepository(db)
 
     status_filter = CooptationStatus(status) if status else None
     opp_id = UUID(opportunity_id) if opportunity_id else None
@@ -218,19 +218,24 @@ async def list_cooptations(
             if opp:
                 opp_id = opp.id
 
-    use_case = ListCooptationsUseCase(cooptation_repo, user_repo)
-    result = await use_case.execute(
-        page=page,
-        page_size=page_size,
-        status=status_filter,
-        opportunity_id=opp_id,
-    )
+    use_case = ListCooptationsUseCase(cooptation_repo)
+    try:
+        result = await use_case.execute(
+            page=page,
+            page_size=page_size,
+            status=status_filter,
+            opportunity_id=opp_id,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return CooptationListResponse(
         items=[CooptationResponse(**item.model_dump()) for item in result.items],
         total=result.total,
         page=result.page,
         page_size=result.page_size,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -239,26 +244,31 @@ async def list_my_cooptations(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     authorization: str = Header(default=""),
 ):
     """List current user's cooptations."""
     user_id = get_user_id_from_auth(authorization)
 
     cooptation_repo = CooptationRepository(db)
-    user_repo = UserRepository(db)
 
-    use_case = ListCooptationsUseCase(cooptation_repo, user_repo)
-    result = await use_case.execute(
-        page=page,
-        page_size=page_size,
-        submitter_id=user_id,
-    )
+    use_case = ListCooptationsUseCase(cooptation_repo)
+    try:
+        result = await use_case.execute(
+            page=page,
+            page_size=page_size,
+            submitter_id=user_id,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return CooptationListResponse(
         items=[CooptationResponse(**item.model_dump()) for item in result.items],
         total=result.total,
         page=result.page,
         page_size=result.page_size,
+        next_cursor=result.next_cursor,
     )
 
 
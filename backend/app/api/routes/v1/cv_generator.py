@@ -13,17 +13,16 @@ from fastapi import APIRouter, File, Header, HTTPException, Request, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from app.api.dependencies import authenticate
 from app.api.middleware.rate_limiter import limiter
 from app.dependencies import AppSettings, AppSettingsSvc, DbSession
 from app.domain.value_objects import UserRole
 from app.infrastructure.audit import audit_logger
 from app.infrastructure.cv_generator import CvGeneratorParser
-from app.infrastructure.cv_transformer import DocxTextExtractor, PdfTextExtractor
+from app.infrastructure.cv_transformer import get_cv_text_extraction_service
 from app.infrastructure.database.repositories import (
     CvTransformationLogRepository,
-    UserRepository,
 )
-from app.infrastructure.security.jwt import decode_token
 
 logger = logging.getLogger(__name__)
 
@@ -43,27 +42,14 @@ class CvGeneratorParseResponse(BaseModel):
 
 async def _require_access(db: DbSession, authorization: str) -> UUID:
     """Verify user has access (admin, commercial, or rh)."""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Non authentifié")
-
-    token = authorization[7:]
-    payload = decode_token(token, expected_type="access")
-    user_id = UUID(payload.sub)
-
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
-    if not user.is_active:
-        raise HTTPException(status_code=403, detail="Compte désactivé")
-    if user.role not in ALLOWED_ROLES:
+    principal = await authenticate(db, authorization)
+    if principal.role not in ALLOWED_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Accès réservé aux administrateurs, commerciaux et RH",
         )
 
-    return user_id
+    return principal.id
 
 
 @router.post("/parse", response_model=CvGeneratorParseResponse)
@@ -118,12 +104,7 @@ async def parse_cv(
 
     # Extract text
     try:
-        if file_lower.endswith(".pdf"):
-            extractor = PdfTextExtractor()
-            cv_text = extractor.extract(content)
-        else:
-            extractor = DocxTextExtractor()
-            cv_text = extractor.extract(content)
+        cv_text = await get_cv_text_extraction_service().extract_text(content, file.filename)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -284,12 +265,9 @@ async def parse_cv_stream(
             )
 
             try:
-                if file_lower.endswith(".pdf"):
-                    extractor = PdfTextExtractor()
-                    cv_text = extractor.extract(file_content)
-                else:
-                    extractor = DocxTextExtractor()
-                    cv_text = extractor.extract(file_content)
+                cv_text = await get_cv_text_extraction_service().extract_text(
+                    file_content, filename
+                )
             except Exception as e:
                 yield _sse_event("error", {"message": f"Erreur d'extraction du texte: {str(e)}"})
                 return
@@ -7,6 +7,7 @@ from fastapi import APIRouter, File, Form, Header, HTTPException, Request, Uploa
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from app.api.dependencies import authenticate
 from app.api.middleware.rate_limiter import limiter
 from app.application.use_cases.cv_transformer import (
     GetTemplatesUseCase,
@@ -14,22 +15,19 @@ from app.application.use_cases.cv_transformer import (
     TransformCvUseCase,
     UploadTemplateUseCase,
 )
-from app.dependencies import AppSettings, AppSettingsSvc, DbSession
+from app.dependencies import AppSettings, AppSettingsSvc, DbSession, UnitOfWork
 from app.domain.value_objects import UserRole
 from app.infrastructure.audit import audit_logger
 from app.infrastructure.cv_transformer import (
     AnthropicClient,
     DocxGenerator,
-    DocxTextExtractor,
     GeminiClient,
-    PdfTextExtractor,
+    get_cv_text_extraction_service,
 )
 from app.infrastructure.database.repositories import (
     CvTemplateRepository,
     CvTransformationLogRepository,
-    UserRepository,
 )
-from app.infrastructure.security.jwt import decode_token
 
 router = APIRouter()
 
@@ -80,23 +78,8 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails.
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Non authentifié")
-
-    token = authorization[7:]
-    payload = decode_token(token, expected_type="access")
-    user_id = UUID(payload.sub)
-
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
-
-    if not user.is_active:
-        raise HTTPException(status_code=403, detail="Compte désactivé")
-
-    return user_id, user.role
+    principal = await authenticate(db, authorization)
+    return principal.id, principal.role
 
 
 async def require_transformer_access(
@@ -179,6 +162,7 @@ async def list_templates(
 async def transform_cv(
     request: Request,
     db: DbSession,
+    unit_of_work: UnitOfWork,
     app_settings: AppSettings,
     app_settings_svc: AppSettingsSvc,
     file: UploadFile = File(...),
@@ -249,16 +233,14 @@ async def transform_cv(
     template_repo = CvTemplateRepository(db)
     log_repo = CvTransformationLogRepository(db)
     docx_generator = DocxGenerator()
-    pdf_extractor = PdfTextExtractor()
-    docx_extractor = DocxTextExtractor()
 
     use_case = TransformCvUseCase(
         template_repository=template_repo,
         log_repository=log_repo,
         data_extractor=data_extractor,
         document_generator=docx_generator,
-        pdf_text_extractor=pdf_extractor,
-        docx_text_extractor=docx_extractor,
+        text_extractor=get_cv_text_extraction_service(),
+        unit_of_work=unit_of_work,
     )
 
     try:
@@ -3,10 +3,12 @@
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
+from app.api.dependencies import authenticate
 from app.application.read_models.hr import (
+    ApplicationsAnalysisResultReadModel,
     JobApplicationListReadModel,
     JobApplicationReadModel,
     JobPostingListReadModel,
@@ -14,6 +16,7 @@ from app.application.read_models.hr import (
     OpportunityListForHRReadModel,
 )
 from app.application.use_cases.job_applications import (
+    AnalyzePendingApplicationsUseCase,
     CreateCandidateInBoondUseCase,
     GetApplicationCvUrlUseCase,
     GetApplicationUseCase,
@@ -35,7 +38,7 @@ from app.application.use_cases.job_postings import (
     UpdateJobPostingCommand,
     UpdateJobPostingUseCase,
 )
-from app.dependencies import AppSettings, AppSettingsSvc, Boond, DbSession
+from app.dependencies import AppSettings, AppSettingsSvc, Boond, DbSession, UnitOfWork
 from app.domain.entities import ApplicationStatus, JobPostingStatus, Opportunity
 from app.domain.exceptions import (
     InvalidStatusTransitionError,
@@ -46,14 +49,15 @@ from app.domain.exceptions import (
 )
 from app.domain.value_objects import UserRole
 from app.infrastructure.anonymizer.job_posting_anonymizer import JobPostingAnonymizer
+from app.infrastructure.anonymizer.skills_snapshot import get_skills_store
 from app.infrastructure.database.repositories import (
     JobApplicationRepository,
     JobPostingRepository,
     OpportunityRepository,
+    TurnoverITSkillRepository,
     UserRepository,
 )
 from app.infrastructure.matching.gemini_matcher import GeminiMatchingService
-from app.infrastructure.security.jwt import decode_token
 from app.infrastructure.storage.s3_client import S3StorageClient
 from app.infrastructure.turnoverit.client import TurnoverITClient
 
@@ -62,6 +66,24 @@ router = APIRouter()
 # Allowed roles for HR features
 HR_ROLES = {UserRole.ADMIN, UserRole.RH}
 
+# Browser cache lifetime of the full skills list (revalidated with its ETag)
+SKILLS_LIST_MAX_AGE = 300
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header (list of ETags or "*") matches an ETag.
+
+    Uses the weak comparison required for If-None-Match (W/ prefixes ignored).
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
 
 # --- Request/Response Models ---
 
@@ -160,6 +182,9 @@ class SyncSkillsResponse(BaseModel):
     """Response for skills sync operation."""
 
     synced_count: int
+    added_count: int = 0
+    updated_count: int = 0
+    removed_count: int = 0
     message: str
 
 
@@ -231,23 +256,8 @@ async def get_current_user(
     authorization: str,
 ) -> tuple[UUID, UserRole]:
     """Verify user authentication and return user ID and role."""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Non authentifié")
-
-    token = authorization[7:]
-    payload = decode_token(token, expected_type="access")
-    user_id = UUID(payload.sub)
-
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
-
-    if not user.is_active:
-        raise HTTPException(status_code=403, detail="Compte désactivé")
-
-    return user_id, user.role
+    principal = await authenticate(db, authorization)
+    return principal.id, principal.role
 
 
 async def get_current_user_full(
@@ -255,23 +265,8 @@ async def get_current_user_full(
     authorization: str,
 ) -> tuple[UUID, UserRole, str | None]:
     """Verify user authentication and return user ID, role, and boond_resource_id."""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Non authentifié")
-
-    token = authorization[7:]
-    payload = decode_token(token, expected_type="access")
-    user_id = UUID(payload.sub)
-
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
-
-    if not user.is_active:
-        raise HTTPException(status_code=403, detail="Compte désactivé")
-
-    return user_id, user.role, user.boond_resource_id
+    principal = await authenticate(db, authorization)
+    return principal.id, principal.role, principal.boond_resource_id
 
 
 async def require_hr_access(
@@ -371,10 +366,18 @@ async def sync_turnoverit_skills(
     )
 
     try:
-        count = await anonymizer.sync_skills()
+        result = await anonymizer.sync_skills()
+        if result is None:
+            return SyncSkillsResponse(
+                synced_count=0,
+                message="Aucune compétence récupérée depuis Turnover-IT",
+            )
         return SyncSkillsResponse(
-            synced_count=count,
-            message=f"{count} compétences synchronisées depuis Turnover-IT",
+            synced_count=result.total,
+            added_count=result.added,
+            updated_count=result.updated,
+            removed_count=result.removed,
+            message=f"{result.total} compétences synchronisées depuis Turnover-IT",
         )
     except Exception as e:
         raise HTTPException(
@@ -386,51 +389,38 @@ async def sync_turnoverit_skills(
 @router.get("/skills", response_model=TurnoverITSkillsListResponse)
 async def get_turnoverit_skills(
     db: DbSession,
+    response: Response,
     search: str | None = Query(None, max_length=100),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results of a search"),
     authorization: str = Header(default=""),
+    if_none_match: str | None = Header(default=None),
 ):
     """Get Turnover-IT skills from the database cache.
 
-    Returns the list of skills from the local database cache.
     Skills are synced periodically from Turnover-IT API.
 
-    - search: Optional search term to filter skills by name
+    - search: Autocomplete term; returns at most `limit` skills, names starting
+      with the term first, then by trigram similarity
+    - without search: always the complete list (`limit` does not apply) from
+      the skills snapshot, with an ETag (changes on each sync) for
+      conditional requests
     """
     await require_hr_access(db, authorization)
 
-    from sqlalchemy import text
+    if search and search.strip():
+        rows = await TurnoverITSkillRepository(db).search(search, limit)
+        skills = [TurnoverITSkillItem(**row) for row in rows]
+        return TurnoverITSkillsListResponse(skills=skills, total=len(skills))
 
-    # Check if table exists (might not in some environments)
-    check_query = text("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables
-            WHERE table_name = 'turnoverit_skills'
-        )
-    """)
-    result = await db.execute(check_query)
-    table_exists = result.scalar()
-
-    if not table_exists:
-        return TurnoverITSkillsListResponse(skills=[], total=0)
-
-    # Build query with optional search filter
-    if search:
-        query = text("""
-            SELECT name, slug FROM turnoverit_skills
-            WHERE LOWER(name) LIKE LOWER(:search)
-            ORDER BY name ASC
-        """)
-        result = await db.execute(query, {"search": f"%{search}%"})
-    else:
-        query = text("""
-            SELECT name, slug FROM turnoverit_skills
-            ORDER BY name ASC
-        """)
-        result = await db.execute(query)
-
-    rows = result.fetchall()
-    skills = [TurnoverITSkillItem(name=row[0], slug=row[1]) for row in rows]
+    snapshot = await get_skills_store().get_snapshot()
+    version = snapshot.version.timestamp() if snapshot.version else 0
+    etag = f'W/"skills-{version:.0f}-{len(snapshot.skills)}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={SKILLS_LIST_MAX_AGE}"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
 
+    response.headers.update(headers)
+    skills = [TurnoverITSkillItem(**skill) for skill in snapshot.skills]
     return TurnoverITSkillsListResponse(skills=skills, total=len(skills))
 
 
@@ -610,36 +600,36 @@ async def list_job_postings(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: str | None = Query(None),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     authorization: str = Header(default=""),
 ):
     """List all job postings."""
     await require_hr_access(db, authorization)
 
     job_posting_repo = JobPostingRepository(db)
-    opportunity_repo = OpportunityRepository(db)
-    job_application_repo = JobApplicationRepository(db)
-    user_repo = UserRepository(db)
 
     use_case = ListJobPostingsUseCase(
         job_posting_repository=job_posting_repo,
-        opportunity_repository=opportunity_repo,
-        job_application_repository=job_application_repo,
-        user_repository=user_repo,
     )
 
     status_enum = JobPostingStatus(status) if status else None
 
-    return await use_case.execute(
-        page=page,
-        page_size=page_size,
-        status=status_enum,
-    )
+    try:
+        return await use_case.execute(
+            page=page,
+            page_size=page_size,
+            status=status_enum,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/job-postings/{posting_id}", response_model=JobPostingReadModel)
 async def get_job_posting(
     posting_id: str,
     db: DbSession,
+    unit_of_work: UnitOfWork,
     boond_client: Boond,
     authorization: str = Header(default=""),
 ):
@@ -656,6 +646,8 @@ async def get_job_posting(
     if posting:
         opportunity = await opportunity_repo.get_by_id(posting.opportunity_id)
         if opportunity and not opportunity.client_name and opportunity.external_id:
+            # Return the connection to the pool during the Boond call
+            await unit_of_work.release()
             try:
                 boond_detail = await boond_client.get_opportunity_information(
                     opportunity.external_id
@@ -736,6 +728,7 @@ async def update_job_posting(
 async def publish_job_posting(
     posting_id: str,
     db: DbSession,
+    unit_of_work: UnitOfWork,
     boond_client: Boond,
     app_settings: AppSettings,
     authorization: str = Header(default=""),
@@ -754,6 +747,7 @@ async def publish_job_posting(
         user_repository=user_repo,
         turnoverit_client=turnoverit_client,
         boond_client=boond_client,
+        unit_of_work=unit_of_work,
     )
 
     try:
@@ -897,8 +891,11 @@ async def list_applications_for_posting(
         None,
         description="Filter by availability (asap, 1_month, 2_months, 3_months, more_3_months)",
     ),
-    sort_by: str = Query("score", description="Sort field (score, tjm, salary, date)"),
+    sort_by: str = Query("score", description="Sort field (score, prescreen, tjm, salary, date)"),
     sort_order: str = Query("desc", description="Sort direction (asc, desc)"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page (same filters and sort)"
+    ),
     authorization: str = Header(default=""),
 ):
     """List applications for a job posting with filters and sorting."""
@@ -926,9 +923,47 @@ async def list_applications_for_posting(
             availability=availability,
             sort_by=sort_by,
             sort_order=sort_order,
+            cursor=cursor,
         )
     except JobPostingNotFoundError:
         raise HTTPException(status_code=404, detail="Annonce non trouvée")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post(
+    "/job-postings/{posting_id}/applications/analyze",
+    response_model=ApplicationsAnalysisResultReadModel,
+)
+async def analyze_pending_applications(
+    posting_id: str,
+    db: DbSession,
+    unit_of_work: UnitOfWork,
+    app_settings: AppSettings,
+    top_n: int | None = Query(
+        None, ge=1, le=100, description="Best pre-scored applications to analyse"
+    ),
+    authorization: str = Header(default=""),
+):
+    """Run AI matching in batch for the best pre-scored applications not yet analysed."""
+    await require_hr_access(db, authorization)
+
+    use_case = AnalyzePendingApplicationsUseCase(
+        job_posting_repository=JobPostingRepository(db),
+        job_application_repository=JobApplicationRepository(db),
+        matching_service=GeminiMatchingService(app_settings),
+        unit_of_work=unit_of_work,
+    )
+
+    try:
+        return await use_case.execute(
+            posting_id=UUID(posting_id),
+            top_n=top_n or app_settings.MATCHING_LLM_TOP_N,
+        )
+    except JobPostingNotFoundError:
+        raise HTTPException(status_code=404, detail="Annonce non trouvée")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/applications/{application_id}", response_model=JobApplicationReadModel)
@@ -1131,6 +1166,7 @@ async def get_application_cv_url(
 async def create_candidate_in_boond(
     application_id: str,
     db: DbSession,
+    unit_of_work: UnitOfWork,
     app_settings: AppSettings,
     boond_client: Boond,
     authorization: str = Header(default=""),
@@ -1151,6 +1187,7 @@ async def create_candidate_in_boond(
         user_repository=user_repo,
         boond_client=boond_client,
         s3_client=s3_client,
+        unit_of_work=unit_of_work,
     )
 
     try:
@@ -25,6 +25,7 @@ from app.dependencies import AppSettings, DbSession
 from app.infrastructure.database.repositories import InvitationRepository, UserRepository
 from app.infrastructure.email.sender import EmailService
 from app.infrastructure.security.jwt import decode_token
+from app.infrastructure.security.principal import resolve_principal
 
 router = APIRouter()
 
@@ -94,8 +95,7 @@ async def require_admin(db: DbSession, authorization: str) -> UUID:
     payload = decode_token(token, expected_type="access")
     user_id = UUID(payload.sub)
 
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+    user = await resolve_principal(db, user_id)
 
     if not user or not user.is_admin:
         raise HTTPException(status_code=403, detail="Accès administrateur requis")
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Header, HTTPException, Query
 
+from app.api.dependencies import authenticate
 from app.api.schemas.opportunity import OpportunityListResponse, OpportunityResponse
 from app.application.use_cases.opportunities import (
     ListOpportunitiesUseCase,
@@ -12,8 +13,8 @@ from app.application.use_cases.opportunities import (
 from app.dependencies import AppSettings, Boond, DbSession, RedisClient
 from app.domain.value_objects import UserRole
 from app.infrastructure.cache.redis import CacheService
-from app.infrastructure.database.repositories import OpportunityRepository, UserRepository
-from app.infrastructure.security.jwt import decode_token
+from app.infrastructure.database.repositories import OpportunityRepository
+from app.infrastructure.security.principal import Principal
 
 router = APIRouter()
 
@@ -44,22 +45,9 @@ def _opportunity_to_response(opportunity) -> OpportunityResponse:
     )
 
 
-async def get_current_user(db: DbSession, authorization: str):
+async def get_current_user(db: DbSession, authorization: str) -> Principal:
     """Get current user from authorization header."""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Non authentifié")
-
-    token = authorization[7:]
-    payload = decode_token(token, expected_type="access")
-    user_id = UUID(payload.sub)
-
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Utilisateur non trouvé")
-
-    return user
+    return await authenticate(db, authorization, require_active=False)
 
 
 @router.get("", response_model=OpportunityListResponse)
@@ -231,6 +231,8 @@ async def submit_application(
         job_application_repository=job_application_repo,
         s3_client=s3_client,
         matching_service=matching_service,
+        llm_mode=app_settings.MATCHING_LLM_MODE,
+        llm_top_n=app_settings.MATCHING_LLM_TOP_N,
     )
 
     try:
@@ -12,7 +12,8 @@ from app.api.schemas.user import (
 from app.dependencies import DbSession
 from app.infrastructure.database.repositories import UserRepository
 from app.infrastructure.security.jwt import decode_token
-from app.infrastructure.security.password import hash_password, verify_password
+from app.infrastructure.security.password import hash_password_async, verify_password_async
+from app.infrastructure.security.principal import get_principal_cache
 
 router = APIRouter()
 
@@ -97,6 +98,9 @@ async def update_me(
         user.boond_resource_id = request.boond_resource_id
 
     saved_user = await user_repo.save(user)
+    # boond_resource_id is part of the cached principal: drop it once committed
+    await db.commit()
+    await get_principal_cache().invalidate(user_id)
 
     return UserResponse(
         id=str(saved_user.id),
@@ -131,11 +135,11 @@ async def change_password(
         raise HTTPException(status_code=404, detail="User not found")
 
     # Verify current password
-    if not verify_password(request.current_password, user.password_hash):
+    if not await verify_password_async(request.current_password, user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
 
     # Update password
-    user.password_hash = hash_password(request.new_password)
+    user.password_hash = await hash_password_async(request.new_password)
     await user_repo.save(user)
 
     return {"message": "Password changed successfully."}
@@ -267,4 +267,7 @@ class TurnoverITSyncResponse(BaseModel):
 
     success: bool
     synced_count: int
+    added_count: int = 0
+    updated_count: int = 0
+    removed_count: int = 0
     message: str
@@ -74,6 +74,7 @@ class CooptationListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class UpdateCooptationStatusRequest(BaseModel):
@@ -9,6 +9,7 @@ from app.application.read_models.hr import (
     ApplicationSubmissionResultReadModel,
     JobApplicationListReadModel,
     JobApplicationReadModel,
+    JobApplicationSummaryReadModel,
     JobPostingListReadModel,
     JobPostingPublicReadModel,
     JobPostingReadModel,
@@ -30,6 +31,7 @@ __all__ = [
     "CooptationListReadModel",
     "JobApplicationListReadModel",
     "JobApplicationReadModel",
+    "JobApplicationSummaryReadModel",
     "JobPostingListReadModel",
     "JobPostingPublicReadModel",
     "JobPostingReadModel",
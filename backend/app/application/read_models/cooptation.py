@@ -53,6 +53,7 @@ class CooptationListReadModel(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None  # Keyset cursor of the next page
 
 
 class CooptationStatsReadModel(BaseModel):
@@ -229,6 +229,7 @@ class JobPostingListReadModel(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None  # Keyset cursor of the next page
 
 
 class JobPostingPublicReadModel(BaseModel):
@@ -266,8 +267,8 @@ class StatusChangeReadModel(BaseModel):
     comment: str | None = None
 
 
-class JobApplicationReadModel(BaseModel):
-    """Job application read model."""
+class JobApplicationSummaryReadModel(BaseModel):
+    """Job application read model of the HR list (without status history)."""
 
     model_config = ConfigDict(frozen=True)
 
@@ -302,6 +303,8 @@ class JobApplicationReadModel(BaseModel):
     cv_download_url: str | None = None
     matching_score: int | None = None
     matching_details: MatchingDetailsReadModel | None = None
+    # Local provisional score (computed without LLM)
+    prescreen_score: int | None = None
     # CV Quality evaluation (/20)
     cv_quality_score: float | None = None
     cv_quality: CvQualityReadModel | None = None
@@ -309,7 +312,6 @@ class JobApplicationReadModel(BaseModel):
     is_read: bool = False
     status: str
     status_display: str
-    status_history: list[StatusChangeReadModel] = []
     notes: str | None = None
     boond_candidate_id: str | None = None
     boond_sync_error: str | None = None
@@ -320,16 +322,23 @@ class JobApplicationReadModel(BaseModel):
     updated_at: datetime
 
 
+class JobApplicationReadModel(JobApplicationSummaryReadModel):
+    """Job application read model."""
+
+    status_history: list[StatusChangeReadModel] = []
+
+
 class JobApplicationListReadModel(BaseModel):
     """Paginated job application list."""
 
     model_config = ConfigDict(frozen=True)
 
-    items: list[JobApplicationReadModel]
+    items: list[JobApplicationSummaryReadModel]
     total: int
     page: int
     page_size: int
     stats: dict[str, int] = {}
+    next_cursor: str | None = None  # Keyset cursor of the next page
 
 
 class ApplicationSubmissionResultReadModel(BaseModel):
@@ -340,3 +349,12 @@ class ApplicationSubmissionResultReadModel(BaseModel):
     success: bool
     application_id: str
     message: str
+
+
+class ApplicationsAnalysisResultReadModel(BaseModel):
+    """Result of a batch AI analysis of applications."""
+
+    model_config = ConfigDict(frozen=True)
+
+    analyzed_count: int
+    failed_count: int
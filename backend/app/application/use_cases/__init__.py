@@ -37,6 +37,7 @@ from app.application.use_cases.cv_transformer import (
     UploadTemplateUseCase,
 )
 from app.application.use_cases.job_applications import (
+    AnalyzePendingApplicationsUseCase,
     CreateCandidateInBoondUseCase,
     GetApplicationCvUrlUseCase,
     GetApplicationUseCase,
@@ -89,6 +90,7 @@ __all__ = [
     "PublishJobPostingUseCase",
     "UpdateJobPostingUseCase",
     # HR - Job Applications
+    "AnalyzePendingApplicationsUseCase",
     "CreateCandidateInBoondUseCase",
     "GetApplicationCvUrlUseCase",
     "GetApplicationUseCase",
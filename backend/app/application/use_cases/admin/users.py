@@ -5,7 +5,8 @@ from datetime import datetime
 from uuid import UUID
 
 from app.domain.entities import User
-from app.domain.ports import UserRepositoryPort
+from app.domain.ports import PrincipalCachePort, UserRepositoryPort
+from app.domain.unit_of_work import UnitOfWorkPort
 from app.domain.value_objects import UserRole
 
 
@@ -89,6 +90,23 @@ class UpdateUserCommand:
 VALID_ROLES = {"user", "commercial", "rh", "admin"}
 
 
+async def _invalidate_principal(
+    unit_of_work: UnitOfWorkPort | None,
+    principal_cache: PrincipalCachePort | None,
+    user_id: UUID,
+) -> None:
+    """Commit the change, then drop the user's cached principal.
+
+    Invalidating before the commit would let a concurrent request reload the
+    old row into the cache until its TTL.
+    """
+    if principal_cache is None:
+        return
+    if unit_of_work is not None:
+        await unit_of_work.commit()
+    await principal_cache.invalidate(user_id)
+
+
 class ListUsersUseCase:
     """Use case for listing all users."""
 
@@ -142,8 +160,15 @@ class GetUserUseCase:
 class UpdateUserUseCase:
     """Use case for updating a user."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        principal_cache: PrincipalCachePort | None = None,
+        unit_of_work: UnitOfWorkPort | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def execute(
         self,
@@ -204,14 +229,22 @@ class UpdateUserUseCase:
             user.manager_boond_id = command.manager_boond_id or None
 
         updated_user = await self._user_repository.save(user)
+        await _invalidate_principal(self._unit_of_work, self._principal_cache, user_id)
         return UserReadModel.from_entity(updated_user)
 
 
 class ChangeUserRoleUseCase:
     """Use case for changing a user's role."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        principal_cache: PrincipalCachePort | None = None,
+        unit_of_work: UnitOfWorkPort | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def execute(
         self,
@@ -246,14 +279,22 @@ class ChangeUserRoleUseCase:
 
         user.change_role(UserRole(new_role))
         updated_user = await self._user_repository.save(user)
+        await _invalidate_principal(self._unit_of_work, self._principal_cache, user_id)
         return UserReadModel.from_entity(updated_user)
 
 
 class ActivateUserUseCase:
     """Use case for activating a user account."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        principal_cache: PrincipalCachePort | None = None,
+        unit_of_work: UnitOfWorkPort | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def execute(self, user_id: UUID) -> UserReadModel:
         """Activate user account.
@@ -273,14 +314,22 @@ class ActivateUserUseCase:
 
         user.activate()
         updated_user = await self._user_repository.save(user)
+        await _invalidate_principal(self._unit_of_work, self._principal_cache, user_id)
         return UserReadModel.from_entity(updated_user)
 
 
 class DeactivateUserUseCase:
     """Use case for deactivating a user account."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        principal_cache: PrincipalCachePort | None = None,
+        unit_of_work: UnitOfWorkPort | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def execute(self, user_id: UUID, admin_id: UUID) -> UserReadModel:
         """Deactivate user account.
@@ -305,14 +354,22 @@ class DeactivateUserUseCase:
 
         user.deactivate()
         updated_user = await self._user_repository.save(user)
+        await _invalidate_principal(self._unit_of_work, self._principal_cache, user_id)
         return UserReadModel.from_entity(updated_user)
 
 
 class DeleteUserUseCase:
     """Use case for permanently deleting a user."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        principal_cache: PrincipalCachePort | None = None,
+        unit_of_work: UnitOfWorkPort | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def execute(self, user_id: UUID, admin_id: UUID) -> bool:
         """Delete user permanently.
@@ -339,4 +396,5 @@ class DeleteUserUseCase:
         if not deleted:
             raise RuntimeError("Failed to delete user")
 
+        await _invalidate_principal(self._unit_of_work, self._principal_cache, user_id)
         return True
@@ -22,7 +22,11 @@ from app.infrastructure.security.jwt import (
     create_verification_token,
     decode_token,
 )
-from app.infrastructure.security.password import hash_password, verify_password
+from app.infrastructure.security.password import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
 
 
 @dataclass
@@ -75,7 +79,7 @@ class RegisterUserUseCase:
         verification_token = create_verification_token()
         user = User(
             email=Email(command.email),
-            password_hash=hash_password(command.password),
+            password_hash=await hash_password_async(command.password),
             first_name=command.first_name,
             last_name=command.last_name,
             role=UserRole.USER,
@@ -127,7 +131,7 @@ class LoginUseCase:
             raise InvalidCredentialsError()
 
         # Verify password
-        if not verify_password(command.password, user.password_hash):
+        if not await verify_password_async(command.password, user.password_hash):
             raise InvalidCredentialsError()
 
         # Check if verified
@@ -138,6 +142,11 @@ class LoginUseCase:
         if not user.is_active:
             raise InvalidCredentialsError()
 
+        # Upgrade the hash to the current bcrypt cost while the password is known
+        if needs_rehash(user.password_hash):
+            user.password_hash = await hash_password_async(command.password)
+            await self.user_repository.save(user)
+
         # Generate tokens
         tokens = AuthTokens(
             access_token=create_access_token(user.id),
@@ -240,7 +249,7 @@ class ResetPasswordUseCase:
         if not user.is_reset_token_valid():
             raise InvalidTokenError("Reset token has expired")
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.clear_reset_token()
 
         await self.user_repository.save(user)
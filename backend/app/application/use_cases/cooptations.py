@@ -19,6 +19,7 @@ from app.domain.value_objects import CooptationStatus, Email, Phone
 from app.infrastructure.boond.client import BoondClient
 from app.infrastructure.database.repositories import (
     CandidateRepository,
+    CooptationListRow,
     CooptationRepository,
     OpportunityRepository,
     PublishedOpportunityRepository,
@@ -212,15 +213,14 @@ class CreateCooptationUseCase:
 
 
 class ListCooptationsUseCase:
-    """Use case for listing cooptations."""
+    """Use case for listing cooptations.
 
-    def __init__(
-        self,
-        cooptation_repository: CooptationRepository,
-        user_repository: UserRepository,
-    ) -> None:
+    Reads flat rows (candidate, opportunity and submitter joined in one query)
+    instead of hydrating entities and looking submitters up one by one.
+    """
+
+    def __init__(self, cooptation_repository: CooptationRepository) -> None:
         self.cooptation_repository = cooptation_repository
-        self.user_repository = user_repository
 
     async def execute(
         self,
@@ -229,91 +229,54 @@ class ListCooptationsUseCase:
         submitter_id: UUID | None = None,
         status: CooptationStatus | None = None,
         opportunity_id: UUID | None = None,
+        cursor: str | None = None,
     ) -> CooptationListReadModel:
-        """List cooptations with pagination and filters."""
+        """List cooptations with pagination and filters.
+
+        cursor is the next_cursor of the previous page; when given, page is
+        ignored and the list continues after that cooptation.
+        """
         skip = (page - 1) * page_size
 
-        if opportunity_id:
-            cooptations = await self.cooptation_repository.list_by_opportunity(
-                opportunity_id=opportunity_id,
-                skip=skip,
-                limit=page_size,
-            )
-            total = await self.cooptation_repository.count_by_opportunity(opportunity_id)
-        elif submitter_id:
-            cooptations = await self.cooptation_repository.list_by_submitter(
-                submitter_id=submitter_id,
-                skip=skip,
-                limit=page_size,
-            )
-            total = await self.cooptation_repository.count_by_submitter(submitter_id)
-        else:
-            cooptations = await self.cooptation_repository.list_all(
-                skip=skip,
-                limit=page_size,
-                status=status,
-            )
-            if status:
-                total = await self.cooptation_repository.count_by_status(status)
-            else:
-                # Count all - sum of all statuses
-                stats = await self.cooptation_repository.get_stats_by_submitter(
-                    submitter_id or UUID(int=0)
-                )
-                total = stats.get("total", 0)
-
-        # Get submitter names
-        items = []
-        for cooptation in cooptations:
-            item = self._to_read_model(cooptation)
-            submitter = await self.user_repository.get_by_id(cooptation.submitter_id)
-            if submitter:
-                item = CooptationReadModel(
-                    **{**item.model_dump(), "submitter_name": submitter.full_name}
-                )
-            items.append(item)
+        rows = await self.cooptation_repository.list_page(
+            skip=skip,
+            limit=page_size,
+            submitter_id=submitter_id,
+            status=status,
+            opportunity_id=opportunity_id,
+            cursor=cursor,
+        )
 
         return CooptationListReadModel(
-            items=items,
-            total=total,
+            items=[self._to_read_model(row) for row in rows.items],
+            total=rows.total,
             page=page,
             page_size=page_size,
+            next_cursor=rows.next_cursor,
         )
 
-    def _to_read_model(self, cooptation: Cooptation) -> CooptationReadModel:
-        status_history = [
-            StatusChangeReadModel(
-                from_status=str(sh.from_status),
-                to_status=str(sh.to_status),
-                changed_at=sh.changed_at,
-                changed_by=str(sh.changed_by) if sh.changed_by else None,
-                comment=sh.comment,
-            )
-            for sh in cooptation.status_history
-        ]
-
+    def _to_read_model(self, row: CooptationListRow) -> CooptationReadModel:
         return CooptationReadModel(
-            id=str(cooptation.id),
-            candidate_id=str(cooptation.candidate.id),
-            candidate_name=cooptation.candidate.full_name,
-            candidate_email=str(cooptation.candidate.email),
-            candidate_phone=(
-                str(cooptation.candidate.phone) if cooptation.candidate.phone else None
-            ),
-            candidate_daily_rate=cooptation.candidate.daily_rate,
-            candidate_cv_filename=cooptation.candidate.cv_filename,
-            candidate_note=cooptation.candidate.note,
-            opportunity_id=str(cooptation.opportunity.id),
-            opportunity_title=cooptation.opportunity.title,
-            opportunity_reference=cooptation.opportunity.reference,
-            status=str(cooptation.status),
-            status_display=cooptation.status.display_name,
-            submitter_id=str(cooptation.submitter_id),
-            external_positioning_id=cooptation.external_positioning_id,
-            rejection_reason=cooptation.rejection_reason,
-            status_history=status_history,
-            submitted_at=cooptation.submitted_at,
-            updated_at=cooptation.updated_at,
+            id=str(row.id),
+            candidate_id=str(row.candidate_id),
+            candidate_name=row.candidate_name,
+            candidate_email=row.candidate_email,
+            candidate_phone=row.candidate_phone,
+            candidate_daily_rate=row.candidate_daily_rate,
+            candidate_cv_filename=row.candidate_cv_filename,
+            candidate_note=row.candidate_note,
+            opportunity_id=str(row.opportunity_id),
+            opportunity_title=row.opportunity_title,
+            opportunity_reference=row.opportunity_reference,
+            status=row.status,
+            status_display=CooptationStatus(row.status).display_name,
+            submitter_id=str(row.submitter_id),
+            submitter_name=row.submitter_name,
+            external_positioning_id=row.external_positioning_id,
+            rejection_reason=row.rejection_reason,
+            status_history=[StatusChangeReadModel(**sh) for sh in row.status_history],
+            submitted_at=row.submitted_at,
+            updated_at=row.updated_at,
         )
 
 
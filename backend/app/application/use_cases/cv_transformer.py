@@ -7,9 +7,10 @@ from app.domain.ports import (
     CvDataExtractorPort,
     CvDocumentGeneratorPort,
     CvTemplateRepositoryPort,
-    CvTextExtractorPort,
+    CvTextExtractionServicePort,
     CvTransformationLogRepositoryPort,
 )
+from app.domain.unit_of_work import UnitOfWorkPort
 
 
 class TransformCvUseCase:
@@ -25,15 +26,15 @@ class TransformCvUseCase:
         log_repository: CvTransformationLogRepositoryPort,
         data_extractor: CvDataExtractorPort,
         document_generator: CvDocumentGeneratorPort,
-        pdf_text_extractor: CvTextExtractorPort,
-        docx_text_extractor: CvTextExtractorPort,
+        text_extractor: CvTextExtractionServicePort,
+        unit_of_work: UnitOfWorkPort,
     ) -> None:
         self._template_repository = template_repository
         self._log_repository = log_repository
         self._data_extractor = data_extractor
         self._document_generator = document_generator
-        self._pdf_extractor = pdf_text_extractor
-        self._docx_extractor = docx_text_extractor
+        self._text_extractor = text_extractor
+        self._unit_of_work = unit_of_work
 
     async def execute(
         self,
@@ -69,8 +70,11 @@ class TransformCvUseCase:
             if not template.is_active:
                 raise ValueError(f"Template '{template_name}' n'est pas actif")
 
+            # No connection held during the extraction and the AI call
+            await self._unit_of_work.release()
+
             # Extract text based on file type (Single Responsibility - delegate to extractors)
-            cv_text = self._extract_text(file_content, filename)
+            cv_text = await self._extract_text(file_content, filename)
 
             # Extract structured data using AI
             cv_data = await self._data_extractor.extract_cv_data(cv_text, gemini_model)
@@ -102,9 +106,11 @@ class TransformCvUseCase:
                 template_id=template.id if template else None,
             )
             await self._log_repository.save(log)
+            # Committed now: the request session is rolled back on the error response
+            await self._unit_of_work.release()
             raise
 
-    def _extract_text(self, file_content: bytes, filename: str) -> str:
+    async def _extract_text(self, file_content: bytes, filename: str) -> str:
         """Extract text from file based on extension.
 
         Args:
@@ -118,10 +124,8 @@ class TransformCvUseCase:
             ValueError: If file type is not supported.
         """
         file_lower = filename.lower()
-        if file_lower.endswith(".pdf"):
-            return self._pdf_extractor.extract(file_content)
-        elif file_lower.endswith(".docx"):
-            return self._docx_extractor.extract(file_content)
+        if file_lower.endswith((".pdf", ".docx")):
+            return await self._text_extractor.extract_text(file_content, filename)
         elif file_lower.endswith(".doc"):
             raise ValueError(
                 "Les fichiers .doc ne sont pas supportés. Veuillez convertir en .docx ou .pdf"
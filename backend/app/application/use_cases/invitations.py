@@ -161,7 +161,7 @@ class AcceptInvitationUseCase:
 
     async def execute(self, command: AcceptInvitationCommand) -> User:
         """Accept invitation and create user account."""
-        from app.infrastructure.security.password import hash_password
+        from app.infrastructure.security.password import hash_password_async
 
         # Get and validate invitation
         invitation = await self.invitation_repository.get_by_token(command.token)
@@ -186,7 +186,7 @@ class AcceptInvitationUseCase:
             email=invitation.email,
             first_name=command.first_name,
             last_name=command.last_name,
-            password_hash=hash_password(command.password),
+            password_hash=await hash_password_async(command.password),
             role=invitation.role,
             is_verified=True,  # Auto-verify since they came via invitation
             is_active=True,
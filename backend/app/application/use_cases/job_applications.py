@@ -6,6 +6,7 @@ from uuid import UUID
 
 from app.application.read_models.hr import (
     AccountQualityScoreReadModel,
+    ApplicationsAnalysisResultReadModel,
     ApplicationSubmissionResultReadModel,
     BonusMalusReadModel,
     ContinuityScoreReadModel,
@@ -14,31 +15,41 @@ from app.application.read_models.hr import (
     EducationScoreReadModel,
     JobApplicationListReadModel,
     JobApplicationReadModel,
+    JobApplicationSummaryReadModel,
     MatchingDetailsReadModel,
     MatchingRecommendationReadModel,
     ScoresDetailsReadModel,
     StabilityScoreReadModel,
     StatusChangeReadModel,
 )
-from app.domain.entities import ApplicationStatus, JobApplication, JobPostingStatus
+from app.domain.entities import ApplicationStatus, JobApplication, JobPosting, JobPostingStatus
 from app.domain.exceptions import (
     InvalidStatusTransitionError,
     JobApplicationNotFoundError,
     JobPostingNotFoundError,
 )
+from app.domain.unit_of_work import UnitOfWorkPort
 from app.infrastructure.boond.client import BoondClient
 from app.infrastructure.boond.mappers import (
     BoondAdministrativeData,
     BoondCandidateContext,
     format_analyses_as_boond_html,
 )
+from app.infrastructure.cv_transformer.extraction_service import (
+    CvTextExtractionService,
+    get_cv_text_extraction_service,
+)
 from app.infrastructure.database.repositories import (
     JobApplicationRepository,
     JobPostingRepository,
     OpportunityRepository,
     UserRepository,
 )
-from app.infrastructure.matching.gemini_matcher import GeminiMatchingService
+from app.infrastructure.matching.gemini_matcher import (
+    BatchMatchingCandidate,
+    GeminiMatchingService,
+)
+from app.infrastructure.matching.local_scorer import LocalMatchingScorer
 from app.infrastructure.storage.s3_client import S3StorageClient
 
 
@@ -68,17 +79,29 @@ class SubmitApplicationCommand:
 class SubmitApplicationUseCase:
     """Submit a job application through the public form."""
 
+    # The stored CV text only feeds AI analyses, which read at most 12k chars:
+    # pages of oversized uploads (portfolios) past this budget are not parsed
+    CV_TEXT_MAX_CHARS = 20000
+
     def __init__(
         self,
         job_posting_repository: JobPostingRepository,
         job_application_repository: JobApplicationRepository,
         s3_client: S3StorageClient,
         matching_service: GeminiMatchingService,
+        text_extractor: CvTextExtractionService | None = None,
+        local_scorer: LocalMatchingScorer | None = None,
+        llm_mode: str = "always",  # always, top_n, on_demand
+        llm_top_n: int = 20,
     ) -> None:
         self.job_posting_repository = job_posting_repository
         self.job_application_repository = job_application_repository
         self.s3_client = s3_client
         self.matching_service = matching_service
+        self.text_extractor = text_extractor or get_cv_text_extraction_service()
+        self.local_scorer = local_scorer or LocalMatchingScorer()
+        self.llm_mode = llm_mode
+        self.llm_top_n = llm_top_n
 
     async def execute(
         self, command: SubmitApplicationCommand
@@ -130,20 +153,26 @@ class SubmitApplicationUseCase:
         # Extract text from CV for matching
         cv_text = None
         try:
-            from app.infrastructure.cv_transformer.extractors import extract_text_from_bytes
-
-            cv_text = extract_text_from_bytes(command.cv_content, command.cv_filename)
+            cv_text = await self.text_extractor.extract_text(
+                command.cv_content, command.cv_filename, max_chars=self.CV_TEXT_MAX_CHARS
+            )
         except Exception:
             # Continue without text extraction
             pass
 
+        # Local pre-score (instant, no LLM) used for ordering and LLM gating;
+        # 0 without CV text, so every application can be sorted by it
+        prescreen_score = self.local_scorer.score(
+            cv_text, posting.skills, posting.qualifications
+        ).score
+
         # Calculate matching score and CV quality evaluation in parallel
         matching_score = None
         matching_details = None
         cv_quality_score = None
         cv_quality = None
 
-        if cv_text:
+        if cv_text and await self._should_run_llm_scoring(posting.id, prescreen_score):
             try:
                 import asyncio
 
@@ -201,29 +230,7 @@ Qualifications requises:
                         "score_global", matching_result.get("score", 0)
                     )
                     # Store full enhanced matching details
-                    matching_details = {
-                        "score": matching_score,
-                        "score_global": matching_result.get("score_global", matching_score),
-                        "scores_details": matching_result.get("scores_details", {}),
-                        "competences_matchees": matching_result.get("competences_matchees", []),
-                        "competences_manquantes": matching_result.get("competences_manquantes", []),
-                        "points_forts": matching_result.get("points_forts", []),
-                        "points_vigilance": matching_result.get("points_vigilance", []),
-                        "synthese": matching_result.get(
-                            "synthese", matching_result.get("summary", "")
-                        ),
-                        "recommandation": matching_result.get("recommandation", {}),
-                        # Legacy fields for backward compatibility
-                        "strengths": matching_result.get(
-                            "strengths", matching_result.get("points_forts", [])
-                        ),
-                        "gaps": matching_result.get(
-                            "gaps", matching_result.get("competences_manquantes", [])
-                        ),
-                        "summary": matching_result.get(
-                            "summary", matching_result.get("synthese", "")
-                        ),
-                    }
+                    matching_details = _build_matching_details(matching_result)
 
                 # Process CV quality result
                 quality_result = results[1]
@@ -256,6 +263,7 @@ Qualifications requises:
             cv_text=cv_text,
             matching_score=matching_score,
             matching_details=matching_details,
+            prescreen_score=prescreen_score,
             cv_quality_score=cv_quality_score,
             cv_quality=cv_quality,
         )
@@ -268,6 +276,22 @@ Qualifications requises:
             message="Votre candidature a été soumise avec succès. Nous reviendrons vers vous rapidement.",
         )
 
+    async def _should_run_llm_scoring(self, posting_id: UUID, prescreen_score: int | None) -> bool:
+        """Decide whether Gemini analyses run at submission time.
+
+        - always: every application is analysed
+        - top_n: only if the pre-score ranks within the top N of the posting
+        - on_demand: never, HR triggers analyses with the reanalyze action
+        """
+        if self.llm_mode == "on_demand":
+            return False
+        if self.llm_mode == "top_n" and prescreen_score is not None:
+            better_count = await self.job_application_repository.count_prescreened_above(
+                posting_id, prescreen_score
+            )
+            return better_count < self.llm_top_n
+        return True
+
 
 class ListApplicationsForPostingUseCase:
     """List applications for a specific job posting."""
@@ -292,6 +316,7 @@ class ListApplicationsForPostingUseCase:
         availability: str | None = None,
         sort_by: str = "score",
         sort_order: str = "desc",
+        cursor: str | None = None,
     ) -> JobApplicationListReadModel:
         """List applications for a job posting.
 
@@ -302,8 +327,10 @@ class ListApplicationsForPostingUseCase:
             status: Filter by application status
             employment_status: Filter by employment status (freelance, employee, both)
             availability: Filter by availability (asap, 1_month, 2_months, 3_months, more_3_months)
-            sort_by: Sort field (score, tjm, salary, date)
+            sort_by: Sort field (score, prescreen, tjm, salary, date)
             sort_order: Sort direction (asc, desc)
+            cursor: next_cursor of the previous page (same filters and sort);
+                when given, page is ignored
         """
         # Verify posting exists
         posting = await self.job_posting_repository.get_by_id(posting_id)
@@ -312,7 +339,7 @@ class ListApplicationsForPostingUseCase:
 
         skip = (page - 1) * page_size
 
-        applications = await self.job_application_repository.list_by_posting(
+        applications = await self.job_application_repository.list_page_by_posting(
             posting_id=posting_id,
             skip=skip,
             limit=page_size,
@@ -321,17 +348,11 @@ class ListApplicationsForPostingUseCase:
             availability=availability,
             sort_by=sort_by,
             sort_order=sort_order,
+            cursor=cursor,
         )
-        total = await self.job_application_repository.count_by_posting(
-            posting_id=posting_id,
-            status=status,
-            employment_status=employment_status,
-            availability=availability,
-        )
-        stats = await self.job_application_repository.get_stats_by_posting(posting_id)
 
         items = []
-        for app in applications:
+        for app in applications.items:
             # Generate presigned URL for CV download
             cv_download_url = None
             try:
@@ -346,10 +367,11 @@ class ListApplicationsForPostingUseCase:
 
         return JobApplicationListReadModel(
             items=items,
-            total=total,
+            total=applications.total,
             page=page,
             page_size=page_size,
-            stats=stats,
+            stats=applications.stats,
+            next_cursor=applications.next_cursor,
         )
 
     def _to_read_model(
@@ -357,22 +379,11 @@ class ListApplicationsForPostingUseCase:
         application: JobApplication,
         posting_title: str | None = None,
         cv_download_url: str | None = None,
-    ) -> JobApplicationReadModel:
-        status_history = [
-            StatusChangeReadModel(
-                from_status=str(sh["from_status"]),
-                to_status=str(sh["to_status"]),
-                changed_at=sh["changed_at"],
-                changed_by=str(sh["changed_by"]) if sh.get("changed_by") else None,
-                comment=sh.get("comment"),
-            )
-            for sh in application.status_history
-        ]
-
+    ) -> JobApplicationSummaryReadModel:
         matching_details_model = _build_matching_details_model(application.matching_details)
         cv_quality_model = _build_cv_quality_model(application.cv_quality)
 
-        return JobApplicationReadModel(
+        return JobApplicationSummaryReadModel(
             id=str(application.id),
             job_posting_id=str(application.job_posting_id),
             job_posting_title=posting_title,
@@ -405,12 +416,12 @@ class ListApplicationsForPostingUseCase:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
             status=str(application.status),
             status_display=application.status.display_name,
-            status_history=status_history,
             notes=application.notes,
             boond_candidate_id=application.boond_candidate_id,
             boond_sync_error=application.boond_sync_error,
@@ -421,6 +432,29 @@ class ListApplicationsForPostingUseCase:
         )
 
 
+def _build_matching_details(matching_result: dict) -> dict:
+    """Build the stored matching details dict from a Gemini matching result.
+
+    Keeps both enhanced fields and legacy fields for backward compatibility.
+    """
+    matching_score = matching_result.get("score_global", matching_result.get("score", 0))
+    return {
+        "score": matching_score,
+        "score_global": matching_result.get("score_global", matching_score),
+        "scores_details": matching_result.get("scores_details", {}),
+        "competences_matchees": matching_result.get("competences_matchees", []),
+        "competences_manquantes": matching_result.get("competences_manquantes", []),
+        "points_forts": matching_result.get("points_forts", []),
+        "points_vigilance": matching_result.get("points_vigilance", []),
+        "synthese": matching_result.get("synthese", matching_result.get("summary", "")),
+        "recommandation": matching_result.get("recommandation", {}),
+        # Legacy fields for backward compatibility
+        "strengths": matching_result.get("strengths", matching_result.get("points_forts", [])),
+        "gaps": matching_result.get("gaps", matching_result.get("competences_manquantes", [])),
+        "summary": matching_result.get("summary", matching_result.get("synthese", "")),
+    }
+
+
 def _build_matching_details_model(
     matching_details: dict | None,
 ) -> MatchingDetailsReadModel | None:
@@ -673,6 +707,7 @@ class GetApplicationUseCase:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
@@ -1006,6 +1041,7 @@ class UpdateApplicationStatusUseCase:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
@@ -1120,6 +1156,7 @@ class UpdateApplicationNoteUseCase:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
@@ -1137,7 +1174,12 @@ class UpdateApplicationNoteUseCase:
 
 
 class CreateCandidateInBoondUseCase:
-    """Create candidate in BoondManager from application."""
+    """Create candidate in BoondManager from application.
+
+    Everything is read before the Boond and S3 calls, and the connection is
+    returned to the pool while they run. The Boond candidate id (or the sync
+    error) is committed as soon as it is known.
+    """
 
     def __init__(
         self,
@@ -1147,6 +1189,7 @@ class CreateCandidateInBoondUseCase:
         user_repository: UserRepository,
         boond_client: BoondClient,
         s3_client: S3StorageClient,
+        unit_of_work: UnitOfWorkPort,
     ) -> None:
         self.job_application_repository = job_application_repository
         self.job_posting_repository = job_posting_repository
@@ -1154,6 +1197,7 @@ class CreateCandidateInBoondUseCase:
         self.user_repository = user_repository
         self.boond_client = boond_client
         self.s3_client = s3_client
+        self.unit_of_work = unit_of_work
 
     async def execute(
         self, application_id: UUID, created_by: UUID | None = None
@@ -1181,7 +1225,10 @@ class CreateCandidateInBoondUseCase:
         )
 
         # Build Boond context
-        boond_context = await self._build_boond_context(application, created_by)
+        posting = await self.job_posting_repository.get_by_id(application.job_posting_id)
+        boond_context = await self._build_boond_context(application, posting, created_by)
+        await self.unit_of_work.release()
+        await self._add_opportunity_managers(boond_context)
 
         # Create in Boond
         try:
@@ -1191,6 +1238,7 @@ class CreateCandidateInBoondUseCase:
             application.boond_sync_error = None
             application.updated_at = datetime.utcnow()
             saved = await self.job_application_repository.save(application)
+            await self.unit_of_work.release()
 
             # Update administrative data (salary/TJM/contract)
             admin_data = BoondAdministrativeData.from_application(application)
@@ -1202,6 +1250,7 @@ class CreateCandidateInBoondUseCase:
             # Create action with analyses
             await self._create_analysis_action(
                 application=application,
+                posting_title=posting.title if posting else "",
                 candidate_id=external_id,
                 manager_boond_id=boond_context.hr_manager_boond_id,
             )
@@ -1209,11 +1258,10 @@ class CreateCandidateInBoondUseCase:
             application.boond_sync_error = str(e)
             application.updated_at = datetime.utcnow()
             await self.job_application_repository.save(application)
+            # Committed now: the request session is rolled back on the error response
+            await self.unit_of_work.release()
             raise ValueError(f"Failed to create candidate in BoondManager: {str(e)}")
 
-        # Build and return read model
-        posting = await self.job_posting_repository.get_by_id(application.job_posting_id)
-
         cv_download_url = None
         try:
             cv_download_url = await self.s3_client.get_presigned_url(
@@ -1232,13 +1280,10 @@ class CreateCandidateInBoondUseCase:
     async def _build_boond_context(
         self,
         application: JobApplication,
+        posting: JobPosting | None,
         created_by: UUID | None = None,
     ) -> BoondCandidateContext:
-        """Build BoondCandidateContext from opportunity data and current user."""
-        import structlog
-
-        log = structlog.get_logger(__name__)
-
+        """Build BoondCandidateContext from the stored opportunity and current user."""
         context = BoondCandidateContext(
             employment_status=application.employment_status,
             job_title=application.job_title,
@@ -1250,29 +1295,36 @@ class CreateCandidateInBoondUseCase:
             if user and user.boond_resource_id:
                 context.hr_manager_boond_id = user.boond_resource_id
 
-        # Get opportunity info for manager, agency, and sourceDetail
-        posting = await self.job_posting_repository.get_by_id(application.job_posting_id)
+        # Get opportunity for sourceDetail (manager and agency come from Boond)
         if posting:
             opportunity = await self.opportunity_repository.get_by_id(posting.opportunity_id)
             if opportunity and opportunity.external_id:
                 context.boond_opportunity_id = opportunity.external_id
 
-                # Fetch full opportunity detail from Boond for manager and agency
-                try:
-                    opp_info = await self.boond_client.get_opportunity_information(
-                        opportunity.external_id
-                    )
-                    context.main_manager_boond_id = opp_info.get("manager_id")
-                    context.agency_boond_id = opp_info.get("agency_id")
-                except Exception as e:
-                    log.warning(
-                        "boond_opportunity_fetch_failed",
-                        opportunity_id=opportunity.external_id,
-                        error=str(e),
-                    )
-
         return context
 
+    async def _add_opportunity_managers(self, context: BoondCandidateContext) -> None:
+        """Fetch full opportunity detail from Boond for manager and agency."""
+        import structlog
+
+        log = structlog.get_logger(__name__)
+
+        if not context.boond_opportunity_id:
+            return
+
+        try:
+            opp_info = await self.boond_client.get_opportunity_information(
+                context.boond_opportunity_id
+            )
+            context.main_manager_boond_id = opp_info.get("manager_id")
+            context.agency_boond_id = opp_info.get("agency_id")
+        except Exception as e:
+            log.warning(
+                "boond_opportunity_fetch_failed",
+                opportunity_id=context.boond_opportunity_id,
+                error=str(e),
+            )
+
     async def _upload_cv_to_boond(
         self,
         application: JobApplication,
@@ -1313,6 +1365,7 @@ class CreateCandidateInBoondUseCase:
     async def _create_analysis_action(
         self,
         application: JobApplication,
+        posting_title: str,
         candidate_id: str,
         manager_boond_id: str | None,
     ) -> None:
@@ -1328,11 +1381,6 @@ class CreateCandidateInBoondUseCase:
             )
             return
 
-        posting_title = ""
-        posting = await self.job_posting_repository.get_by_id(application.job_posting_id)
-        if posting:
-            posting_title = posting.title
-
         text = format_analyses_as_boond_html(
             matching_details=application.matching_details,
             cv_quality=application.cv_quality,
@@ -1406,6 +1454,7 @@ class CreateCandidateInBoondUseCase:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
@@ -1472,8 +1521,9 @@ class ReanalyzeApplicationUseCase:
         if not posting:
             raise JobPostingNotFoundError(str(application.job_posting_id))
 
-        # Re-run analyses if CV text is available
-        if application.cv_text:
+        # Re-run analyses if CV text is available (stored apart from the application)
+        cv_text = await self.job_application_repository.get_cv_text(application.id)
+        if cv_text:
             # Build job description for matching
             job_description = f"""
 {posting.description}
@@ -1493,7 +1543,7 @@ Qualifications requises:
 
             # Run both evaluations in parallel
             matching_task = self.matching_service.calculate_match_enhanced(
-                cv_text=application.cv_text,
+                cv_text=cv_text,
                 job_title_offer=posting.title,
                 job_description=job_description,
                 required_skills=posting.skills,
@@ -1501,7 +1551,7 @@ Qualifications requises:
                 candidate_tjm_range=tjm_range_str,
                 candidate_availability=application.availability_display,
             )
-            quality_task = self.matching_service.evaluate_cv_quality(application.cv_text)
+            quality_task = self.matching_service.evaluate_cv_quality(cv_text)
 
             results = await asyncio.gather(
                 matching_task,
@@ -1516,24 +1566,7 @@ Qualifications requises:
                     "score_global", matching_result.get("score", 0)
                 )
                 application.matching_score = matching_score
-                application.matching_details = {
-                    "score": matching_score,
-                    "score_global": matching_result.get("score_global", matching_score),
-                    "scores_details": matching_result.get("scores_details", {}),
-                    "competences_matchees": matching_result.get("competences_matchees", []),
-                    "competences_manquantes": matching_result.get("competences_manquantes", []),
-                    "points_forts": matching_result.get("points_forts", []),
-                    "points_vigilance": matching_result.get("points_vigilance", []),
-                    "synthese": matching_result.get("synthese", matching_result.get("summary", "")),
-                    "recommandation": matching_result.get("recommandation", {}),
-                    "strengths": matching_result.get(
-                        "strengths", matching_result.get("points_forts", [])
-                    ),
-                    "gaps": matching_result.get(
-                        "gaps", matching_result.get("competences_manquantes", [])
-                    ),
-                    "summary": matching_result.get("summary", matching_result.get("synthese", "")),
-                }
+                application.matching_details = _build_matching_details(matching_result)
 
             # Process CV quality result
             quality_result = results[1]
@@ -1607,6 +1640,7 @@ Qualifications requises:
             cv_download_url=cv_download_url,
             matching_score=application.matching_score,
             matching_details=matching_details_model,
+            prescreen_score=application.prescreen_score,
             cv_quality_score=application.cv_quality_score,
             cv_quality=cv_quality_model,
             is_read=application.is_read,
@@ -1621,3 +1655,90 @@ Qualifications requises:
             created_at=application.created_at,
             updated_at=application.updated_at,
         )
+
+
+class AnalyzePendingApplicationsUseCase:
+    """Run AI matching in batch for the best pre-scored, not yet analysed applications.
+
+    Used with the top_n and on_demand LLM modes: candidates are grouped into
+    batch Gemini requests sharing the job description. CV quality evaluation
+    is left to the per-application reanalyze action.
+    """
+
+    def __init__(
+        self,
+        job_posting_repository: JobPostingRepository,
+        job_application_repository: JobApplicationRepository,
+        matching_service: GeminiMatchingService,
+        unit_of_work: UnitOfWorkPort,
+    ) -> None:
+        self.job_posting_repository = job_posting_repository
+        self.job_application_repository = job_application_repository
+        self.matching_service = matching_service
+        self.unit_of_work = unit_of_work
+
+    async def execute(
+        self, posting_id: UUID, top_n: int = 20
+    ) -> ApplicationsAnalysisResultReadModel:
+        """Analyse the N best pre-scored applications not analysed yet.
+
+        Args:
+            posting_id: Job posting UUID.
+            top_n: Number of pending applications analysed.
+
+        Returns:
+            Number of applications analysed and failed.
+        """
+        posting = await self.job_posting_repository.get_by_id(posting_id)
+        if not posting:
+            raise JobPostingNotFoundError(str(posting_id))
+
+        applications = await self.job_application_repository.list_pending_analysis(
+            posting_id=posting_id, limit=top_n
+        )
+        cv_texts = await self.job_application_repository.get_cv_texts([a.id for a in applications])
+        pending = [a for a in applications if a.id in cv_texts]
+        if not pending:
+            return ApplicationsAnalysisResultReadModel(analyzed_count=0, failed_count=0)
+
+        job_description = f"""
+{posting.description}
+
+Qualifications requises:
+{posting.qualifications}
+"""
+        candidates = [
+            BatchMatchingCandidate(
+                candidate_id=str(application.id),
+                cv_text=cv_texts[application.id],
+                job_title=application.job_title,
+                tjm_range=application.tjm_range,
+                availability=application.availability_display,
+            )
+            for application in pending
+        ]
+        await self.unit_of_work.release()
+        results = await self.matching_service.calculate_match_batch(
+            candidates=candidates,
+            job_title_offer=posting.title,
+            job_description=job_description,
+            required_skills=posting.skills,
+        )
+
+        analyzed_count = 0
+        for application in pending:
+            matching_result = results.get(str(application.id))
+            if matching_result is None:
+                continue
+            application.matching_score = matching_result.get(
+                "score_global", matching_result.get("score", 0)
+            )
+            application.matching_details = _build_matching_details(matching_result)
+            application.updated_at = datetime.utcnow()
+            await self.job_application_repository.save(application)
+            analyzed_count += 1
+
+        return ApplicationsAnalysisResultReadModel(
+            analyzed_count=analyzed_count,
+            failed_count=len(pending) - analyzed_count,
+        )
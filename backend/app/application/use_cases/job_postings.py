@@ -18,6 +18,7 @@ from app.domain.exceptions import (
     OpportunityNotFoundError,
     TurnoverITError,
 )
+from app.domain.unit_of_work import UnitOfWorkPort
 from app.infrastructure.boond.client import BoondClient
 from app.infrastructure.database.repositories import (
     JobApplicationRepository,
@@ -96,6 +97,9 @@ class ListOpenOpportunitiesForHRUseCase:
         job_postings_map = await self.job_posting_repository.get_all_by_boond_opportunity_ids(
             boond_ids
         )
+        stats_by_posting = await self.job_application_repository.get_stats_by_postings(
+            [posting.id for posting in job_postings_map.values()]
+        )
 
         # Build items with job posting info
         items = []
@@ -103,15 +107,7 @@ class ListOpenOpportunitiesForHRUseCase:
             boond_id = opp["id"]
             job_posting = job_postings_map.get(boond_id)
 
-            applications_count = 0
-            new_applications_count = 0
-            if job_posting:
-                applications_count = await self.job_application_repository.count_by_posting(
-                    job_posting.id
-                )
-                new_applications_count = (
-                    await self.job_application_repository.count_unread_by_posting(job_posting.id)
-                )
+            stats = stats_by_posting.get(job_posting.id, {}) if job_posting else {}
 
             # Parse dates if they exist
             start_date = None
@@ -147,8 +143,8 @@ class ListOpenOpportunitiesForHRUseCase:
                     job_posting_status_display=job_posting.status.display_name
                     if job_posting
                     else None,
-                    applications_count=applications_count,
-                    new_applications_count=new_applications_count,
+                    applications_count=stats.get("total", 0),
+                    new_applications_count=stats.get("unread", 0),
                 )
             )
 
@@ -447,56 +443,51 @@ class GetJobPostingByTokenUseCase:
 
 
 class ListJobPostingsUseCase:
-    """List all job postings."""
+    """List all job postings.
+
+    Postings come with their opportunity, creator name and application counts
+    from a single repository query, whatever the page size.
+    """
 
     def __init__(
         self,
         job_posting_repository: JobPostingRepository,
-        opportunity_repository: OpportunityRepository,
-        job_application_repository: JobApplicationRepository,
-        user_repository: UserRepository,
     ) -> None:
         self.job_posting_repository = job_posting_repository
-        self.opportunity_repository = opportunity_repository
-        self.job_application_repository = job_application_repository
-        self.user_repository = user_repository
 
     async def execute(
         self,
         page: int = 1,
         page_size: int = 20,
         status: JobPostingStatus | None = None,
+        cursor: str | None = None,
     ) -> JobPostingListReadModel:
-        """List job postings with pagination."""
+        """List job postings with pagination.
+
+        cursor is the next_cursor of the previous page; when given, page is
+        ignored and the list continues after that posting.
+        """
         skip = (page - 1) * page_size
 
-        postings = await self.job_posting_repository.list_all(
+        summaries = await self.job_posting_repository.list_summaries(
             skip=skip,
             limit=page_size,
             status=status,
+            cursor=cursor,
         )
-        total = await self.job_posting_repository.count_all(status=status)
 
         items = []
-        for posting in postings:
-            opportunity = await self.opportunity_repository.get_by_id(posting.opportunity_id)
-            stats = await self.job_application_repository.get_stats_by_posting(posting.id)
-
-            created_by_name = None
-            if posting.created_by:
-                user = await self.user_repository.get_by_id(posting.created_by)
-                if user:
-                    created_by_name = user.full_name
-
+        for summary in summaries.items:
+            posting = summary.posting
             application_url = f"{settings.frontend_url}/postuler/{posting.application_token}"
 
             items.append(
                 JobPostingReadModel(
                     id=str(posting.id),
                     opportunity_id=str(posting.opportunity_id),
-                    opportunity_title=opportunity.title if opportunity else None,
-                    opportunity_reference=opportunity.reference if opportunity else None,
-                    client_name=opportunity.client_name if opportunity else None,
+                    opportunity_title=summary.opportunity_title,
+                    opportunity_reference=summary.opportunity_reference,
+                    client_name=summary.client_name,
                     title=posting.title,
                     description=posting.description,
                     qualifications=posting.qualifications,
@@ -524,22 +515,23 @@ class ListJobPostingsUseCase:
                     application_token=posting.application_token,
                     application_url=application_url,
                     created_by=str(posting.created_by) if posting.created_by else None,
-                    created_by_name=created_by_name,
+                    created_by_name=summary.created_by_name,
                     created_at=posting.created_at,
                     updated_at=posting.updated_at,
                     published_at=posting.published_at,
                     closed_at=posting.closed_at,
-                    applications_total=stats.get("total", 0),
-                    applications_new=stats.get("unread", 0),
+                    applications_total=summary.applications_total,
+                    applications_new=summary.applications_unread,
                     view_count=posting.view_count,
                 )
             )
 
         return JobPostingListReadModel(
             items=items,
-            total=total,
+            total=summaries.total,
             page=page,
             page_size=page_size,
+            next_cursor=summaries.next_cursor,
         )
 
 
@@ -553,15 +545,21 @@ class PublishJobPostingUseCase:
         user_repository: UserRepository,
         turnoverit_client: TurnoverITClient,
         boond_client: BoondClient,
+        unit_of_work: UnitOfWorkPort,
     ) -> None:
         self.job_posting_repository = job_posting_repository
         self.opportunity_repository = opportunity_repository
         self.user_repository = user_repository
         self.turnoverit_client = turnoverit_client
         self.boond_client = boond_client
+        self.unit_of_work = unit_of_work
 
     async def execute(self, posting_id: UUID) -> JobPostingReadModel:
-        """Publish job posting to Turnover-IT."""
+        """Publish job posting to Turnover-IT.
+
+        The connection is returned to the pool during the Boond and
+        Turnover-IT calls.
+        """
         posting = await self.job_posting_repository.get_by_id(posting_id)
         if not posting:
             raise JobPostingNotFoundError(str(posting_id))
@@ -571,6 +569,7 @@ class PublishJobPostingUseCase:
 
         # Get opportunity for context
         opportunity = await self.opportunity_repository.get_by_id(posting.opportunity_id)
+        await self.unit_of_work.release()
 
         # Fetch Boond opportunity to get agency_id for reference prefix
         agency_id = None
@@ -302,18 +302,17 @@ class ListPublishedOpportunitiesUseCase:
 
         skip = (page - 1) * page_size
 
-        opportunities = await self._repository.list_published(
+        opportunities = await self._repository.list_published_page(
             skip=skip,
             limit=page_size,
             search=search,
         )
-        total = await self._repository.count_published(search=search)
 
-        items = [self._to_read_model(opp) for opp in opportunities]
+        items = [self._to_read_model(opp) for opp in opportunities.items]
 
         return PublishedOpportunityListReadModel(
             items=items,
-            total=total,
+            total=opportunities.total,
             page=page,
             page_size=page_size,
         )
@@ -3,7 +3,7 @@
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,11 +13,14 @@ from app.infrastructure.cache.redis import get_redis_client
 from app.infrastructure.database.connection import get_async_session
 from app.infrastructure.service_factory import ServiceFactory
 from app.infrastructure.settings import AppSettingsService
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get database session dependency (labelled with the route for pool metrics)."""
     async for session in get_async_session():
+        route = request.scope.get("route")
+        session.info["route"] = getattr(route, "path", request.url.path)
         yield session
 
 
@@ -50,6 +53,17 @@ def get_service_factory(
     return ServiceFactory(db=db, settings=settings)
 
 
+def get_unit_of_work(
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> SqlAlchemyUnitOfWork:
+    """Get the Unit of Work of the request session.
+
+    The request session is still committed by get_db; use cases call
+    release() to return its connection to the pool before external calls.
+    """
+    return SqlAlchemyUnitOfWork(db)
+
+
 def get_app_settings_service(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> AppSettingsService:
@@ -63,4 +77,5 @@ RedisClient = Annotated[Redis, Depends(get_redis)]
 AppSettings = Annotated[Settings, Depends(get_settings)]
 Boond = Annotated[BoondClient, Depends(get_boond_client)]
 Services = Annotated[ServiceFactory, Depends(get_service_factory)]
+UnitOfWork = Annotated[SqlAlchemyUnitOfWork, Depends(get_unit_of_work)]
 AppSettingsSvc = Annotated[AppSettingsService, Depends(get_app_settings_service)]
@@ -165,13 +165,17 @@ class JobApplication:
     cv_s3_key: str = ""  # S3/MinIO storage key
     cv_filename: str = ""  # Original filename
 
-    # CV text extraction (for matching)
+    # CV text extraction (for matching). Stored apart from the application:
+    # None when not loaded (the repository reads it on demand)
     cv_text: str | None = None
 
     # AI matching results
     matching_score: int | None = None  # 0-100
     matching_details: dict[str, Any] | None = None
 
+    # Local provisional score computed without LLM (0-100)
+    prescreen_score: int | None = None
+
     # CV Quality evaluation results (/20)
     cv_quality_score: float | None = None  # 0-20
     cv_quality: dict[str, Any] | None = None
@@ -12,8 +12,10 @@ from app.domain.ports.services import (
     CacheServicePort,
     CvDataExtractorPort,
     CvDocumentGeneratorPort,
+    CvTextExtractionServicePort,
     CvTextExtractorPort,
     EmailServicePort,
+    PrincipalCachePort,
 )
 
 __all__ = [
@@ -26,6 +28,8 @@ __all__ = [
     "CacheServicePort",
     "CvDataExtractorPort",
     "CvDocumentGeneratorPort",
+    "CvTextExtractionServicePort",
     "CvTextExtractorPort",
     "EmailServicePort",
+    "PrincipalCachePort",
 ]
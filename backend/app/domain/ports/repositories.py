@@ -421,6 +421,14 @@ class JobApplicationRepositoryPort(Protocol):
         """List all applications with optional status filter."""
         ...
 
+    async def get_cv_text(self, application_id: UUID) -> str | None:
+        """Get the extracted CV text of an application."""
+        ...
+
+    async def get_cv_texts(self, application_ids: list[UUID]) -> dict[UUID, str]:
+        """Get the extracted CV text of applications, by application ID."""
+        ...
+
     async def count_by_posting(
         self,
         posting_id: UUID,
@@ -436,3 +444,7 @@ class JobApplicationRepositoryPort(Protocol):
     async def get_stats_by_posting(self, posting_id: UUID) -> dict[str, int]:
         """Get application statistics for a job posting (by status)."""
         ...
+
+    async def get_stats_by_postings(self, posting_ids: list[UUID]) -> dict[UUID, dict[str, int]]:
+        """Get application statistics for several job postings (one query)."""
+        ...
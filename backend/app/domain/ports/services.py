@@ -1,6 +1,7 @@
 """Service port interfaces for external services."""
 
 from typing import Any, Protocol
+from uuid import UUID
 
 from app.domain.entities import Candidate, Opportunity
 
@@ -103,6 +104,14 @@ class CacheServicePort(Protocol):
         ...
 
 
+class PrincipalCachePort(Protocol):
+    """Port for the cache of authenticated principals (role, active flag)."""
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop a user's cached principal after a change to their account."""
+        ...
+
+
 class CvTextExtractorPort(Protocol):
     """Port for extracting text from CV documents."""
 
@@ -121,6 +130,28 @@ class CvTextExtractorPort(Protocol):
         ...
 
 
+class CvTextExtractionServicePort(Protocol):
+    """Port for extracting text from PDF/DOCX CV files without blocking the event loop."""
+
+    async def extract_text(
+        self, content: bytes, filename: str, max_chars: int | None = None
+    ) -> str:
+        """Extract text from document content.
+
+        Args:
+            content: Binary content of the document.
+            filename: Original filename, used to determine the file type.
+            max_chars: Character budget (None extracts the full document).
+
+        Returns:
+            Extracted text.
+
+        Raises:
+            ValueError: If extraction fails or times out.
+        """
+        ...
+
+
 class CvDataExtractorPort(Protocol):
     """Port for extracting structured data from CV text using AI."""
 
@@ -14,6 +14,14 @@ Example usage:
         await unit_of_work.users.save(user)
         await unit_of_work.commit()
 
+    # Or without holding a connection during a long external call:
+    async with unit_of_work:
+        user = await unit_of_work.users.get_by_id(user_id)
+        await unit_of_work.release()
+        user.boond_resource_id = await boond_client.find_resource(user.email)
+        await unit_of_work.users.save(user)
+        await unit_of_work.commit()
+
     # Or with automatic commit on success:
     async with unit_of_work:
         await unit_of_work.users.save(user)
@@ -56,6 +64,10 @@ class UnitOfWorkPort(Protocol):
         """Rollback the transaction."""
         ...
 
+    async def release(self) -> None:
+        """Commit the work done so far and return the connection to the pool."""
+        ...
+
     async def __aenter__(self) -> "UnitOfWorkPort":
         """Enter the context manager."""
         ...
@@ -114,6 +126,17 @@ class AbstractUnitOfWork(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def release(self) -> None:
+        """
+        Commit the work done so far and return the connection to the pool.
+
+        Call it before a long external call (Boond, Turnover-IT, S3, LLM):
+        loaded entities stay usable, and the next repository call checks
+        out a connection again.
+        """
+        raise NotImplementedError
+
     async def collect_new_events(self) -> list:
         """
         Collect domain events from all entities managed by this unit of work.
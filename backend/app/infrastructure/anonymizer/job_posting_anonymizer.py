@@ -5,21 +5,33 @@ for Turnover-IT publication format, matching skills from the
 Turnover-IT nomenclature.
 """
 
+import asyncio
 import json
 import logging
+import time
 import traceback
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from difflib import SequenceMatcher
+from functools import partial
 
 from google import genai
 from google.genai import types
-from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import Settings
-from app.infrastructure.database.models import TurnoverITSkillModel, TurnoverITSkillsMetadataModel
+from app.infrastructure.anonymizer.skill_index import get_skill_index
+from app.infrastructure.anonymizer.skills_snapshot import (
+    TurnoverITSkillsStore,
+    get_skills_store,
+)
+from app.infrastructure.database.repositories import SkillsMergeResult
+from app.infrastructure.observability.metrics import (
+    anonymizer_duration_seconds,
+    anonymizer_prompt_chars,
+    anonymizer_skills_recall,
+)
 from app.infrastructure.turnoverit.client import TurnoverITClient
+from app.infrastructure.turnoverit.skills_sync import sync_skills_from_turnoverit
 
 logger = logging.getLogger(__name__)
 
@@ -126,19 +138,21 @@ class JobPostingAnonymizer:
         settings: Settings,
         db_session: AsyncSession,
         turnoverit_client: TurnoverITClient | None = None,
+        skills_store: TurnoverITSkillsStore | None = None,
     ) -> None:
         """Initialize the job posting anonymizer.
 
         Args:
             settings: Application settings.
-            db_session: Database session for skills cache.
+            db_session: Database session for skills sync.
             turnoverit_client: Optional TurnoverIT client for skills sync.
+            skills_store: Skills snapshot store (process-wide store by default).
         """
         self.settings = settings
         self.db_session = db_session
         self.turnoverit_client = turnoverit_client or TurnoverITClient(settings)
+        self.skills_store = skills_store or get_skills_store()
         self._client: genai.Client | None = None
-        self._skills_cache: list[dict[str, str]] | None = None
 
     def _get_client(self) -> genai.Client:
         """Get or create the Gemini API client."""
@@ -151,24 +165,25 @@ class JobPostingAnonymizer:
     async def ensure_skills_synced(self) -> None:
         """Ensure skills are synced from Turnover-IT to database.
 
-        Checks if sync is needed based on last sync time.
+        Checks if sync is needed based on the skills snapshot sync time.
         Gracefully handles missing tables (migration not yet run).
         """
+        snapshot = await self.skills_store.get_snapshot()
+        if not snapshot.loaded:
+            logger.warning("Skills table unavailable. Continuing without skills.")
+            return
+
         try:
-            # Check last sync time
-            result = await self.db_session.execute(
-                select(TurnoverITSkillsMetadataModel).where(TurnoverITSkillsMetadataModel.id == 1)
-            )
-            metadata = result.scalar_one_or_none()
+            last_synced_at = snapshot.version
+            if last_synced_at and last_synced_at.tzinfo is None:
+                last_synced_at = last_synced_at.replace(tzinfo=UTC)
 
             needs_sync = False
-            if not metadata:
+            if not last_synced_at:
                 needs_sync = True
-            elif not metadata.last_synced_at:
+            elif datetime.now(UTC) - last_synced_at > SKILLS_SYNC_INTERVAL:
                 needs_sync = True
-            elif datetime.now(UTC) - metadata.last_synced_at > SKILLS_SYNC_INTERVAL:
-                needs_sync = True
-            elif metadata.total_skills == 0:
+            elif not snapshot.skills:
                 needs_sync = True
 
             if needs_sync:
@@ -177,78 +192,27 @@ class JobPostingAnonymizer:
             # Table might not exist yet (migration not run) - log and continue
             logger.warning(f"Could not check skills sync status: {e}. Continuing without skills.")
 
-    async def sync_skills(self) -> int:
+    async def sync_skills(self) -> SkillsMergeResult | None:
         """Sync all skills from Turnover-IT API to database.
 
-        Returns:
-            Number of skills synced.
-        """
-        logger.info("Starting Turnover-IT skills sync...")
-
-        # Fetch all skills from API
-        skills = await self.turnoverit_client.fetch_all_skills()
-
-        if not skills:
-            logger.warning("No skills fetched from Turnover-IT")
-            return 0
-
-        # Clear existing skills
-        await self.db_session.execute(delete(TurnoverITSkillModel))
-
-        # Insert new skills
-        for skill in skills:
-            skill_model = TurnoverITSkillModel(
-                name=skill["name"],
-                slug=skill["slug"],
-            )
-            self.db_session.add(skill_model)
-
-        # Update metadata
-        result = await self.db_session.execute(
-            select(TurnoverITSkillsMetadataModel).where(TurnoverITSkillsMetadataModel.id == 1)
-        )
-        metadata = result.scalar_one_or_none()
-
-        if metadata:
-            metadata.last_synced_at = datetime.now(UTC)
-            metadata.total_skills = len(skills)
-        else:
-            metadata = TurnoverITSkillsMetadataModel(
-                id=1,
-                last_synced_at=datetime.now(UTC),
-                total_skills=len(skills),
-            )
-            self.db_session.add(metadata)
-
-        await self.db_session.commit()
+        Runs on a session of its own: the caller's session is not committed.
 
-        # Clear cache
-        self._skills_cache = None
+        Returns:
+            Added/updated/removed counts, or None if no skill was fetched.
 
-        logger.info(f"Synced {len(skills)} skills from Turnover-IT")
-        return len(skills)
+        Raises:
+            TurnoverITError: If a skills page cannot be fetched.
+        """
+        return await sync_skills_from_turnoverit(self.turnoverit_client)
 
     async def get_cached_skills(self) -> list[dict[str, str]]:
-        """Get skills from database cache.
+        """Get skills from the process-wide snapshot.
 
         Returns:
             List of skills with name and slug. Empty list if table doesn't exist.
         """
-        if self._skills_cache is not None:
-            return self._skills_cache
-
-        try:
-            result = await self.db_session.execute(
-                select(TurnoverITSkillModel).order_by(TurnoverITSkillModel.name)
-            )
-            skills = result.scalars().all()
-            self._skills_cache = [{"name": s.name, "slug": s.slug} for s in skills]
-        except Exception as e:
-            # Table might not exist yet (migration not run) - return empty list
-            logger.warning(f"Could not fetch skills from database: {e}. Using empty skills list.")
-            self._skills_cache = []
-
-        return self._skills_cache
+        snapshot = await self.skills_store.get_snapshot()
+        return list(snapshot.skills)
 
     def match_skills_to_nomenclature(
         self,
@@ -258,7 +222,8 @@ class JobPostingAnonymizer:
     ) -> list[str]:
         """Match extracted skills to Turnover-IT nomenclature.
 
-        Uses fuzzy matching to find the best matches.
+        Uses a trigram index over the skill names (built once per skills
+        list) to fuzzy match against a few candidates instead of every skill.
 
         Args:
             extracted_skills: Skills extracted by Gemini.
@@ -269,39 +234,42 @@ class JobPostingAnonymizer:
             List of matched Turnover-IT skill slugs.
         """
         matched_slugs: list[str] = []
-        skill_name_to_slug = {s["name"].lower(): s["slug"] for s in turnoverit_skills}
-        skill_names_lower = list(skill_name_to_slug.keys())
+        index = get_skill_index(turnoverit_skills)
 
         for extracted in extracted_skills:
-            extracted_lower = extracted.lower().strip()
-
-            # Exact match first
-            if extracted_lower in skill_name_to_slug:
-                slug = skill_name_to_slug[extracted_lower]
-                if slug not in matched_slugs:
-                    matched_slugs.append(slug)
+            match = index.best_match(extracted, threshold)
+            if match is None:
                 continue
 
-            # Fuzzy match
-            best_match = None
-            best_score = 0.0
-
-            for skill_name in skill_names_lower:
-                score = SequenceMatcher(None, extracted_lower, skill_name).ratio()
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_match = skill_name
-
-            if best_match:
-                slug = skill_name_to_slug[best_match]
-                if slug not in matched_slugs:
-                    matched_slugs.append(slug)
+            best_match, slug, best_score = match
+            if slug not in matched_slugs:
+                matched_slugs.append(slug)
+                if best_score < 1.0:
                     logger.debug(
                         f"Matched '{extracted}' to '{best_match}' (score: {best_score:.2f})"
                     )
 
         return matched_slugs
 
+    def select_prompt_skills(
+        self, title: str, description: str, turnoverit_skills: list[dict[str, str]]
+    ) -> list[dict[str, str]]:
+        """Pre-select the Turnover-IT skills mentioned in a job posting.
+
+        Falls back to the whole nomenclature when no skill is found in the text.
+
+        Args:
+            title: Original opportunity title.
+            description: Original opportunity description/criteria.
+            turnoverit_skills: Turnover-IT skill list from database.
+
+        Returns:
+            At most ANONYMIZER_SKILLS_LIMIT skills with name and slug.
+        """
+        index = get_skill_index(turnoverit_skills)
+        selected = index.retrieve(f"{title}\n{description}", self.settings.ANONYMIZER_SKILLS_LIMIT)
+        return selected or turnoverit_skills
+
     async def anonymize(
         self,
         title: str,
@@ -331,13 +299,61 @@ class JobPostingAnonymizer:
         # Get cached skills for the prompt
         turnoverit_skills = await self.get_cached_skills()
 
-        # Format skills list for the prompt (name: slug format for clarity)
-        # Send ALL skills to Gemini - modern models have large context windows
-        skills_list_str = "\n".join(f"- {s['name']} (slug: {s['slug']})" for s in turnoverit_skills)
-
         model_to_use = model_name or self.DEFAULT_MODEL
+        skills_mode = self.settings.ANONYMIZER_SKILLS_MODE
         logger.info(f"Anonymizing job posting with model: {model_to_use}")
-        logger.info(f"Available skills for matching: {len(turnoverit_skills)}")
+        logger.info(
+            f"Available skills for matching: {len(turnoverit_skills)} (mode: {skills_mode})"
+        )
+
+        anonymize_with = partial(
+            self._anonymize_with_skills,
+            client,
+            model_to_use,
+            title,
+            description,
+            client_name,
+            turnoverit_skills,
+        )
+        if skills_mode == "full":
+            return await anonymize_with(turnoverit_skills, "full")
+
+        prompt_skills = self.select_prompt_skills(title, description or "", turnoverit_skills)
+        if skills_mode == "retrieval":
+            return await anonymize_with(prompt_skills, "retrieval")
+
+        # compare: same posting with both skill lists, the retrieval result is returned
+        retrieval_result, full_result = await asyncio.gather(
+            anonymize_with(prompt_skills, "retrieval"),
+            anonymize_with(turnoverit_skills, "full"),
+        )
+        if full_result.skills:
+            found = set(retrieval_result.skills) & set(full_result.skills)
+            recall = len(found) / len(full_result.skills)
+            anonymizer_skills_recall.observe(recall)
+            logger.info(
+                f"Anonymizer skills recall: {recall:.2f} "
+                f"(retrieval={retrieval_result.skills}, full={full_result.skills})"
+            )
+        return retrieval_result
+
+    async def _anonymize_with_skills(
+        self,
+        client: genai.Client,
+        model_to_use: str,
+        title: str,
+        description: str,
+        client_name: str | None,
+        turnoverit_skills: list[dict[str, str]],
+        prompt_skills: list[dict[str, str]],
+        skills_mode: str,
+    ) -> AnonymizedJobPosting:
+        """Run the Gemini anonymization with the given skills in the prompt.
+
+        Selected slugs are validated against the whole nomenclature.
+        """
+        # Format skills list for the prompt (name: slug format for clarity)
+        skills_list_str = "\n".join(f"- {s['name']} (slug: {s['slug']})" for s in prompt_skills)
 
         try:
             prompt = JOB_POSTING_ANONYMIZATION_PROMPT.format(
@@ -346,8 +362,10 @@ class JobPostingAnonymizer:
                 description=description or "Pas de description disponible",
                 available_skills=skills_list_str or "Aucune liste de compétences disponible",
             )
+            anonymizer_prompt_chars.observe(len(prompt), skills_mode=skills_mode)
 
             # Use native async support from the new SDK
+            start = time.perf_counter()
             response = await client.aio.models.generate_content(
                 model=model_to_use,
                 contents=prompt,
@@ -355,6 +373,8 @@ class JobPostingAnonymizer:
                     response_mime_type="application/json",
                 ),
             )
+            elapsed = time.perf_counter() - start
+            anonymizer_duration_seconds.observe(elapsed, skills_mode=skills_mode)
 
             # Extract response text
             response_text = self._extract_response_text(response)
@@ -401,7 +421,9 @@ class JobPostingAnonymizer:
                 )[:6]
 
             logger.info(
-                f"Anonymized job posting: description={len(anonymized_description)} chars, "
+                f"Anonymized job posting ({skills_mode}): prompt={len(prompt)} chars "
+                f"with {len(prompt_skills)} skills, {elapsed:.2f}s, "
+                f"description={len(anonymized_description)} chars, "
                 f"{len(selected_skills)} skills selected by Gemini, "
                 f"{len(validated_skills)} validated against Turnover-IT"
             )
@@ -0,0 +1,207 @@
+"""Fuzzy matching index over the Turnover-IT skills nomenclature.
+
+Character trigram inverted index built once per skills list: a lookup only
+scores the skill names sharing trigrams with the query, then re-ranks the
+top candidates with difflib's ratio so the threshold keeps its meaning.
+
+A word index over skill names and slugs also retrieves the skills mentioned
+in a job posting, to send Gemini a short list instead of the nomenclature.
+"""
+
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+
+def _normalize(text: str) -> str:
+    return text.lower().strip()
+
+
+def _ngrams(text: str) -> set[str]:
+    """Character trigrams of a normalized text, padded to keep word edges."""
+    padded = f" {text} "
+    if len(padded) < NGRAM_SIZE:
+        return {padded}
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+_WORD_PATTERN = re.compile(r"[\w#+.]+")
+_WORD_SEPARATORS = re.compile(r"[.\-/]")
+
+
+def _word_tokens(text: str) -> set[str]:
+    """Lowercase words of a text, plus separator-free variants ("node.js" -> "nodejs")."""
+    tokens: set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        word = word.rstrip(".")
+        if not word:
+            continue
+        tokens.add(word)
+        compact = _WORD_SEPARATORS.sub("", word)
+        if compact and compact != word:
+            tokens.add(compact)
+    return tokens
+
+
+class SkillMatchIndex:
+    """In-memory trigram index mapping free-text skill names to slugs."""
+
+    DEFAULT_TOP_K = 20
+
+    def __init__(self, skills: list[dict[str, str]]) -> None:
+        """Build the index.
+
+        Args:
+            skills: Turnover-IT skills with name and slug. When two skills share
+                a lowercase name, the last one wins (same as a dict build).
+        """
+        by_name = {_normalize(s["name"]): s for s in skills}
+        self._skills = list(by_name.values())
+        self._name_to_slug = {name: skill["slug"] for name, skill in by_name.items()}
+        self._names = list(self._name_to_slug)
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        # Word sets of each skill name and slug, for posting text retrieval
+        self._word_sets: list[tuple[set[str], set[str]]] = []
+        self._word_postings: dict[str, list[int]] = {}
+
+        for position, name in enumerate(self._names):
+            grams = _ngrams(name)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+            name_words = _word_tokens(name)
+            slug_words = _word_tokens(self._name_to_slug[name].replace("-", " "))
+            self._word_sets.append((name_words, slug_words))
+            for word in name_words | slug_words:
+                self._word_postings.setdefault(word, []).append(position)
+
+        total = max(len(self._names), 1)
+        self._word_idf = {
+            word: math.log(1 + total / len(positions))
+            for word, positions in self._word_postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def candidates(self, query: str, threshold: float, top_k: int) -> list[str]:
+        """Return the top_k skill names by trigram overlap with the query.
+
+        Names whose length alone caps the difflib ratio below threshold are skipped.
+        The result keeps nomenclature order, so ties resolve like a full scan.
+        """
+        query = _normalize(query)
+        query_grams = _ngrams(query)
+        shared: Counter[int] = Counter()
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        scored: list[tuple[float, int]] = []
+        for position, count in shared.items():
+            name_length = len(self._names[position])
+            # ratio = 2 * matches / (len_a + len_b) <= 2 * min_len / (len_a + len_b)
+            if 2 * min(len(query), name_length) < threshold * (len(query) + name_length):
+                continue
+            dice = 2 * count / (len(query_grams) + self._gram_counts[position])
+            scored.append((dice, position))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._names[position] for position in sorted(p for _, p in scored[:top_k])]
+
+    def best_match(
+        self, query: str, threshold: float = 0.7, top_k: int = DEFAULT_TOP_K
+    ) -> tuple[str, str, float] | None:
+        """Find the closest skill for a free-text name.
+
+        Args:
+            query: Skill name to match.
+            threshold: Minimum difflib similarity ratio for a match.
+            top_k: Number of trigram candidates re-ranked with difflib.
+
+        Returns:
+            (skill name, slug, score) or None if nothing reaches threshold.
+        """
+        query = _normalize(query)
+        if query in self._name_to_slug:
+            return query, self._name_to_slug[query], 1.0
+
+        best_name = None
+        best_score = 0.0
+        matcher = SequenceMatcher(None, b=query)
+        for name in self.candidates(query, threshold, top_k):
+            matcher.set_seq1(name)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            # ratio() is not symmetric: keep the (query, name) order of the original scan
+            score = SequenceMatcher(None, query, name).ratio()
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_name = name
+
+        if best_name is None:
+            return None
+        return best_name, self._name_to_slug[best_name], best_score
+
+    def retrieve(self, text: str, limit: int) -> list[dict[str, str]]:
+        """Select the skills whose name or slug words appear in a text.
+
+        Skills are ranked by the IDF-weighted share of their words found in
+        the text (fully mentioned skills first, rare words before common ones).
+
+        Args:
+            text: Job posting title and description.
+            limit: Maximum number of skills returned.
+
+        Returns:
+            Matching skills (name and slug) in nomenclature order.
+        """
+        text_words = _word_tokens(text)
+        matched: set[int] = set()
+        for word in text_words:
+            matched.update(self._word_postings.get(word, ()))
+
+        scored: list[tuple[float, float, int]] = []
+        for position in matched:
+            best_coverage = 0.0
+            best_weight = 0.0
+            for words in self._word_sets[position]:
+                if not words:
+                    continue
+                found = sum(self._word_idf[w] for w in words if w in text_words)
+                coverage = found / sum(self._word_idf[w] for w in words)
+                if (coverage, found) > (best_coverage, best_weight):
+                    best_coverage, best_weight = coverage, found
+            scored.append((best_coverage, best_weight, position))
+
+        scored.sort(key=lambda item: (-item[0], -item[1], item[2]))
+        return [self._skills[position] for position in sorted(p for *_, p in scored[:limit])]
+
+
+_index_lock = threading.Lock()
+_cached_index: tuple[int, SkillMatchIndex] | None = None
+
+
+def get_skill_index(skills: list[dict[str, str]]) -> SkillMatchIndex:
+    """Get the process-wide index for a skills list, rebuilding it when the list changes."""
+    global _cached_index
+
+    fingerprint = hash(tuple((s["name"], s["slug"]) for s in skills))
+    cached = _cached_index
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    with _index_lock:
+        if _cached_index is None or _cached_index[0] != fingerprint:
+            _cached_index = (fingerprint, SkillMatchIndex(skills))
+            logger.info(f"Built skill match index over {len(_cached_index[1])} skills")
+        return _cached_index[1]
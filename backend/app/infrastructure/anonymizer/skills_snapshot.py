@@ -0,0 +1,147 @@
+"""Process-wide snapshot of the Turnover-IT skills nomenclature.
+
+The skills table only changes on sync (about once a month), but it was read
+in full by every anonymization and skills listing. The snapshot is loaded
+once, shared by the anonymizer and the HR/admin skills endpoints, and
+reloaded when turnoverit_skills_metadata.last_synced_at changes.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.anonymizer.skill_index import SkillMatchIndex, get_skill_index
+from app.infrastructure.database.connection import background_session_factory
+from app.infrastructure.database.models import TurnoverITSkillModel, TurnoverITSkillsMetadataModel
+from app.infrastructure.observability.metrics import cache_hits_total, cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "turnoverit_skills"
+
+
+@dataclass(frozen=True)
+class SkillsSnapshot:
+    """Immutable view of the skills table at a given sync.
+
+    version is the last_synced_at of the sync the skills come from. loaded is
+    False when the table could not be read (e.g. migration not run).
+    """
+
+    version: datetime | None
+    skills: tuple[dict[str, str], ...]
+    loaded: bool = True
+    name_to_slug: Mapping[str, str] = field(init=False, repr=False)
+    slugs: frozenset[str] = field(init=False, repr=False)
+    index: SkillMatchIndex = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        name_to_slug = {s["name"].lower(): s["slug"] for s in self.skills}
+        object.__setattr__(self, "name_to_slug", MappingProxyType(name_to_slug))
+        object.__setattr__(self, "slugs", frozenset(s["slug"] for s in self.skills))
+        object.__setattr__(self, "index", get_skill_index(list(self.skills)))
+
+    @classmethod
+    def unavailable(cls) -> "SkillsSnapshot":
+        """Snapshot used when the skills table cannot be read."""
+        return cls(version=None, skills=(), loaded=False)
+
+    def search(self, term: str | None) -> list[dict[str, str]]:
+        """Skills whose name contains term (case-insensitive), in name order."""
+        if not term:
+            return list(self.skills)
+        term = term.lower()
+        return [s for s in self.skills if term in s["name"].lower()]
+
+
+class TurnoverITSkillsStore:
+    """Holds the current skills snapshot and reloads it after a sync.
+
+    The sync version is checked at most every refresh_check_seconds, so a
+    sync made by another instance is picked up without a query per request.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        refresh_check_seconds: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._refresh_check_seconds = refresh_check_seconds
+        self._snapshot: SkillsSnapshot | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get_snapshot(self) -> SkillsSnapshot:
+        """Get the current snapshot, reloading it if the sync version changed."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh():
+            cache_hits_total.inc(cache_name=CACHE_NAME)
+            return snapshot
+
+        async with self._lock:
+            if self._snapshot is not None and self._is_fresh():
+                cache_hits_total.inc(cache_name=CACHE_NAME)
+                return self._snapshot
+            return await self._refresh()
+
+    def invalidate(self) -> None:
+        """Force a version check on next access (after a local sync)."""
+        self._checked_at = 0.0
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._checked_at < self._refresh_check_seconds
+
+    async def _refresh(self) -> SkillsSnapshot:
+        """Check the sync version and reload the skills if it changed."""
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    select(TurnoverITSkillsMetadataModel.last_synced_at).where(
+                        TurnoverITSkillsMetadataModel.id == 1
+                    )
+                )
+                version = result.scalar_one_or_none()
+
+                if (
+                    self._snapshot is not None
+                    and self._snapshot.loaded
+                    and self._snapshot.version == version
+                ):
+                    cache_hits_total.inc(cache_name=CACHE_NAME)
+                    self._checked_at = time.monotonic()
+                    return self._snapshot
+
+                result = await session.execute(
+                    select(TurnoverITSkillModel.name, TurnoverITSkillModel.slug).order_by(
+                        TurnoverITSkillModel.name
+                    )
+                )
+                skills = tuple({"name": name, "slug": slug} for name, slug in result.all())
+        except Exception as e:
+            # Table might not exist yet (migration not run) - keep serving what we have
+            logger.warning(f"Could not load Turnover-IT skills: {e}")
+            if self._snapshot is None:
+                self._snapshot = SkillsSnapshot.unavailable()
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+        cache_misses_total.inc(cache_name=CACHE_NAME)
+        self._snapshot = SkillsSnapshot(version=version, skills=skills)
+        self._checked_at = time.monotonic()
+        logger.info(f"Loaded {len(skills)} Turnover-IT skills (synced at {version})")
+        return self._snapshot
+
+
+@lru_cache
+def get_skills_store() -> TurnoverITSkillsStore:
+    """Get the process-wide Turnover-IT skills store."""
+    return TurnoverITSkillsStore(background_session_factory)
@@ -1,21 +1,30 @@
-"""CV Transformer infrastructure services."""
+"""CV Transformer infrastructure services.
 
-from app.infrastructure.cv_transformer.anthropic_client import AnthropicClient
-from app.infrastructure.cv_transformer.docx_generator import DocxGenerator
-from app.infrastructure.cv_transformer.extractors import (
-    DocxTextExtractor,
-    PdfTextExtractor,
-    extract_text_from_docx,
-    extract_text_from_pdf,
-)
-from app.infrastructure.cv_transformer.gemini_client import GeminiClient
+Exports are imported on first access: spawned CV extraction workers import
+this package to reach extraction_worker and must not load the settings or
+the LLM clients.
+"""
 
-__all__ = [
-    "AnthropicClient",
-    "DocxGenerator",
-    "DocxTextExtractor",
-    "extract_text_from_docx",
-    "extract_text_from_pdf",
-    "GeminiClient",
-    "PdfTextExtractor",
-]
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "AnthropicClient": "anthropic_client",
+    "CvTextExtractionService": "extraction_service",
+    "DocxGenerator": "docx_generator",
+    "DocxTextExtractor": "extractors",
+    "extract_text_from_docx": "extractors",
+    "extract_text_from_pdf": "extractors",
+    "GeminiClient": "gemini_client",
+    "get_cv_text_extraction_service": "extraction_service",
+    "PdfTextExtractor": "extractors",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
@@ -0,0 +1,244 @@
+"""CV text extraction off the event loop.
+
+PDF and DOCX parsing (pypdf page loop, python-docx XML walks) is CPU-bound
+and blocks the event loop for hundreds of milliseconds on large files.
+CvTextExtractionService runs it in a bounded worker pool with a per-document
+timeout and a per-worker memory limit, and records extraction metrics.
+Extracted texts are looked up by content hash first when a cache is set.
+Callers that only feed the text to size-limited consumers (LLM prompts)
+can pass a character budget so oversized PDFs stop being read early.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from functools import lru_cache
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import TYPE_CHECKING, Any, Literal
+from weakref import WeakSet
+
+from app.config import get_settings
+from app.infrastructure.cv_transformer.extraction_worker import init_worker
+from app.infrastructure.cv_transformer.extractors import (
+    ExtractedDocument,
+    content_hash,
+    extract_document,
+)
+from app.infrastructure.observability.metrics import (
+    cv_extraction_duration_seconds,
+    cv_extraction_failures_total,
+    cv_extraction_page_duration_seconds,
+)
+
+if TYPE_CHECKING:
+    from app.infrastructure.cv_transformer.text_cache import ExtractedTextCache
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("pdf", "docx")
+
+
+class _TrackedSpawnContext(SpawnContext):
+    """Spawn context remembering the worker processes it starts.
+
+    Lets the service terminate the workers of a pool whose task timed out
+    without reaching into ProcessPoolExecutor internals.
+    """
+
+    def __init__(self) -> None:
+        self.processes: WeakSet[SpawnProcess] = WeakSet()
+
+    def Process(self, *args: Any, **kwargs: Any) -> SpawnProcess:
+        process = SpawnProcess(*args, **kwargs)
+        self.processes.add(process)
+        return process
+
+
+class CvTextExtractionService:
+    """Asynchronous PDF/DOCX text extraction backed by a bounded worker pool.
+
+    With the "process" executor, workers are spawned (not forked) so the
+    memory limit applies to a small interpreter, and are recycled after
+    MAX_TASKS_PER_WORKER documents. A document exceeding the timeout has its
+    worker pool terminated, since a running extraction cannot be cancelled.
+    The "thread" executor only moves work off the event loop: no memory
+    limit, and timed-out extractions finish in the background.
+    """
+
+    MAX_TASKS_PER_WORKER = 50
+
+    def __init__(
+        self,
+        executor: Literal["process", "thread"] = "process",
+        max_workers: int = 2,
+        timeout_seconds: float = 30.0,
+        memory_limit_mb: int = 1024,
+        text_cache: "ExtractedTextCache | None" = None,
+    ) -> None:
+        self.executor = executor
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.text_cache = text_cache
+        self._pool: Executor | None = None
+        self._workers: _TrackedSpawnContext | None = None
+
+    async def extract_text(
+        self, content: bytes, filename: str, max_chars: int | None = None
+    ) -> str:
+        """Extract text from a PDF or DOCX file.
+
+        Args:
+            content: File content as bytes.
+            filename: Original filename to determine file type.
+            max_chars: Character budget (None extracts the full document).
+
+        Returns:
+            Extracted text, at most max_chars characters long.
+
+        Raises:
+            ValueError: If extraction fails, times out or file type is not supported.
+        """
+        document = await self.extract_document(content, filename, max_chars)
+        return document.text
+
+    async def extract_document(
+        self, content: bytes, filename: str, max_chars: int | None = None
+    ) -> ExtractedDocument:
+        """Extract text and page count from a PDF or DOCX file.
+
+        Only full extractions are cached; a cached full text also serves
+        budgeted requests.
+
+        Args:
+            content: File content as bytes.
+            filename: Original filename to determine file type.
+            max_chars: Character budget; PDF pages stop being read once it is
+                reached (None extracts the full document).
+
+        Returns:
+            Extracted document.
+
+        Raises:
+            ValueError: If extraction fails, times out or file type is not supported.
+        """
+        file_format = filename.lower().rsplit(".", 1)[-1]
+        if file_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Format de fichier non supporté: {filename}")
+
+        cache_key = None
+        if self.text_cache is not None:
+            cache_key = content_hash(content)
+            cached = await self.text_cache.get(cache_key)
+            if cached is not None:
+                if max_chars is not None and len(cached.text) > max_chars:
+                    return replace(cached, text=cached.text[:max_chars], truncated=True)
+                return cached
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            document = await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._get_pool(), extract_document, content, filename, max_chars
+                ),
+                timeout=self.timeout_seconds,
+            )
+        except TimeoutError:
+            logger.warning(f"CV extraction timed out after {self.timeout_seconds}s: {filename}")
+            cv_extraction_failures_total.inc(format=file_format, reason="timeout")
+            self._reset_pool()
+            raise ValueError(
+                f"L'extraction du texte a dépassé le délai de {self.timeout_seconds:.0f} secondes"
+            )
+        except MemoryError:
+            logger.warning(f"CV extraction exceeded memory limit: {filename}")
+            cv_extraction_failures_total.inc(format=file_format, reason="memory")
+            raise ValueError("Le document est trop volumineux pour être analysé")
+        except BrokenProcessPool:
+            logger.error(f"CV extraction worker crashed: {filename}")
+            cv_extraction_failures_total.inc(format=file_format, reason="crash")
+            self._reset_pool()
+            raise ValueError("Erreur lors de l'extraction du texte du document")
+        except ValueError:
+            cv_extraction_failures_total.inc(format=file_format, reason="invalid")
+            raise
+
+        duration = time.perf_counter() - start
+        cv_extraction_duration_seconds.observe(duration, format=file_format)
+        cv_extraction_page_duration_seconds.observe(
+            duration / max(document.page_count, 1), format=file_format
+        )
+        logger.debug(
+            f"Extracted {len(document.text)} chars from {document.page_count} page(s) "
+            f"of {filename} in {duration:.3f}s"
+            + (" (stopped at character budget)" if document.truncated else "")
+        )
+        if cache_key is not None and not document.truncated:
+            await self.text_cache.set(cache_key, document)
+        return document
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (idempotent)."""
+        pool, self._pool = self._pool, None
+        self._workers = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> Executor:
+        """Get or create the worker pool."""
+        if self._pool is None:
+            if self.executor == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="cv-extraction",
+                )
+            else:
+                self._workers = _TrackedSpawnContext()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._workers,
+                    initializer=init_worker,
+                    initargs=(self.memory_limit_mb,),
+                    max_tasks_per_child=self.MAX_TASKS_PER_WORKER,
+                )
+        return self._pool
+
+    def _reset_pool(self) -> None:
+        """Terminate the worker pool; a new one is created on next use."""
+        pool, self._pool = self._pool, None
+        workers, self._workers = self._workers, None
+        if workers is not None:
+            # A running task cannot be cancelled: terminate the pool workers
+            for process in list(workers.processes):
+                if process.is_alive():
+                    process.terminate()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache
+def get_cv_text_extraction_service() -> CvTextExtractionService:
+    """Get the process-wide CV text extraction service."""
+    settings = get_settings()
+
+    text_cache = None
+    if settings.CV_TEXT_CACHE_ENABLED:
+        # Imported lazily: keeps the database layer out of this module's imports
+        from app.infrastructure.cv_transformer.text_cache import ExtractedTextCache
+        from app.infrastructure.database.connection import async_session_factory
+
+        text_cache = ExtractedTextCache(
+            async_session_factory, ttl_days=settings.CV_TEXT_CACHE_TTL_DAYS
+        )
+
+    return CvTextExtractionService(
+        executor=settings.CV_EXTRACTION_EXECUTOR,
+        max_workers=settings.CV_EXTRACTION_MAX_WORKERS,
+        timeout_seconds=settings.CV_EXTRACTION_TIMEOUT_SECONDS,
+        memory_limit_mb=settings.CV_EXTRACTION_MEMORY_LIMIT_MB,
+        text_cache=text_cache,
+    )
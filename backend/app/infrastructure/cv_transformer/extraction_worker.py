@@ -0,0 +1,23 @@
+"""Initializer of the CV text extraction worker processes.
+
+Spawned workers import this module and extractors (which holds the task,
+extract_document) only: no settings, no metrics, no LLM clients. Keep this
+module free of app imports.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker(memory_limit_mb: int) -> None:
+    """Cap the address space of a pool worker process (POSIX only)."""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not set CV extraction worker memory limit: {e}")
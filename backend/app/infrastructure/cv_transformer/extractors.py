@@ -3,8 +3,11 @@
 Implements CvTextExtractorPort for dependency inversion.
 """
 
+import hashlib
 import io
 import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import BinaryIO
 
 from docx import Document
@@ -12,6 +15,9 @@ from pypdf import PdfReader
 
 logger = logging.getLogger(__name__)
 
+# Bump when extraction output changes, so cached texts are extracted again
+EXTRACTOR_VERSION = "1"
+
 # DOCX XML namespaces for text box extraction
 _WPS_TXBX = "{http://schemas.microsoft.com/office/word/2010/wordprocessingShape}txbx"
 _VML_TEXTBOX = "{urn:schemas-microsoft-com:vml}textbox"
@@ -19,6 +25,24 @@ _W_P = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
 _W_T = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"
 
 
+@dataclass(frozen=True)
+class ExtractedDocument:
+    """Text extracted from a document.
+
+    page_count is the number of pages read (1 for DOCX). truncated is set
+    when extraction stopped at a character budget.
+    """
+
+    text: str
+    page_count: int
+    truncated: bool = False
+
+
+def content_hash(content: bytes) -> str:
+    """Compute the SHA-256 content hash used as extracted text cache key."""
+    return hashlib.sha256(content).hexdigest()
+
+
 class PdfTextExtractor:
     """PDF text extractor implementing CvTextExtractorPort."""
 
@@ -35,34 +59,62 @@ class DocxTextExtractor:
         return extract_text_from_docx(content)
 
 
-def extract_text_from_pdf(file_content: bytes | BinaryIO) -> str:
+def extract_text_from_pdf(file_content: bytes | BinaryIO, max_chars: int | None = None) -> str:
     """Extract text content from a PDF file.
 
     Args:
         file_content: PDF file content as bytes or file-like object.
+        max_chars: Stop reading pages once this many characters are extracted
+            (None extracts every page).
 
     Returns:
-        Extracted text from all pages.
+        Extracted text from all pages, or its first max_chars characters.
 
     Raises:
         ValueError: If the PDF cannot be read or is empty.
     """
+    return _read_pdf(file_content, max_chars).text
+
+
+def iter_pdf_pages(file_content: bytes | BinaryIO) -> Iterator[str]:
+    """Yield the text of each PDF page lazily, skipping pages without text.
+
+    Pages are only parsed when consumed, so callers can stop early.
+
+    Raises:
+        pypdf errors if the PDF cannot be read.
+    """
     if isinstance(file_content, bytes):
         file_content = io.BytesIO(file_content)
 
+    reader = PdfReader(file_content)
+    for page in reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            yield page_text
+
+
+def _read_pdf(file_content: bytes | BinaryIO, max_chars: int | None = None) -> ExtractedDocument:
+    """Extract text and page count from a PDF file, up to max_chars characters."""
     try:
-        reader = PdfReader(file_content)
-        text_parts = []
+        text_parts: list[str] = []
+        length = 0
+        truncated = False
 
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
+        for page_text in iter_pdf_pages(file_content):
+            text_parts.append(page_text)
+            length += len(page_text) + 2  # "\n\n" separator
+            if max_chars is not None and length >= max_chars:
+                truncated = True
+                break
 
         if not text_parts:
             raise ValueError("Le PDF ne contient pas de texte extractible")
 
-        return "\n\n".join(text_parts)
+        text = "\n\n".join(text_parts)
+        if max_chars is not None:
+            text = text[:max_chars]
+        return ExtractedDocument(text=text, page_count=len(text_parts), truncated=truncated)
     except Exception as e:
         if "texte extractible" in str(e):
             raise
@@ -79,14 +131,38 @@ def extract_text_from_bytes(content: bytes, filename: str) -> str:
     Returns:
         Extracted text.
 
+    Raises:
+        ValueError: If extraction fails or file type is not supported.
+    """
+    return extract_document(content, filename).text
+
+
+def extract_document(
+    content: bytes, filename: str, max_chars: int | None = None
+) -> ExtractedDocument:
+    """Extract text and page count from file content based on file extension.
+
+    Args:
+        content: File content as bytes.
+        filename: Original filename to determine file type.
+        max_chars: Character budget; PDF pages stop being read once reached
+            (None extracts the whole document).
+
+    Returns:
+        Extracted document.
+
     Raises:
         ValueError: If extraction fails or file type is not supported.
     """
     filename_lower = filename.lower()
     if filename_lower.endswith(".pdf"):
-        return extract_text_from_pdf(content)
+        return _read_pdf(content, max_chars)
     elif filename_lower.endswith(".docx"):
-        return extract_text_from_docx(content)
+        # python-docx parses the whole document upfront: only the output is cut
+        text = extract_text_from_docx(content)
+        if max_chars is not None and len(text) > max_chars:
+            return ExtractedDocument(text=text[:max_chars], page_count=1, truncated=True)
+        return ExtractedDocument(text=text, page_count=1)
     else:
         raise ValueError(f"Format de fichier non supporté: {filename}")
 
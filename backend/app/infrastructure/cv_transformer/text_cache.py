@@ -0,0 +1,68 @@
+"""Content-addressed cache of extracted CV text.
+
+The same CV bytes are extracted by several features (application form,
+CV transformer, CV generator). Texts are stored in Postgres keyed by the
+SHA-256 of the file content, together with the page count and the
+extractor version, so repeat conversions skip parsing entirely.
+
+Texts are CV content (personal data): a text unused for ttl_days is no
+longer served and is deleted by the next cache write.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.cv_transformer.extractors import EXTRACTOR_VERSION, ExtractedDocument
+from app.infrastructure.database.repositories import CvExtractedTextRepository
+from app.infrastructure.observability.metrics import cache_hits_total, cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "cv_extracted_text"
+
+
+class ExtractedTextCache:
+    """Postgres-backed extracted text store.
+
+    Uses its own short-lived sessions so it can be shared process-wide.
+    Cache errors are logged and never fail an extraction.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], ttl_days: int = 30
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl = timedelta(days=ttl_days)
+
+    async def get(self, key: str) -> ExtractedDocument | None:
+        """Get the cached extraction for a content hash, if any."""
+        try:
+            async with self._session_factory() as session:
+                document = await CvExtractedTextRepository(session).get(
+                    key, EXTRACTOR_VERSION, used_since=datetime.utcnow() - self._ttl
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Extracted text cache lookup failed: {e}")
+            return None
+
+        if document is None:
+            cache_misses_total.inc(cache_name=CACHE_NAME)
+        else:
+            cache_hits_total.inc(cache_name=CACHE_NAME)
+        return document
+
+    async def set(self, key: str, document: ExtractedDocument) -> None:
+        """Store the extraction of a content hash and purge expired texts."""
+        try:
+            async with self._session_factory() as session:
+                repository = CvExtractedTextRepository(session)
+                await repository.save(key, document, EXTRACTOR_VERSION)
+                purged = await repository.delete_unused_since(datetime.utcnow() - self._ttl)
+                await session.commit()
+            if purged:
+                logger.info(f"Purged {purged} expired extracted CV texts")
+        except Exception as e:
+            logger.warning(f"Extracted text cache write failed: {e}")
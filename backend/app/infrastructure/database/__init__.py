@@ -2,6 +2,7 @@
 
 from app.infrastructure.database.connection import (
     async_session_factory,
+    background_session_factory,
     engine,
     get_async_session,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "engine",
     "get_async_session",
     "async_session_factory",
+    "background_session_factory",
     # Models
     "Base",
     "UserModel",
@@ -1,18 +1,80 @@
-"""Database connection management."""
+"""Database connection management.
+
+Engine and pool settings come from Settings (DB_*). API request sessions
+run with DB_STATEMENT_TIMEOUT_MS, set once per connection on connect (no
+extra round-trip). Background sessions (batch generation, skills snapshot)
+raise it to DB_BACKGROUND_STATEMENT_TIMEOUT_MS for each transaction.
+
+A session holds a pooled connection from its first statement to the end of
+the transaction; that time is recorded per route (session.info["route"],
+set by the request dependency).
+"""
 
 import logging
+import time
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 
-from app.config import settings
+from app.config import Settings, settings
+from app.infrastructure.observability.metrics import (
+    db_connection_hold_seconds,
+    db_pool_checked_out,
+    db_pool_checkout_timeouts_total,
+    db_pool_checkout_wait_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording how long each checkout waited for a connection."""
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            db_pool_checkout_timeouts_total.inc()
+            raise
+        finally:
+            db_pool_checkout_wait_seconds.observe(time.perf_counter() - start)
+
+
+def engine_options(config: Settings) -> dict[str, Any]:
+    """Keyword arguments of create_async_engine for the configured database."""
+    options: dict[str, Any] = {"echo": config.DB_ECHO, "pool_pre_ping": config.DB_POOL_PRE_PING}
+    url = make_url(config.async_database_url)
+    if url.get_backend_name() != "postgresql":
+        return options
+
+    options.update(
+        poolclass=MeteredQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            # SQLAlchemy's prepared statement cache, then asyncpg's own
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS)},
+        }
+    return options
+
+
 # Log the database URL being used (masked for security)
 db_url = settings.async_database_url
 masked_url = (
@@ -22,13 +84,49 @@ masked_url = (
 )
 logger.info(f"Creating async engine with URL: {masked_url}")
 
-engine = create_async_engine(
-    db_url,
-    echo=settings.is_development,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+engine = create_async_engine(db_url, **engine_options(settings))
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    db_pool_checked_out.inc()
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _count_checkin(dbapi_connection, connection_record) -> None:
+    db_pool_checked_out.dec()
+
+
+_HOLD_STARTED = "connection_hold_started"
+
+
+@event.listens_for(Session, "after_begin")
+def _start_connection_hold(session, transaction, connection) -> None:
+    session.info.setdefault(_HOLD_STARTED, time.perf_counter())
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _end_connection_hold(session, transaction) -> None:
+    if transaction.parent is not None:
+        return
+    started = session.info.pop(_HOLD_STARTED, None)
+    if started is not None:
+        db_connection_hold_seconds.observe(
+            time.perf_counter() - started, route=session.info.get("route", "background")
+        )
+
+
+class BackgroundSession(Session):
+    """Session of background jobs, with their own statement timeout."""
+
+
+@event.listens_for(BackgroundSession, "after_begin")
+def _set_background_statement_timeout(session, transaction, connection) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(settings.DB_BACKGROUND_STATEMENT_TIMEOUT_MS)}"
+        )
+
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -37,6 +135,14 @@ async_session_factory = async_sessionmaker(
     autoflush=False,
 )
 
+background_session_factory = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=BackgroundSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session."""
@@ -255,6 +255,20 @@ class CvTransformationLogModel(Base):
     )
 
 
+class CvExtractedTextModel(Base):
+    """Extracted CV text cached by SHA-256 of the file content."""
+
+    __tablename__ = "cv_extracted_texts"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    page_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    extractor_version: Mapped[str] = mapped_column(String(20), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Texts unused for CV_TEXT_CACHE_TTL_DAYS are purged
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+
 class PublishedOpportunityModel(Base):
     """Published Opportunity database model for anonymized opportunities."""
 
@@ -377,9 +391,9 @@ class JobApplicationModel(Base):
 
     cv_s3_key: Mapped[str] = mapped_column(String(500), nullable=False)
     cv_filename: Mapped[str] = mapped_column(String(255), nullable=False)
-    cv_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     matching_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
     matching_details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    prescreen_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
     cv_quality_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     cv_quality: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     is_read: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
@@ -407,6 +421,23 @@ class JobApplicationModel(Base):
     )
 
 
+class ApplicationDocumentModel(Base):
+    """Extracted CV text of a job application, kept out of the job_applications rows."""
+
+    __tablename__ = "application_documents"
+
+    application_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("job_applications.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    cv_text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
 class TurnoverITSkillModel(Base):
     """Cached Turnover-IT skill model."""
 
@@ -1,6 +1,10 @@
 """Repository implementations for database access."""
 
-from app.infrastructure.database.repositories.base import BaseRepository
+from app.infrastructure.database.repositories.base import (
+    BaseRepository,
+    RowSnapshots,
+    upsert,
+)
 from app.infrastructure.database.repositories.business_lead_repository import (
     BusinessLeadRepository,
 )
@@ -8,8 +12,12 @@ from app.infrastructure.database.repositories.candidate_repository import (
     CandidateRepository,
 )
 from app.infrastructure.database.repositories.cooptation_repository import (
+    CooptationListRow,
     CooptationRepository,
 )
+from app.infrastructure.database.repositories.cv_extracted_text_repository import (
+    CvExtractedTextRepository,
+)
 from app.infrastructure.database.repositories.cv_template_repository import (
     CvTemplateRepository,
 )
@@ -24,26 +32,48 @@ from app.infrastructure.database.repositories.job_application_repository import
 )
 from app.infrastructure.database.repositories.job_posting_repository import (
     JobPostingRepository,
+    JobPostingSummary,
 )
 from app.infrastructure.database.repositories.opportunity_repository import (
     OpportunityRepository,
 )
+from app.infrastructure.database.repositories.pagination import (
+    InvalidCursorError,
+    Page,
+    SortKey,
+    fetch_page,
+)
 from app.infrastructure.database.repositories.published_opportunity_repository import (
     PublishedOpportunityRepository,
 )
+from app.infrastructure.database.repositories.turnoverit_skill_repository import (
+    SkillsMergeResult,
+    TurnoverITSkillRepository,
+)
 from app.infrastructure.database.repositories.user_repository import UserRepository
 
 __all__ = [
     "BaseRepository",
     "BusinessLeadRepository",
     "CandidateRepository",
+    "CooptationListRow",
     "CooptationRepository",
+    "CvExtractedTextRepository",
     "CvTemplateRepository",
     "CvTransformationLogRepository",
+    "InvalidCursorError",
     "InvitationRepository",
     "JobApplicationRepository",
     "JobPostingRepository",
+    "JobPostingSummary",
     "OpportunityRepository",
+    "Page",
     "PublishedOpportunityRepository",
+    "RowSnapshots",
+    "SkillsMergeResult",
+    "SortKey",
+    "TurnoverITSkillRepository",
     "UserRepository",
+    "fetch_page",
+    "upsert",
 ]
@@ -1,10 +1,13 @@
 """Base repository with common functionality."""
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Collection, Mapping
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Type variables for generic repository
@@ -64,3 +67,104 @@ class BaseRepository(ABC, Generic[TEntity, TModel]):
             select(func.count(self.model_class.id)).where(self.model_class.id == entity_id)
         )
         return (result.scalar() or 0) > 0
+
+
+class RowSnapshots:
+    """Column values of the rows a repository loaded, to save only what changed.
+
+    Values are deep copies: entities may mutate JSON values (lists, dicts)
+    shared with the model.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[Any, dict[str, Any]] = {}
+
+    def remember(self, model: Any) -> None:
+        """Remember the loaded column values of a model (deferred ones are skipped)."""
+        state = inspect(model)
+        columns = {column.key for column in state.mapper.column_attrs}
+        self._rows[state.identity or _identity(model.id)] = {
+            key: copy.deepcopy(value) for key, value in state.dict.items() if key in columns
+        }
+
+    def changes(self, row_id: Any, values: Mapping[str, Any]) -> dict[str, Any] | None:
+        """Values that differ from the loaded row, or None if the row was not loaded.
+
+        Columns that were not loaded (deferred) are left out: the entity
+        holds a placeholder for them, not the stored value.
+        """
+        loaded = self._rows.get(_identity(row_id))
+        if loaded is None:
+            return None
+        return {
+            key: value for key, value in values.items() if key in loaded and loaded[key] != value
+        }
+
+
+async def upsert(
+    session: AsyncSession,
+    model_class: type,
+    values: Mapping[str, Any],
+    snapshots: RowSnapshots | None = None,
+    on_update: Mapping[str, Any] | None = None,
+    insert_only: Collection[str] = ("created_at",),
+) -> Any:
+    """Insert or update a row by primary key in one statement.
+
+    When the row was loaded through snapshots, only the changed columns
+    (plus on_update, e.g. updated_at) are sent in an UPDATE; nothing is sent
+    when nothing changed. Otherwise an INSERT ... ON CONFLICT DO UPDATE
+    writes every column (insert_only columns keep their stored value).
+    The written row is returned (and refreshed in the session), None when
+    there was nothing to write.
+    """
+    primary_key = inspect(model_class).primary_key[0].key
+    row_id = values[primary_key]
+    changes = snapshots.changes(row_id, values) if snapshots else None
+
+    if changes is not None:
+        if not changes:
+            return None
+        statement = (
+            update(model_class)
+            .where(getattr(model_class, primary_key) == row_id)
+            .values({**changes, **(on_update or {})})
+            .returning(model_class)
+        )
+        result = await session.execute(statement, execution_options=_REFRESH)
+        model = result.scalar_one_or_none()
+        if model is not None:
+            snapshots.remember(model)
+            return model
+        # Deleted since it was loaded: insert it again
+
+    excluded = {primary_key, *insert_only}
+    insert = _INSERTS.get(_dialect_name(session), postgresql.insert)
+    statement = insert(model_class).values(dict(values))
+    statement = statement.on_conflict_do_update(
+        index_elements=[primary_key],
+        set_={
+            **{key: statement.excluded[key] for key in values if key not in excluded},
+            **(on_update or {}),
+        },
+    ).returning(model_class)
+    result = await session.execute(statement, execution_options=_REFRESH)
+    model = result.scalar_one()
+    if snapshots is not None:
+        snapshots.remember(model)
+    return model
+
+
+# Refresh the instance of the written row if the session already holds it
+_REFRESH = {"populate_existing": True}
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _dialect_name(session: AsyncSession) -> str | None:
+    bind = session.bind
+    return bind.dialect.name if bind is not None else None
+
+
+def _identity(row_id: Any) -> tuple[Any, ...]:
+    return row_id if isinstance(row_id, tuple) else (row_id,)
@@ -1,15 +1,54 @@
 """Cooptation repository implementation."""
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.domain.entities import Candidate, Cooptation, Opportunity
 from app.domain.value_objects import CooptationStatus, Email, Phone
-from app.infrastructure.database.models import CandidateModel, CooptationModel
+from app.infrastructure.database.models import (
+    CandidateModel,
+    CooptationModel,
+    OpportunityModel,
+    UserModel,
+)
+from app.infrastructure.database.repositories.base import RowSnapshots, upsert
+from app.infrastructure.database.repositories.pagination import (
+    Page,
+    SortKey,
+    fetch_page,
+    is_page_column,
+)
+
+
+@dataclass(frozen=True)
+class CooptationListRow:
+    """Flat cooptation row of the cooptation lists, read without entity hydration."""
+
+    id: UUID
+    candidate_id: UUID
+    candidate_name: str
+    candidate_email: str
+    candidate_phone: str | None
+    candidate_daily_rate: float | None
+    candidate_cv_filename: str | None
+    candidate_note: str | None
+    opportunity_id: UUID
+    opportunity_title: str
+    opportunity_reference: str
+    status: str
+    submitter_id: UUID
+    submitter_name: str | None
+    external_positioning_id: str | None
+    rejection_reason: str | None
+    status_history: list[dict[str, Any]]
+    submitted_at: datetime
+    updated_at: datetime
 
 
 class CooptationRepository:
@@ -17,6 +56,7 @@ class CooptationRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self._snapshots = RowSnapshots()
 
     async def get_by_id(self, cooptation_id: UUID) -> Cooptation | None:
         """Get cooptation by ID with related entities."""
@@ -53,52 +93,23 @@ class CooptationRepository:
         return self._to_entity(model) if model else None
 
     async def save(self, cooptation: Cooptation) -> Cooptation:
-        """Save cooptation (create or update)."""
-        result = await self.session.execute(
-            select(CooptationModel).where(CooptationModel.id == cooptation.id)
-        )
-        model = result.scalar_one_or_none()
-
-        # Convert status history to JSON-serializable format
-        status_history = [
-            {
-                "from_status": str(sh.from_status),
-                "to_status": str(sh.to_status),
-                "changed_at": sh.changed_at.isoformat(),
-                "changed_by": str(sh.changed_by) if sh.changed_by else None,
-                "comment": sh.comment,
-            }
-            for sh in cooptation.status_history
-        ]
+        """Save cooptation (create or update) in one statement.
 
+        A cooptation loaded by this repository only sends its changed columns
+        (see upsert). The saved entity is returned as is (its candidate and
+        opportunity are not written here), with the stored updated_at.
+        """
+        model = await upsert(
+            self.session,
+            CooptationModel,
+            self._to_values(cooptation),
+            self._snapshots,
+            on_update={"updated_at": datetime.utcnow()},
+            insert_only=("submitted_at",),
+        )
         if model:
-            model.candidate_id = cooptation.candidate.id
-            model.opportunity_id = cooptation.opportunity.id
-            model.submitter_id = cooptation.submitter_id
-            model.status = str(cooptation.status)
-            model.external_positioning_id = cooptation.external_positioning_id
-            model.status_history = status_history
-            model.rejection_reason = cooptation.rejection_reason
-            model.updated_at = datetime.utcnow()
-        else:
-            model = CooptationModel(
-                id=cooptation.id,
-                candidate_id=cooptation.candidate.id,
-                opportunity_id=cooptation.opportunity.id,
-                submitter_id=cooptation.submitter_id,
-                status=str(cooptation.status),
-                external_positioning_id=cooptation.external_positioning_id,
-                status_history=status_history,
-                rejection_reason=cooptation.rejection_reason,
-                submitted_at=cooptation.submitted_at,
-                updated_at=cooptation.updated_at,
-            )
-            self.session.add(model)
-
-        await self.session.flush()
-
-        # Reload with relationships
-        return await self.get_by_id(cooptation.id)  # type: ignore
+            cooptation.updated_at = model.updated_at
+        return cooptation
 
     async def delete(self, cooptation_id: UUID) -> bool:
         """Delete cooptation by ID."""
@@ -199,6 +210,87 @@ class CooptationRepository:
         result = await self.session.execute(query)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def list_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        submitter_id: UUID | None = None,
+        status: CooptationStatus | None = None,
+        opportunity_id: UUID | None = None,
+        cursor: str | None = None,
+    ) -> Page[CooptationListRow]:
+        """List a page of cooptations as flat rows, with the filtered total.
+
+        Candidate, opportunity and submitter columns are joined and the total
+        comes from COUNT(*) OVER (), so the page costs one round-trip whatever
+        its size. With a cursor (next_cursor of the previous page), the page
+        is read after the cursor row instead of at skip, plus a separate count.
+
+        Raises:
+            InvalidCursorError: If the cursor was not made by this list.
+        """
+        query = (
+            select(
+                CooptationModel.id,
+                CooptationModel.candidate_id,
+                (CandidateModel.first_name + " " + CandidateModel.last_name).label(
+                    "candidate_name"
+                ),
+                CandidateModel.email.label("candidate_email"),
+                CandidateModel.phone.label("candidate_phone"),
+                CandidateModel.daily_rate.label("candidate_daily_rate"),
+                CandidateModel.cv_filename.label("candidate_cv_filename"),
+                CandidateModel.note.label("candidate_note"),
+                CooptationModel.opportunity_id,
+                OpportunityModel.title.label("opportunity_title"),
+                OpportunityModel.reference.label("opportunity_reference"),
+                CooptationModel.status,
+                CooptationModel.submitter_id,
+                (UserModel.first_name + " " + UserModel.last_name).label("submitter_name"),
+                CooptationModel.external_positioning_id,
+                CooptationModel.rejection_reason,
+                CooptationModel.status_history,
+                CooptationModel.submitted_at,
+                CooptationModel.updated_at,
+            )
+            .join(CandidateModel, CandidateModel.id == CooptationModel.candidate_id)
+            .join(OpportunityModel, OpportunityModel.id == CooptationModel.opportunity_id)
+            .outerjoin(UserModel, UserModel.id == CooptationModel.submitter_id)
+            .where(*self._list_filters(submitter_id, status, opportunity_id))
+        )
+        keys = [
+            SortKey(CooptationModel.submitted_at, nullable=False),
+            SortKey(CooptationModel.id, nullable=False),
+        ]
+        page = await fetch_page(self.session, query, skip, limit, keys=keys, cursor=cursor)
+        return Page(
+            items=[self._to_list_row(row) for row in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
+    @staticmethod
+    def _to_list_row(row: Row[Any]) -> CooptationListRow:
+        """Convert a list_page row (minus the pagination columns) to a CooptationListRow."""
+        values = {key: value for key, value in row._mapping.items() if not is_page_column(key)}
+        values["status_history"] = values["status_history"] or []
+        return CooptationListRow(**values)
+
+    @staticmethod
+    def _list_filters(
+        submitter_id: UUID | None,
+        status: CooptationStatus | None,
+        opportunity_id: UUID | None,
+    ) -> list[ColumnElement[bool]]:
+        filters = []
+        if submitter_id:
+            filters.append(CooptationModel.submitter_id == submitter_id)
+        if status:
+            filters.append(CooptationModel.status == str(status))
+        if opportunity_id:
+            filters.append(CooptationModel.opportunity_id == opportunity_id)
+        return filters
+
     async def count_by_submitter(self, submitter_id: UUID) -> int:
         """Count cooptations by submitter."""
         result = await self.session.execute(
@@ -236,6 +328,8 @@ class CooptationRepository:
         """Convert model to entity."""
         from app.domain.entities.cooptation import StatusChange
 
+        self._snapshots.remember(model)
+
         # Convert candidate
         candidate = Candidate(
             id=model.candidate.id,
@@ -303,3 +397,27 @@ class CooptationRepository:
             submitted_at=model.submitted_at,
             updated_at=model.updated_at,
         )
+
+    def _to_values(self, cooptation: Cooptation) -> dict[str, Any]:
+        """Column values of a cooptation (status history as JSON)."""
+        return {
+            "id": cooptation.id,
+            "candidate_id": cooptation.candidate.id,
+            "opportunity_id": cooptation.opportunity.id,
+            "submitter_id": cooptation.submitter_id,
+            "status": str(cooptation.status),
+            "external_positioning_id": cooptation.external_positioning_id,
+            "status_history": [
+                {
+                    "from_status": str(sh.from_status),
+                    "to_status": str(sh.to_status),
+                    "changed_at": sh.changed_at.isoformat(),
+                    "changed_by": str(sh.changed_by) if sh.changed_by else None,
+                    "comment": sh.comment,
+                }
+                for sh in cooptation.status_history
+            ],
+            "rejection_reason": cooptation.rejection_reason,
+            "submitted_at": cooptation.submitted_at,
+            "updated_at": cooptation.updated_at,
+        }
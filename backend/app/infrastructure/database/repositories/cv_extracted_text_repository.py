@@ -0,0 +1,65 @@
+"""CV extracted text repository implementation."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cv_transformer.extractors import ExtractedDocument
+from app.infrastructure.database.models import CvExtractedTextModel
+
+
+class CvExtractedTextRepository:
+    """Content-addressed store of extracted CV text."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(
+        self, content_hash: str, extractor_version: str, used_since: datetime
+    ) -> ExtractedDocument | None:
+        """Get extracted text by content hash and mark it used.
+
+        Texts of other extractor versions or last used before used_since
+        are ignored.
+        """
+        result = await self.session.execute(
+            select(CvExtractedTextModel.text, CvExtractedTextModel.page_count).where(
+                CvExtractedTextModel.content_hash == content_hash,
+                CvExtractedTextModel.extractor_version == extractor_version,
+                CvExtractedTextModel.last_used_at >= used_since,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        await self.session.execute(
+            update(CvExtractedTextModel)
+            .where(CvExtractedTextModel.content_hash == content_hash)
+            .values(last_used_at=datetime.utcnow())
+        )
+        return ExtractedDocument(text=row.text, page_count=row.page_count)
+
+    async def save(
+        self, content_hash: str, document: ExtractedDocument, extractor_version: str
+    ) -> None:
+        """Insert or replace extracted text for a content hash."""
+        values = {
+            "text": document.text,
+            "page_count": document.page_count,
+            "extractor_version": extractor_version,
+            "created_at": datetime.utcnow(),
+            "last_used_at": datetime.utcnow(),
+        }
+        stmt = insert(CvExtractedTextModel).values(content_hash=content_hash, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=["content_hash"], set_=values)
+        await self.session.execute(stmt)
+        await self.session.flush()
+
+    async def delete_unused_since(self, cutoff: datetime) -> int:
+        """Delete texts last used before cutoff. Returns the number deleted."""
+        result = await self.session.execute(
+            delete(CvExtractedTextModel).where(CvExtractedTextModel.last_used_at < cutoff)
+        )
+        return result.rowcount
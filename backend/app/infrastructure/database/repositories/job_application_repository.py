@@ -1,13 +1,36 @@
 """Job Application repository implementation."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.domain.entities import ApplicationStatus, JobApplication
-from app.infrastructure.database.models import JobApplicationModel
+from app.infrastructure.database.models import ApplicationDocumentModel, JobApplicationModel
+from app.infrastructure.database.repositories.base import RowSnapshots, upsert
+from app.infrastructure.database.repositories.pagination import Page, SortKey, fetch_page
+
+# Sort expressions of the posting applications list. Each one is indexed as
+# (job_posting_id, <expression> DESC NULLS LAST, created_at DESC, id DESC)
+# by migration 029: an expression index is only used for the exact same
+# expression, so keep both definitions identical.
+POSTING_SORT_EXPRESSIONS = {
+    "score": JobApplicationModel.matching_score,
+    # Local provisional score (available even without LLM scoring)
+    "prescreen": JobApplicationModel.prescreen_score,
+    # Desired rate, fallback to current rate
+    "tjm": func.coalesce(JobApplicationModel.tjm_desired, JobApplicationModel.tjm_current),
+    # Desired salary, fallback to current salary
+    "salary": func.coalesce(JobApplicationModel.salary_desired, JobApplicationModel.salary_current),
+}
+
+# Columns the HR list does not display. List reads defer them; get_by_id
+# loads them for the detail. The CV text is not a column: it lives in
+# application_documents and is read with get_cv_text / get_cv_texts.
+LIST_DEFERRED_COLUMNS = (JobApplicationModel.status_history,)
 
 
 class JobApplicationRepository:
@@ -15,6 +38,7 @@ class JobApplicationRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self._snapshots = RowSnapshots()
 
     async def get_by_id(self, application_id: UUID) -> JobApplication | None:
         """Get job application by ID."""
@@ -55,90 +79,31 @@ class JobApplicationRepository:
         return count > 0
 
     async def save(self, application: JobApplication) -> JobApplication:
-        """Save job application (create or update)."""
-        result = await self.session.execute(
-            select(JobApplicationModel).where(JobApplicationModel.id == application.id)
-        )
-        model = result.scalar_one_or_none()
+        """Save job application (create or update) in one statement.
 
-        if model:
-            model.job_posting_id = application.job_posting_id
-            model.first_name = application.first_name
-            model.last_name = application.last_name
-            model.email = application.email
-            model.phone = application.phone
-            model.job_title = application.job_title
-            model.civility = application.civility
-            # New fields
-            model.availability = application.availability
-            model.employment_status = application.employment_status
-            model.english_level = application.english_level
-            model.tjm_current = application.tjm_current
-            model.tjm_desired = application.tjm_desired
-            model.salary_current = application.salary_current
-            model.salary_desired = application.salary_desired
-            # Legacy fields
-            model.tjm_min = application.tjm_min
-            model.tjm_max = application.tjm_max
-            model.availability_date = application.availability_date
-            model.cv_s3_key = application.cv_s3_key
-            model.cv_filename = application.cv_filename
-            model.cv_text = application.cv_text
-            model.matching_score = application.matching_score
-            model.matching_details = application.matching_details
-            model.cv_quality_score = application.cv_quality_score
-            model.cv_quality = application.cv_quality
-            model.is_read = application.is_read
-            model.status = str(application.status)
-            model.status_history = application.status_history
-            model.notes = application.notes
-            model.boond_candidate_id = application.boond_candidate_id
-            model.boond_sync_error = application.boond_sync_error
-            model.boond_synced_at = application.boond_synced_at
-            model.updated_at = datetime.utcnow()
-        else:
-            model = JobApplicationModel(
-                id=application.id,
-                job_posting_id=application.job_posting_id,
-                first_name=application.first_name,
-                last_name=application.last_name,
-                email=application.email,
-                phone=application.phone,
-                job_title=application.job_title,
-                civility=application.civility,
-                # New fields
-                availability=application.availability,
-                employment_status=application.employment_status,
-                english_level=application.english_level,
-                tjm_current=application.tjm_current,
-                tjm_desired=application.tjm_desired,
-                salary_current=application.salary_current,
-                salary_desired=application.salary_desired,
-                # Legacy fields
-                tjm_min=application.tjm_min,
-                tjm_max=application.tjm_max,
-                availability_date=application.availability_date,
-                cv_s3_key=application.cv_s3_key,
-                cv_filename=application.cv_filename,
-                cv_text=application.cv_text,
-                matching_score=application.matching_score,
-                matching_details=application.matching_details,
-                cv_quality_score=application.cv_quality_score,
-                cv_quality=application.cv_quality,
-                is_read=application.is_read,
-                status=str(application.status),
-                status_history=application.status_history,
-                notes=application.notes,
-                boond_candidate_id=application.boond_candidate_id,
-                boond_sync_error=application.boond_sync_error,
-                boond_synced_at=application.boond_synced_at,
-                created_at=application.created_at,
-                updated_at=application.updated_at,
+        An application loaded by this repository only sends its changed
+        columns (see upsert). The CV text is written to application_documents
+        when the entity carries one; None leaves the stored text unchanged
+        (not loaded).
+        """
+        model = await upsert(
+            self.session,
+            JobApplicationModel,
+            self._to_values(application),
+            self._snapshots,
+            on_update={"updated_at": datetime.utcnow()},
+        )
+        if application.cv_text is not None:
+            await upsert(
+                self.session,
+                ApplicationDocumentModel,
+                {
+                    "application_id": application.id,
+                    "cv_text": application.cv_text,
+                    "updated_at": datetime.utcnow(),
+                },
             )
-            self.session.add(model)
-
-        await self.session.flush()
-        return self._to_entity(model)
+        return self._to_entity(model, cv_text=application.cv_text) if model else application
 
     async def delete(self, application_id: UUID) -> bool:
         """Delete job application by ID."""
@@ -159,7 +124,7 @@ class JobApplicationRepository:
         status: ApplicationStatus | None = None,
         employment_status: str | None = None,
         availability: str | None = None,
-        sort_by: str = "score",  # score, tjm, salary, date
+        sort_by: str = "score",  # score, prescreen, tjm, salary, date
         sort_order: str = "desc",  # asc, desc
     ) -> list[JobApplication]:
         """List applications for a job posting with optional filters and sorting.
@@ -171,9 +136,82 @@ class JobApplicationRepository:
             status: Filter by application status
             employment_status: Filter by employment status (freelance, employee, both)
             availability: Filter by availability (asap, 1_month, 2_months, 3_months, more_3_months)
-            sort_by: Sort field (score, tjm, salary, date)
+            sort_by: Sort field (score, prescreen, tjm, salary, date)
             sort_order: Sort direction (asc, desc)
         """
+        keys = self._posting_sort_keys(sort_by, sort_order)
+        query = self._posting_query(posting_id, status, employment_status, availability)
+        query = query.order_by(*(key.order_by() for key in keys)).offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def list_pending_analysis(self, posting_id: UUID, limit: int) -> list[JobApplication]:
+        """List the best pre-scored applications of a posting awaiting AI matching.
+
+        Only applications without matching score and with a CV text are
+        returned, so analysed ones never hide the next pending ones.
+        """
+        keys = self._posting_sort_keys("prescreen", "desc")
+        query = (
+            self._posting_query(posting_id, None, None, None)
+            .where(
+                JobApplicationModel.matching_score.is_(None),
+                select(ApplicationDocumentModel.application_id)
+                .where(ApplicationDocumentModel.application_id == JobApplicationModel.id)
+                .exists(),
+            )
+            .order_by(*(key.order_by() for key in keys))
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def list_page_by_posting(
+        self,
+        posting_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        status: ApplicationStatus | None = None,
+        employment_status: str | None = None,
+        availability: str | None = None,
+        sort_by: str = "score",
+        sort_order: str = "desc",
+        cursor: str | None = None,
+    ) -> Page[JobApplication]:
+        """List a page of applications with its filtered total and the posting stats.
+
+        Same filters and sorting as list_by_posting. Two round-trips: the page
+        with the filtered total (COUNT(*) OVER ()), then the per-status counts
+        of all the posting applications. With a cursor (next_cursor of the
+        previous page), the page is read after the cursor row instead of at
+        skip, plus a separate count.
+
+        The applications are summaries: status_history is not loaded (see
+        LIST_DEFERRED_COLUMNS), read it with get_by_id, and do not save them.
+
+        Raises:
+            InvalidCursorError: If the cursor does not match this sort.
+        """
+        query = self._posting_query(posting_id, status, employment_status, availability)
+        query = query.options(*(defer(column) for column in LIST_DEFERRED_COLUMNS))
+        keys = self._posting_sort_keys(sort_by, sort_order)
+        page = await fetch_page(self.session, query, skip, limit, keys=keys, cursor=cursor)
+        stats = await self.get_stats_by_posting(posting_id)
+        return Page(
+            items=[self._to_entity(row[0]) for row in page.items],
+            total=page.total,
+            stats=stats,
+            next_cursor=page.next_cursor,
+        )
+
+    def _posting_query(
+        self,
+        posting_id: UUID,
+        status: ApplicationStatus | None,
+        employment_status: str | None,
+        availability: str | None,
+    ) -> Select[tuple[JobApplicationModel]]:
+        """Build the filtered applications query of a posting."""
         query = select(JobApplicationModel).where(JobApplicationModel.job_posting_id == posting_id)
         if status:
             query = query.where(JobApplicationModel.status == str(status))
@@ -183,53 +221,26 @@ class JobApplicationRepository:
             query = query.where(JobApplicationModel.employment_status.contains(employment_status))
         if availability:
             query = query.where(JobApplicationModel.availability == availability)
+        return query
 
-        # Build sort expression
-        if sort_by == "tjm":
-            # Sort by tjm_desired, fallback to tjm_current
-            sort_col = func.coalesce(
-                JobApplicationModel.tjm_desired,
-                JobApplicationModel.tjm_current,
-            )
-        elif sort_by == "salary":
-            # Sort by salary_desired, fallback to salary_current
-            sort_col = func.coalesce(
-                JobApplicationModel.salary_desired,
-                JobApplicationModel.salary_current,
-            )
-        elif sort_by == "date":
-            sort_col = JobApplicationModel.created_at
-        else:
-            # Default: sort by score
-            sort_col = JobApplicationModel.matching_score
-
-        # Apply sort order
-        if sort_order == "asc":
-            if sort_by == "score":
-                query = query.order_by(
-                    sort_col.asc().nullslast(),
-                    JobApplicationModel.created_at.desc(),
-                )
-            else:
-                query = query.order_by(
-                    sort_col.asc().nullslast(),
-                    JobApplicationModel.created_at.desc(),
-                )
-        else:
-            if sort_by == "score":
-                query = query.order_by(
-                    sort_col.desc().nullslast(),
-                    JobApplicationModel.created_at.desc(),
-                )
-            else:
-                query = query.order_by(
-                    sort_col.desc().nullslast(),
-                    JobApplicationModel.created_at.desc(),
-                )
-
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return [self._to_entity(m) for m in result.scalars().all()]
+    def _posting_sort_keys(self, sort_by: str, sort_order: str) -> list[SortKey]:
+        """Sort keys of a posting applications list (ties: newest first, then id).
+
+        Descending sorts (the default) match the migration 029 indexes;
+        ascending sorts are read through the job_posting_id prefix and sorted.
+        """
+        descending = sort_order != "asc"
+        if sort_by == "date":
+            return [
+                SortKey(JobApplicationModel.created_at, descending, nullable=False),
+                SortKey(JobApplicationModel.id, descending, nullable=False),
+            ]
+        sort_col = POSTING_SORT_EXPRESSIONS.get(sort_by, POSTING_SORT_EXPRESSIONS["score"])
+        return [
+            SortKey(sort_col, descending),
+            SortKey(JobApplicationModel.created_at, nullable=False),
+            SortKey(JobApplicationModel.id, nullable=False),
+        ]
 
     async def list_all(
         self,
@@ -237,14 +248,43 @@ class JobApplicationRepository:
         limit: int = 100,
         status: ApplicationStatus | None = None,
     ) -> list[JobApplication]:
-        """List all applications with optional status filter."""
-        query = select(JobApplicationModel)
+        """List all applications with optional status filter.
+
+        Summaries only, like list_page_by_posting (status_history is not
+        loaded).
+        """
+        query = select(JobApplicationModel).options(
+            *(defer(column) for column in LIST_DEFERRED_COLUMNS)
+        )
         if status:
             query = query.where(JobApplicationModel.status == str(status))
         query = query.offset(skip).limit(limit).order_by(JobApplicationModel.created_at.desc())
         result = await self.session.execute(query)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def get_cv_text(self, application_id: UUID) -> str | None:
+        """Get the extracted CV text of an application (not loaded with the entity)."""
+        result = await self.session.execute(
+            select(ApplicationDocumentModel.cv_text).where(
+                ApplicationDocumentModel.application_id == application_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_cv_texts(self, application_ids: list[UUID]) -> dict[UUID, str]:
+        """Get the extracted CV text of applications, by application ID.
+
+        Applications without CV text are absent from the result.
+        """
+        if not application_ids:
+            return {}
+        result = await self.session.execute(
+            select(ApplicationDocumentModel.application_id, ApplicationDocumentModel.cv_text).where(
+                ApplicationDocumentModel.application_id.in_(application_ids)
+            )
+        )
+        return dict(result.all())
+
     async def count_by_posting(
         self,
         posting_id: UUID,
@@ -267,6 +307,19 @@ class JobApplicationRepository:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
+    async def count_prescreened_above(self, posting_id: UUID, prescreen_score: int) -> int:
+        """Count applications of a posting with a strictly higher pre-score.
+
+        Used to know the rank of a new application among existing ones.
+        """
+        result = await self.session.execute(
+            select(func.count(JobApplicationModel.id)).where(
+                JobApplicationModel.job_posting_id == posting_id,
+                JobApplicationModel.prescreen_score > prescreen_score,
+            )
+        )
+        return result.scalar() or 0
+
     async def count_unread_by_posting(self, posting_id: UUID) -> int:
         """Count unread applications for a job posting."""
         result = await self.session.execute(
@@ -279,34 +332,49 @@ class JobApplicationRepository:
 
     async def get_stats_by_posting(self, posting_id: UUID) -> dict[str, int]:
         """Get application statistics for a job posting (by status and read state)."""
-        # Get counts by status
+        stats_by_posting = await self.get_stats_by_postings([posting_id])
+        return stats_by_posting[posting_id]
+
+    async def get_stats_by_postings(self, posting_ids: list[UUID]) -> dict[UUID, dict[str, int]]:
+        """Get application statistics for several job postings in one grouped query.
+
+        Returns:
+            Dict mapping posting_id -> counts by status, plus "unread" and "total"
+            (every requested posting is present, with zero counts if needed).
+        """
+        stats_by_posting = {
+            posting_id: {str(s): 0 for s in ApplicationStatus} | {"unread": 0, "total": 0}
+            for posting_id in posting_ids
+        }
+        if not posting_ids:
+            return stats_by_posting
+
         result = await self.session.execute(
             select(
+                JobApplicationModel.job_posting_id,
                 JobApplicationModel.status,
                 func.count(JobApplicationModel.id),
+                func.count(JobApplicationModel.id).filter(JobApplicationModel.is_read.is_(False)),
             )
-            .where(JobApplicationModel.job_posting_id == posting_id)
-            .group_by(JobApplicationModel.status)
+            .where(JobApplicationModel.job_posting_id.in_(posting_ids))
+            .group_by(JobApplicationModel.job_posting_id, JobApplicationModel.status)
         )
-        stats = {str(s): 0 for s in ApplicationStatus}
-        for status, count in result.all():
+        for posting_id, status, count, unread in result.all():
+            stats = stats_by_posting[posting_id]
             stats[status] = count
+            stats["unread"] += unread
+            stats["total"] += count
+        return stats_by_posting
 
-        # Get unread count
-        unread_result = await self.session.execute(
-            select(func.count(JobApplicationModel.id)).where(
-                JobApplicationModel.job_posting_id == posting_id,
-                JobApplicationModel.is_read == False,  # noqa: E712
-            )
-        )
-        stats["unread"] = unread_result.scalar() or 0
-
-        # Add total count
-        stats["total"] = sum(v for k, v in stats.items() if k != "unread")
-        return stats
+    def _to_entity(self, model: JobApplicationModel, cv_text: str | None = None) -> JobApplication:
+        """Convert model to entity (deferred columns are left empty).
 
-    def _to_entity(self, model: JobApplicationModel) -> JobApplication:
-        """Convert model to entity."""
+        cv_text is None unless given: the CV text is stored apart and read
+        on demand with get_cv_text. The loaded values are remembered so that
+        save() only writes what changed.
+        """
+        self._snapshots.remember(model)
+        unloaded = inspect(model).unloaded
         return JobApplication(
             id=model.id,
             job_posting_id=model.job_posting_id,
@@ -330,14 +398,15 @@ class JobApplicationRepository:
             availability_date=model.availability_date,
             cv_s3_key=model.cv_s3_key,
             cv_filename=model.cv_filename,
-            cv_text=model.cv_text,
+            cv_text=cv_text,
             matching_score=model.matching_score,
             matching_details=model.matching_details,
+            prescreen_score=model.prescreen_score,
             cv_quality_score=model.cv_quality_score,
             cv_quality=model.cv_quality,
             is_read=model.is_read if hasattr(model, "is_read") else False,
             status=ApplicationStatus(model.status),
-            status_history=model.status_history or [],
+            status_history=[] if "status_history" in unloaded else model.status_history or [],
             notes=model.notes,
             boond_candidate_id=model.boond_candidate_id,
             boond_sync_error=model.boond_sync_error,
@@ -345,3 +414,44 @@ class JobApplicationRepository:
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+
+    def _to_values(self, application: JobApplication) -> dict[str, Any]:
+        """Convert entity to column values."""
+        return {
+            "id": application.id,
+            "job_posting_id": application.job_posting_id,
+            "first_name": application.first_name,
+            "last_name": application.last_name,
+            "email": application.email,
+            "phone": application.phone,
+            "job_title": application.job_title,
+            "civility": application.civility,
+            # New fields
+            "availability": application.availability,
+            "employment_status": application.employment_status,
+            "english_level": application.english_level,
+            "tjm_current": application.tjm_current,
+            "tjm_desired": application.tjm_desired,
+            "salary_current": application.salary_current,
+            "salary_desired": application.salary_desired,
+            # Legacy fields
+            "tjm_min": application.tjm_min,
+            "tjm_max": application.tjm_max,
+            "availability_date": application.availability_date,
+            "cv_s3_key": application.cv_s3_key,
+            "cv_filename": application.cv_filename,
+            "matching_score": application.matching_score,
+            "matching_details": application.matching_details,
+            "prescreen_score": application.prescreen_score,
+            "cv_quality_score": application.cv_quality_score,
+            "cv_quality": application.cv_quality,
+            "is_read": application.is_read,
+            "status": str(application.status),
+            "status_history": application.status_history,
+            "notes": application.notes,
+            "boond_candidate_id": application.boond_candidate_id,
+            "boond_sync_error": application.boond_sync_error,
+            "boond_synced_at": application.boond_synced_at,
+            "created_at": application.created_at,
+            "updated_at": application.updated_at,
+        }
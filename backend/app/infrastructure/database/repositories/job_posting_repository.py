@@ -1,5 +1,6 @@
 """Job Posting repository implementation."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
@@ -7,7 +8,26 @@ from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities import JobPosting, JobPostingStatus
-from app.infrastructure.database.models import JobPostingModel, OpportunityModel
+from app.infrastructure.database.models import (
+    JobApplicationModel,
+    JobPostingModel,
+    OpportunityModel,
+    UserModel,
+)
+from app.infrastructure.database.repositories.pagination import Page, SortKey, fetch_page
+
+
+@dataclass(frozen=True)
+class JobPostingSummary:
+    """Job posting with the opportunity, creator and application counts of the HR list."""
+
+    posting: JobPosting
+    opportunity_title: str | None
+    opportunity_reference: str | None
+    client_name: str | None
+    created_by_name: str | None
+    applications_total: int
+    applications_unread: int
 
 
 class JobPostingRepository:
@@ -185,6 +205,84 @@ class JobPostingRepository:
         result = await self.session.execute(query)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def list_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: JobPostingStatus | None = None,
+        cursor: str | None = None,
+    ) -> Page[JobPostingSummary]:
+        """List job postings for the HR list, newest first.
+
+        The page ids and the filtered total are read first (keyset after the
+        cursor when given, otherwise OFFSET with COUNT(*) OVER ()), then the
+        page postings joined with their opportunity, their creator and the
+        application counts grouped over the page postings only.
+
+        Raises:
+            InvalidCursorError: If the cursor was not made by this list.
+        """
+        ids_query = select(JobPostingModel.id)
+        if status:
+            ids_query = ids_query.where(JobPostingModel.status == str(status))
+        keys = [
+            SortKey(JobPostingModel.created_at, nullable=False),
+            SortKey(JobPostingModel.id, nullable=False),
+        ]
+        page = await fetch_page(self.session, ids_query, skip, limit, keys=keys, cursor=cursor)
+        page_ids = [row[0] for row in page.items]
+        if not page_ids:
+            return Page(items=[], total=page.total)
+
+        stats = (
+            select(
+                JobApplicationModel.job_posting_id,
+                func.count(JobApplicationModel.id).label("total"),
+                func.count(JobApplicationModel.id)
+                .filter(JobApplicationModel.is_read.is_(False))
+                .label("unread"),
+            )
+            .where(JobApplicationModel.job_posting_id.in_(page_ids))
+            .group_by(JobApplicationModel.job_posting_id)
+            .subquery("stats")
+        )
+
+        result = await self.session.execute(
+            select(
+                JobPostingModel,
+                OpportunityModel.title,
+                OpportunityModel.reference,
+                OpportunityModel.client_name,
+                UserModel.first_name,
+                UserModel.last_name,
+                stats.c.total,
+                stats.c.unread,
+            )
+            .outerjoin(OpportunityModel, OpportunityModel.id == JobPostingModel.opportunity_id)
+            .outerjoin(UserModel, UserModel.id == JobPostingModel.created_by)
+            .outerjoin(stats, stats.c.job_posting_id == JobPostingModel.id)
+            .where(JobPostingModel.id.in_(page_ids))
+        )
+        summaries = {
+            model.id: JobPostingSummary(
+                posting=self._to_entity(model),
+                opportunity_title=title,
+                opportunity_reference=reference,
+                client_name=client_name,
+                created_by_name=f"{first_name} {last_name}" if first_name is not None else None,
+                applications_total=total or 0,
+                applications_unread=unread or 0,
+            )
+            for model, title, reference, client_name, first_name, last_name, total, unread in (
+                result.all()
+            )
+        }
+        return Page(
+            items=[summaries[posting_id] for posting_id in page_ids if posting_id in summaries],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
     async def list_published(
         self,
         skip: int = 0,
@@ -0,0 +1,254 @@
+"""Offset and keyset (cursor) pagination for list queries.
+
+Lists are ordered by sort keys ending with a unique column (the id), so a
+row position is fully described by its key values. A cursor encodes the
+key values of the last row of a page: the next page filters on the rows
+after it instead of skipping OFFSET rows, so deep pages cost the same as
+the first one when an index matches the keys. The filtered total is read
+with the first page and carried by the cursors, which are signed (HMAC
+with the server secret) so clients cannot forge key values or totals.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row, Select, and_, false, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+TItem = TypeVar("TItem")
+
+TOTAL_COUNT_COLUMN = "total_count"
+SORT_KEY_COLUMN_PREFIX = "sort_key_"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded for the list it is used on."""
+
+    def __init__(self) -> None:
+        super().__init__("Curseur de pagination invalide")
+
+
+@dataclass(frozen=True)
+class Page(Generic[TItem]):
+    """A page of a list query with the total of the filtered query.
+
+    stats holds counts by status when the list provides them (computed over
+    the unfiltered set, e.g. all applications of a posting). next_cursor is
+    set when the list is keyset-ordered and more rows follow.
+    """
+
+    items: list[TItem]
+    total: int
+    stats: dict[str, int] = field(default_factory=dict)
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY key of a keyset-paginated list (NULLS LAST)."""
+
+    expression: ColumnElement[Any]
+    descending: bool = True
+    nullable: bool = True
+
+    def order_by(self) -> ColumnElement[Any]:
+        direction = self.expression.desc() if self.descending else self.expression.asc()
+        return direction.nullslast() if self.nullable else direction
+
+    def after(self, value: Any) -> ColumnElement[bool]:
+        """Rows strictly after value in this key order."""
+        if value is None:
+            return false()  # NULLS LAST: nothing sorts after a null
+        after = self.expression < value if self.descending else self.expression > value
+        return or_(after, self.expression.is_(None)) if self.nullable else after
+
+    def equals(self, value: Any) -> ColumnElement[bool]:
+        return self.expression.is_(None) if value is None else self.expression == value
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows after the row whose key values are given, in the keys order."""
+    return or_(
+        *(
+            and_(
+                *(k.equals(v) for k, v in zip(keys[:i], values[:i], strict=True)), key.after(value)
+            )
+            for i, (key, value) in enumerate(zip(keys, values, strict=True))
+        )
+    )
+
+
+def keyset_ranges(keys: Sequence[SortKey], values: Sequence[Any]) -> list[ColumnElement[bool]]:
+    """Rows after the row whose key values are given, as ranges read in order.
+
+    When the keys share one direction and only the leading one is nullable,
+    each range is a row-value comparison the planner reads as an index range,
+    (k1, k2, id) < (:v1, :v2, :id), and the rows with a null leading key
+    (NULLS LAST) are a second range. A nullable leading key also gets a
+    redundant k1 <= :v1 bound. Other orderings use keyset_after.
+    """
+    lead = keys[0]
+    if any(key.descending != lead.descending or key.nullable for key in keys[1:]):
+        return [keyset_after(keys, values)]
+    if not lead.nullable:
+        return [_row_after(keys, values)]
+    if values[0] is None:
+        return [and_(lead.expression.is_(None), _row_after(keys[1:], values[1:]))]
+    bound = lead.expression <= values[0] if lead.descending else lead.expression >= values[0]
+    return [and_(bound, _row_after(keys, values)), lead.expression.is_(None)]
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any], total: int | None = None) -> str:
+    """Encode the key values of a row (and the list total) as an opaque URL-safe cursor."""
+    content = {"v": [_encode_value(v) for v in values], "t": total}
+    payload = {**content, "s": _signature(keys, content)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> tuple[list[Any], int | None]:
+    """Decode a cursor made by encode_cursor for the same keys.
+
+    Returns:
+        The key values and the total carried by the cursor (None if absent).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, was altered, or was
+            made for another ordering (e.g. the sort changed between two pages).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        content = {"v": payload["v"], "t": payload.get("t")}
+        signature = payload["s"]
+        if not isinstance(signature, str) or not hmac.compare_digest(
+            signature, _signature(keys, content)
+        ):
+            raise InvalidCursorError()
+        values = [_decode_value(v) for v in content["v"]]
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError):
+        raise InvalidCursorError() from None
+    if len(values) != len(keys):
+        raise InvalidCursorError()
+    return values, content["t"]
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select[Any],
+    skip: int,
+    limit: int,
+    keys: Sequence[SortKey] = (),
+    cursor: str | None = None,
+) -> Page[Row[Any]]:
+    """Run a list query with offset or cursor pagination.
+
+    Without cursor, the page is read with OFFSET/LIMIT and COUNT(*) OVER ()
+    gives the filtered total in the same round-trip; a separate COUNT is only
+    needed for an empty page past the first one. With a cursor, the page is
+    read after the cursor row (see keyset_ranges) and the total is the one
+    carried by the cursor: it is counted again only for cursors without it.
+
+    When keys are given they replace the query ordering, their values are
+    added as extra columns (sort_key_N) and next_cursor points after the
+    last row if more rows follow.
+    """
+    key_columns = [
+        key.expression.label(f"{SORT_KEY_COLUMN_PREFIX}{i}") for i, key in enumerate(keys)
+    ]
+    if keys:
+        query = query.order_by(None).order_by(*(key.order_by() for key in keys))
+
+    if cursor is None:
+        total_count = func.count().over().label(TOTAL_COUNT_COLUMN)
+        result = await session.execute(
+            query.add_columns(*key_columns, total_count).offset(skip).limit(limit)
+        )
+        rows = list(result.all())
+        if rows:
+            total = rows[0][-1]
+        elif skip == 0:
+            total = 0
+        else:
+            total = await _count(session, query)
+        has_more = skip + len(rows) < total
+    else:
+        values, total = decode_cursor(keys, cursor)
+        rows = []
+        for after in keyset_ranges(keys, values):
+            result = await session.execute(
+                query.add_columns(*key_columns).where(after).limit(limit + 1 - len(rows))
+            )
+            rows.extend(result.all())
+            if len(rows) > limit:
+                break
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if total is None:
+            total = await _count(session, query)
+
+    next_cursor = None
+    if keys and rows and has_more:
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(keys, [last[column.name] for column in key_columns], total)
+    return Page(items=rows, total=total, next_cursor=next_cursor)
+
+
+def is_page_column(name: str) -> bool:
+    """Whether a result column was added by fetch_page (total or sort key)."""
+    return name == TOTAL_COUNT_COLUMN or name.startswith(SORT_KEY_COLUMN_PREFIX)
+
+
+def _row_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows after values for non-null keys of one direction (row-value comparison)."""
+    if not keys:
+        return false()
+    left = tuple_(*(key.expression for key in keys))
+    right = tuple_(*values)
+    return left < right if keys[0].descending else left > right
+
+
+async def _count(session: AsyncSession, query: Select[Any]) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+    return result.scalar() or 0
+
+
+def _signature(keys: Sequence[SortKey], content: dict[str, Any]) -> str:
+    """HMAC of a cursor content and of the ordering it was made for."""
+    described = "|".join(f"{key.expression}:{key.descending}" for key in keys)
+    message = f"{described}\n{json.dumps(content, separators=(',', ':'))}".encode()
+    secret = hashlib.sha256(f"pagination-cursor:{settings.JWT_SECRET}".encode()).digest()
+    digest = hmac.new(secret, message, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        raise ValueError("unknown cursor value")
+    if value is not None and not isinstance(value, int | float | str):
+        raise ValueError("unknown cursor value")
+    return value
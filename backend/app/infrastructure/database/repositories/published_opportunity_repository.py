@@ -1,9 +1,10 @@
 """Published Opportunity repository implementation."""
 
 from datetime import date, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import Select, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities import PublishedOpportunity
@@ -13,6 +14,8 @@ from app.infrastructure.database.models import (
     OpportunityModel,
     PublishedOpportunityModel,
 )
+from app.infrastructure.database.repositories.base import RowSnapshots, upsert
+from app.infrastructure.database.repositories.pagination import Page, fetch_page
 
 
 class PublishedOpportunityRepository:
@@ -20,6 +23,7 @@ class PublishedOpportunityRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self._snapshots = RowSnapshots()
 
     async def get_by_id(self, opportunity_id: UUID) -> PublishedOpportunity | None:
         """Get published opportunity by ID."""
@@ -49,42 +53,15 @@ class PublishedOpportunityRepository:
         return (result.scalar() or 0) > 0
 
     async def save(self, opportunity: PublishedOpportunity) -> PublishedOpportunity:
-        """Save published opportunity (create or update)."""
-        result = await self.session.execute(
-            select(PublishedOpportunityModel).where(PublishedOpportunityModel.id == opportunity.id)
+        """Save published opportunity (create or update) in one statement."""
+        model = await upsert(
+            self.session,
+            PublishedOpportunityModel,
+            self._to_values(opportunity),
+            self._snapshots,
+            on_update={"updated_at": datetime.utcnow()},
         )
-        model = result.scalar_one_or_none()
-
-        if model:
-            model.boond_opportunity_id = opportunity.boond_opportunity_id
-            model.title = opportunity.title
-            model.description = opportunity.description
-            model.skills = opportunity.skills
-            model.original_title = opportunity.original_title
-            model.original_data = opportunity.original_data
-            model.end_date = opportunity.end_date
-            model.status = str(opportunity.status)
-            model.published_by = opportunity.published_by
-            model.updated_at = datetime.utcnow()
-        else:
-            model = PublishedOpportunityModel(
-                id=opportunity.id,
-                boond_opportunity_id=opportunity.boond_opportunity_id,
-                title=opportunity.title,
-                description=opportunity.description,
-                skills=opportunity.skills,
-                original_title=opportunity.original_title,
-                original_data=opportunity.original_data,
-                end_date=opportunity.end_date,
-                status=str(opportunity.status),
-                published_by=opportunity.published_by,
-                created_at=opportunity.created_at,
-                updated_at=opportunity.updated_at,
-            )
-            self.session.add(model)
-
-        await self.session.flush()
-        return self._to_entity(model)
+        return self._to_entity(model) if model else opportunity
 
     async def delete(self, opportunity_id: UUID) -> bool:
         """Delete published opportunity by ID."""
@@ -104,28 +81,29 @@ class PublishedOpportunityRepository:
         search: str | None = None,
     ) -> list[PublishedOpportunity]:
         """List published opportunities visible to consultants."""
-        query = select(PublishedOpportunityModel).where(
-            PublishedOpportunityModel.status == str(OpportunityStatus.PUBLISHED)
-        )
-
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    PublishedOpportunityModel.title.ilike(search_pattern),
-                    PublishedOpportunityModel.description.ilike(search_pattern),
-                )
-            )
-
-        query = (
-            query.offset(skip).limit(limit).order_by(PublishedOpportunityModel.created_at.desc())
-        )
+        query = self._published_query(search).offset(skip).limit(limit)
         result = await self.session.execute(query)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def list_published_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: str | None = None,
+    ) -> Page[PublishedOpportunity]:
+        """List a page of published opportunities with the filtered total (one round-trip)."""
+        page = await fetch_page(self.session, self._published_query(search), skip, limit)
+        return Page(items=[self._to_entity(row[0]) for row in page.items], total=page.total)
+
     async def count_published(self, search: str | None = None) -> int:
         """Count published opportunities."""
-        query = select(func.count(PublishedOpportunityModel.id)).where(
+        query = self._published_query(search).order_by(None)
+        result = await self.session.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar() or 0
+
+    def _published_query(self, search: str | None) -> Select[tuple[PublishedOpportunityModel]]:
+        """Build the published opportunities query, most recent first."""
+        query = select(PublishedOpportunityModel).where(
             PublishedOpportunityModel.status == str(OpportunityStatus.PUBLISHED)
         )
 
@@ -138,8 +116,7 @@ class PublishedOpportunityRepository:
                 )
             )
 
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+        return query.order_by(PublishedOpportunityModel.created_at.desc())
 
     async def list_by_publisher(
         self,
@@ -229,6 +206,7 @@ class PublishedOpportunityRepository:
 
     def _to_entity(self, model: PublishedOpportunityModel) -> PublishedOpportunity:
         """Convert model to entity."""
+        self._snapshots.remember(model)
         return PublishedOpportunity(
             id=model.id,
             boond_opportunity_id=model.boond_opportunity_id,
@@ -243,3 +221,20 @@ class PublishedOpportunityRepository:
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+
+    def _to_values(self, opportunity: PublishedOpportunity) -> dict[str, Any]:
+        """Column values of a published opportunity."""
+        return {
+            "id": opportunity.id,
+            "boond_opportunity_id": opportunity.boond_opportunity_id,
+            "title": opportunity.title,
+            "description": opportunity.description,
+            "skills": opportunity.skills,
+            "original_title": opportunity.original_title,
+            "original_data": opportunity.original_data,
+            "end_date": opportunity.end_date,
+            "status": str(opportunity.status),
+            "published_by": opportunity.published_by,
+            "created_at": opportunity.created_at,
+            "updated_at": opportunity.updated_at,
+        }
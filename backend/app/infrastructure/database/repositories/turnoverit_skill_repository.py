@@ -0,0 +1,118 @@
+"""Turnover-IT skills repository implementation."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import column, func, or_, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models import TurnoverITSkillModel, TurnoverITSkillsMetadataModel
+
+STAGING_TABLE = "turnoverit_skills_staging"
+
+_staging = table(STAGING_TABLE, column("name"), column("slug"))
+
+
+@dataclass(frozen=True)
+class SkillsMergeResult:
+    """Row counts of a skills merge."""
+
+    added: int
+    updated: int
+    removed: int
+    total: int
+
+
+class TurnoverITSkillRepository:
+    """Bulk maintenance of the cached Turnover-IT skills table.
+
+    A sync stages the fetched skills into a temporary table, then merges them
+    into turnoverit_skills in the same transaction, so readers keep seeing
+    the previous nomenclature until commit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def search(self, term: str, limit: int) -> list[dict[str, str]]:
+        """Autocomplete skills by name.
+
+        Matches names containing the term or similar to it (pg_trgm, served by
+        the ix_turnoverit_skills_name_trgm GIN index); prefix matches rank
+        first, then by trigram similarity.
+        """
+        term = term.lower().strip()
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        name = func.lower(TurnoverITSkillModel.name)
+        is_prefix = name.like(f"{escaped}%", escape="\\")
+
+        result = await self.session.execute(
+            select(TurnoverITSkillModel.name, TurnoverITSkillModel.slug)
+            .where(or_(name.like(f"%{escaped}%", escape="\\"), name.op("%")(term)))
+            .order_by(
+                is_prefix.desc(),
+                func.similarity(name, term).desc(),
+                TurnoverITSkillModel.name,
+            )
+            .limit(limit)
+        )
+        return [{"name": row.name, "slug": row.slug} for row in result.all()]
+
+    async def create_staging_table(self) -> None:
+        """Create the transaction-scoped staging table."""
+        await self.session.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {STAGING_TABLE} "
+                "(name VARCHAR(255) NOT NULL, slug VARCHAR(255) NOT NULL) ON COMMIT DROP"
+            )
+        )
+
+    async def stage(self, skills: list[dict[str, str]]) -> int:
+        """Stage skills (one executemany), skipping skills without slug."""
+        rows = [
+            {"name": skill["name"], "slug": skill["slug"]} for skill in skills if skill.get("slug")
+        ]
+        if rows:
+            await self.session.execute(_staging.insert(), rows)
+        return len(rows)
+
+    async def merge_staged(self) -> SkillsMergeResult:
+        """Upsert the staged skills and delete the skills missing from them."""
+        # xmax = 0 only for freshly inserted rows; unchanged names are not rewritten
+        result = await self.session.execute(
+            text(f"""
+                INSERT INTO turnoverit_skills (name, slug, created_at, updated_at)
+                SELECT DISTINCT ON (slug) name, slug, now(), now()
+                FROM {STAGING_TABLE}
+                ORDER BY slug
+                ON CONFLICT (slug) DO UPDATE
+                SET name = EXCLUDED.name, updated_at = now()
+                WHERE turnoverit_skills.name IS DISTINCT FROM EXCLUDED.name
+                RETURNING (xmax = 0) AS inserted
+            """)
+        )
+        inserted_flags = result.scalars().all()
+        added = sum(1 for inserted in inserted_flags if inserted)
+        updated = len(inserted_flags) - added
+
+        result = await self.session.execute(
+            text(f"""
+                DELETE FROM turnoverit_skills AS skill
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {STAGING_TABLE} AS staged WHERE staged.slug = skill.slug
+                )
+            """)
+        )
+        removed = result.rowcount
+
+        result = await self.session.execute(text("SELECT count(*) FROM turnoverit_skills"))
+        total = result.scalar_one()
+
+        return SkillsMergeResult(added=added, updated=updated, removed=removed, total=total)
+
+    async def update_sync_metadata(self, total_skills: int) -> None:
+        """Record the sync time and skill count (the snapshot version)."""
+        values = {"last_synced_at": datetime.now(UTC), "total_skills": total_skills}
+        stmt = insert(TurnoverITSkillsMetadataModel).values(id=1, **values)
+        await self.session.execute(stmt.on_conflict_do_update(index_elements=["id"], set_=values))
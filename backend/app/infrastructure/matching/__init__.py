@@ -1,5 +1,14 @@
 """CV matching module using AI."""
 
-from app.infrastructure.matching.gemini_matcher import GeminiMatchingService
+from app.infrastructure.matching.gemini_matcher import (
+    BatchMatchingCandidate,
+    GeminiMatchingService,
+)
+from app.infrastructure.matching.local_scorer import LocalMatchingScorer, PrescreenResult
 
-__all__ = ["GeminiMatchingService"]
+__all__ = [
+    "BatchMatchingCandidate",
+    "GeminiMatchingService",
+    "LocalMatchingScorer",
+    "PrescreenResult",
+]
@@ -4,8 +4,10 @@ Uses Google Gemini AI to analyze CV text against job requirements
 and calculate a matching score with detailed analysis.
 """
 
+import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from google import genai
@@ -219,6 +221,50 @@ MATCHING_USER_PROMPT = """Analyse la correspondance entre ce candidat et cette o
 Analyse et retourne le JSON :"""
 
 
+# ============== Batch Matching Prompts ==============
+
+# Appended to MATCHING_SYSTEM_PROMPT so that the evaluation rules stay identical
+MATCHING_BATCH_INSTRUCTIONS = """
+
+## Mode lot (plusieurs candidats) :
+
+Tu reçois PLUSIEURS candidats pour la MÊME offre d'emploi.
+- Évalue chaque candidat INDÉPENDAMMENT, sans le comparer aux autres
+- Réponds UNIQUEMENT avec un tableau JSON contenant un objet par candidat, dans l'ordre reçu
+- Chaque objet suit la structure ci-dessus et contient en plus le champ "candidate_id", recopié à l'identique"""
+
+
+MATCHING_BATCH_USER_PROMPT = """Analyse la correspondance entre chacun des {candidate_count} candidats et cette offre d'emploi.
+
+---
+
+## OFFRE D'EMPLOI :
+
+**Titre** : {job_title_offer}
+**Description** : {job_description}
+**Compétences requises** : {required_skills}
+
+---
+
+{candidates}
+Analyse et retourne le tableau JSON ({candidate_count} objets) :"""
+
+
+MATCHING_BATCH_CANDIDATE_BLOCK = """## CANDIDAT {candidate_id} :
+
+**Intitulé de poste actuel** : {job_title}
+**TJM souhaité** : {tjm_range}
+**Disponibilité** : {availability}
+
+**CV** :
+
+{cv_text}
+
+---
+
+"""
+
+
 # ============== CV Quality Evaluation Prompt ==============
 
 CV_QUALITY_SYSTEM_PROMPT = """Tu es un expert en recrutement IT pour une ESN (Entreprise de Services du Numérique).
@@ -407,6 +453,17 @@ OFFRE D'EMPLOI :
 JSON :"""
 
 
+@dataclass(frozen=True)
+class BatchMatchingCandidate:
+    """Candidate input for batch matching against a single job offer."""
+
+    candidate_id: str
+    cv_text: str
+    job_title: str | None = None
+    tjm_range: str | None = None
+    availability: str | None = None
+
+
 class GeminiMatchingService:
     """Service for CV matching using Google Gemini AI.
 
@@ -423,6 +480,9 @@ class GeminiMatchingService:
         "response_mime_type": "application/json",
     }
 
+    # Candidates packed in a single batch request (bounded by prompt and output size)
+    BATCH_MAX_CANDIDATES = 5
+
     def __init__(self, settings: Settings) -> None:
         """Initialize Gemini matching service.
 
@@ -529,6 +589,155 @@ class GeminiMatchingService:
             logger.error(f"CV matching failed: {e}")
             raise CvMatchingError(f"Analyse échouée: {str(e)}")
 
+    async def calculate_match_batch(
+        self,
+        candidates: list[BatchMatchingCandidate],
+        job_title_offer: str,
+        job_description: str,
+        required_skills: list[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Calculate enhanced matching for several candidates of the same job offer.
+
+        Candidates are packed by groups of BATCH_MAX_CANDIDATES into a single
+        request, so the system prompt and job description are sent once per
+        group instead of once per candidate. Candidates missing from (or invalid
+        in) a batch response are retried with calculate_match_enhanced.
+
+        Args:
+            candidates: Candidates to evaluate, identified by candidate_id.
+            job_title_offer: Title of the job offer.
+            job_description: Job posting description and requirements.
+            required_skills: List of required skills for the position.
+
+        Returns:
+            Enhanced matching results keyed by candidate_id. Candidates whose
+            analysis failed, even after the single-call fallback, are omitted.
+        """
+        if not self._is_configured():
+            logger.warning("Gemini not configured, returning default scores")
+            return {c.candidate_id: self._default_result_enhanced() for c in candidates}
+
+        results: dict[str, dict[str, Any]] = {}
+        to_analyze: list[BatchMatchingCandidate] = []
+        for candidate in candidates:
+            if candidate.cv_text and job_description:
+                to_analyze.append(candidate)
+            else:
+                results[candidate.candidate_id] = self._default_result_enhanced()
+
+        chunks = [
+            to_analyze[i : i + self.BATCH_MAX_CANDIDATES]
+            for i in range(0, len(to_analyze), self.BATCH_MAX_CANDIDATES)
+        ]
+        chunk_results = await asyncio.gather(
+            *(
+                self._match_batch_chunk(chunk, job_title_offer, job_description, required_skills)
+                for chunk in chunks
+            )
+        )
+        for chunk_result in chunk_results:
+            results.update(chunk_result)
+        return results
+
+    async def _match_batch_chunk(
+        self,
+        candidates: list[BatchMatchingCandidate],
+        job_title_offer: str,
+        job_description: str,
+        required_skills: list[str] | None,
+    ) -> dict[str, dict[str, Any]]:
+        """Run one batch request and fall back to single calls for missing candidates."""
+        results: dict[str, dict[str, Any]] = {}
+        if len(candidates) > 1:
+            try:
+                results = await self._request_batch(
+                    candidates, job_title_offer, job_description, required_skills
+                )
+            except Exception as e:
+                logger.warning(f"Batch matching failed, falling back to single calls: {e}")
+
+        missing = [c for c in candidates if c.candidate_id not in results]
+        if not missing:
+            logger.info(f"Batch CV matching completed for {len(candidates)} candidates")
+            return results
+
+        fallback_results = await asyncio.gather(
+            *(
+                self.calculate_match_enhanced(
+                    cv_text=c.cv_text,
+                    job_title_offer=job_title_offer,
+                    job_description=job_description,
+                    required_skills=required_skills,
+                    candidate_job_title=c.job_title,
+                    candidate_tjm_range=c.tjm_range,
+                    candidate_availability=c.availability,
+                )
+                for c in missing
+            ),
+            return_exceptions=True,
+        )
+        for candidate, result in zip(missing, fallback_results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"CV matching failed for candidate {candidate.candidate_id}: {result}")
+            else:
+                results[candidate.candidate_id] = result
+        return results
+
+    async def _request_batch(
+        self,
+        candidates: list[BatchMatchingCandidate],
+        job_title_offer: str,
+        job_description: str,
+        required_skills: list[str] | None,
+    ) -> dict[str, dict[str, Any]]:
+        """Send a single Gemini request evaluating several candidates."""
+        client = self._get_client()
+
+        candidate_blocks = "".join(
+            MATCHING_BATCH_CANDIDATE_BLOCK.format(
+                candidate_id=c.candidate_id,
+                job_title=c.job_title or "Non renseigné",
+                tjm_range=c.tjm_range or "Non renseigné",
+                availability=c.availability or "Non renseignée",
+                cv_text=c.cv_text[:10000],
+            )
+            for c in candidates
+        )
+        user_prompt = MATCHING_BATCH_USER_PROMPT.format(
+            candidate_count=len(candidates),
+            job_title_offer=job_title_offer,
+            job_description=job_description[:5000],
+            required_skills=", ".join(required_skills) if required_skills else "Non spécifiées",
+            candidates=candidate_blocks,
+        )
+
+        # Same settings as single matching, with an output budget per candidate
+        generation_config = {
+            **self.ENHANCED_GENERATION_CONFIG,
+            "max_output_tokens": self.ENHANCED_GENERATION_CONFIG["max_output_tokens"]
+            * len(candidates),
+        }
+
+        response = await client.aio.models.generate_content(
+            model="gemini-2.5-flash-lite",
+            contents=user_prompt,
+            config=types.GenerateContentConfig(
+                system_instruction=MATCHING_SYSTEM_PROMPT + MATCHING_BATCH_INSTRUCTIONS,
+                **generation_config,
+            ),
+        )
+
+        if not response.text:
+            logger.warning("Empty batch response from Gemini")
+            return {}
+
+        expected_ids = {c.candidate_id for c in candidates}
+        return {
+            candidate_id: result
+            for candidate_id, result in self._parse_batch_response(response.text).items()
+            if candidate_id in expected_ids
+        }
+
     async def calculate_match(
         self,
         cv_text: str,
@@ -911,6 +1120,60 @@ class GeminiMatchingService:
         # Parse JSON
         raw_result = json.loads(text.strip())
 
+        return self._validate_enhanced_result(raw_result)
+
+    def _parse_batch_response(self, response_text: str) -> dict[str, dict[str, Any]]:
+        """Parse a batch matching response (JSON array) from Gemini.
+
+        Args:
+            response_text: Raw response from Gemini (should be a JSON array).
+
+        Returns:
+            Validated matching results keyed by candidate_id. Entries without
+            a candidate_id or that are not objects are skipped.
+
+        Raises:
+            json.JSONDecodeError: If parsing fails.
+        """
+        text = response_text.strip()
+
+        # Remove markdown code blocks if present
+        if text.startswith("```json"):
+            text = text[7:]
+        elif text.startswith("```"):
+            text = text[3:]
+
+        if text.endswith("```"):
+            text = text[:-3]
+
+        # Find JSON array boundaries
+        start = text.find("[")
+        end = text.rfind("]") + 1
+
+        if start != -1 and end > start:
+            text = text[start:end]
+
+        raw_results = json.loads(text.strip())
+        if isinstance(raw_results, dict):
+            raw_results = [raw_results]
+
+        results: dict[str, dict[str, Any]] = {}
+        for raw_result in raw_results:
+            if not isinstance(raw_result, dict) or raw_result.get("candidate_id") is None:
+                continue
+            candidate_id = str(raw_result.pop("candidate_id"))
+            results[candidate_id] = self._validate_enhanced_result(raw_result)
+        return results
+
+    def _validate_enhanced_result(self, raw_result: dict[str, Any]) -> dict[str, Any]:
+        """Validate a parsed matching result and add legacy fields.
+
+        Args:
+            raw_result: Parsed JSON object for one candidate.
+
+        Returns:
+            Validated and normalized matching result dictionary.
+        """
         # Validate and normalize using Pydantic model
         try:
             validated = MatchingResult.model_validate(raw_result)
@@ -0,0 +1,143 @@
+"""Local CV pre-scoring service.
+
+Computes an instant, CPU-only provisional matching score between a CV
+and a job posting, without any LLM call. The score combines:
+- Skill coverage: share of the posting skills found verbatim in the CV
+- Qualifications overlap: BM25-style term-frequency saturation of the
+  qualification keywords in the CV text
+
+It is used to order applications before (or instead of) Gemini scoring.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Tokens keep technology markers such as "c++", "c#", "node.js", ".net"
+_TOKEN_PATTERN = re.compile(r"[a-z0-9.+#]*[a-z0-9+#]")
+
+# Common French/English words that carry no signal for matching
+_STOPWORDS = frozenset(
+    (
+        "a au aux avec ce ces dans de des du elle en et il la le les leur mais ou par pas "
+        "pour que qui sa se ses son sur un une vos votre nous vous est sont etre avoir an ans "
+        "and the of to in for with on or is are be as at by "
+        "requis souhaite souhaitee experience connaissance connaissances maitrise bonne bon tres"
+    ).split()
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and strip accents."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str, keep_stopwords: bool = False) -> list[str]:
+    """Split text into normalized tokens, dropping stopwords unless asked otherwise."""
+    tokens = _TOKEN_PATTERN.findall(normalize_text(text))
+    if keep_stopwords:
+        return tokens
+    return [t for t in tokens if t not in _STOPWORDS and (len(t) > 1 or t in {"c", "r"})]
+
+
+@dataclass(frozen=True)
+class PrescreenResult:
+    """Provisional matching result computed locally."""
+
+    score: int  # 0-100
+    matched_skills: list[str] = field(default_factory=list)
+    missing_skills: list[str] = field(default_factory=list)
+
+
+class LocalMatchingScorer:
+    """CPU-only pre-scoring of CVs against a job posting.
+
+    Scores are deterministic and independent of the other applications,
+    so they can be stored at submission time and used for ordering.
+    """
+
+    SKILLS_WEIGHT = 0.7
+    QUALIFICATIONS_WEIGHT = 0.3
+
+    # BM25 parameters (document-length normalization against a typical CV)
+    K1 = 1.2
+    B = 0.75
+    AVERAGE_CV_TOKENS = 600
+
+    # Only the beginning of the CV is scored, like the LLM matching prompt
+    MAX_CV_CHARS = 10000
+
+    def score(
+        self,
+        cv_text: str | None,
+        skills: list[str] | None,
+        qualifications: str | None = None,
+    ) -> PrescreenResult:
+        """Compute the provisional score of a CV for a job posting.
+
+        Args:
+            cv_text: Extracted CV text.
+            skills: Skills required by the job posting.
+            qualifications: Job posting qualifications text.
+
+        Returns:
+            Provisional score with matched and missing skills.
+        """
+        if not cv_text:
+            return PrescreenResult(score=0, missing_skills=list(skills or []))
+
+        all_tokens = tokenize(cv_text[: self.MAX_CV_CHARS], keep_stopwords=True)
+        cv_tokens = [t for t in all_tokens if t not in _STOPWORDS]
+        if not cv_tokens:
+            return PrescreenResult(score=0, missing_skills=list(skills or []))
+
+        matched, missing = self._match_skills(all_tokens, skills or [])
+        skill_score = len(matched) / (len(matched) + len(missing)) if skills else None
+        qualifications_score = self._qualifications_score(cv_tokens, qualifications or "")
+
+        if skill_score is None and qualifications_score is None:
+            score = 0.0
+        elif skill_score is None:
+            score = qualifications_score
+        elif qualifications_score is None:
+            score = skill_score
+        else:
+            score = (
+                self.SKILLS_WEIGHT * skill_score + self.QUALIFICATIONS_WEIGHT * qualifications_score
+            )
+
+        return PrescreenResult(
+            score=max(0, min(100, round(score * 100))),
+            matched_skills=matched,
+            missing_skills=missing,
+        )
+
+    def _match_skills(self, cv_tokens: list[str], skills: list[str]) -> tuple[list[str], list[str]]:
+        """Split skills between those found as a phrase in the CV and the others."""
+        haystack = f" {' '.join(cv_tokens)} "
+        matched: list[str] = []
+        missing: list[str] = []
+        for skill in skills:
+            skill_tokens = tokenize(skill, keep_stopwords=True)
+            if skill_tokens and f" {' '.join(skill_tokens)} " in haystack:
+                matched.append(skill)
+            else:
+                missing.append(skill)
+        return matched, missing
+
+    def _qualifications_score(self, cv_tokens: list[str], qualifications: str) -> float | None:
+        """Average BM25 term saturation of qualification keywords in the CV (0-1)."""
+        query_terms = set(tokenize(qualifications))
+        if not query_terms:
+            return None
+
+        frequencies = Counter(cv_tokens)
+        length_norm = 1 - self.B + self.B * len(cv_tokens) / self.AVERAGE_CV_TOKENS
+        total = 0.0
+        for term in query_terms:
+            tf = frequencies.get(term, 0)
+            if tf:
+                total += tf * (self.K1 + 1) / (tf + self.K1 * length_norm) / (self.K1 + 1)
+        return total / len(query_terms)
@@ -359,3 +359,85 @@ auth_attempts_total = metrics.counter(
     "Total authentication attempts",
     ["result"],
 )
+
+cv_extraction_duration_seconds = metrics.histogram(
+    "cv_extraction_duration_seconds",
+    "CV text extraction duration in seconds",
+    ["format"],
+)
+
+cv_extraction_page_duration_seconds = metrics.histogram(
+    "cv_extraction_page_duration_seconds",
+    "CV text extraction duration per page in seconds",
+    ["format"],
+)
+
+cv_extraction_failures_total = metrics.counter(
+    "cv_extraction_failures_total",
+    "Total failed CV text extractions",
+    ["format", "reason"],
+)
+
+anonymizer_prompt_chars = metrics.histogram(
+    "anonymizer_prompt_chars",
+    "Job posting anonymization prompt size in characters",
+    ["skills_mode"],
+    buckets=(2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000),
+)
+
+anonymizer_duration_seconds = metrics.histogram(
+    "anonymizer_duration_seconds",
+    "Job posting anonymization Gemini call duration in seconds",
+    ["skills_mode"],
+)
+
+anonymizer_skills_recall = metrics.histogram(
+    "anonymizer_skills_recall",
+    "Share of full-list validated skills also found in retrieval mode",
+    buckets=(0.0, 0.25, 0.5, 0.75, 0.9, 1.0),
+)
+
+db_pool_checkout_wait_seconds = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time waited for a database connection from the pool in seconds",
+)
+
+db_pool_checkout_timeouts_total = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "Total database connection checkouts that timed out waiting for the pool",
+)
+
+db_pool_checked_out = metrics.gauge(
+    "db_pool_checked_out",
+    "Database connections currently checked out of the pool",
+)
+
+db_connection_hold_seconds = metrics.histogram(
+    "db_connection_hold_seconds",
+    "Time a session held a pooled database connection (one transaction) in seconds",
+    ["route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+password_hash_queue_depth = metrics.gauge(
+    "password_hash_queue_depth",
+    "Password hash and verify calls waiting for a worker of the hashing pool",
+)
+
+password_hash_queue_wait_seconds = metrics.histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hash or verify call waited for a worker in seconds",
+)
+
+password_hash_duration_seconds = metrics.histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash or verify duration in seconds",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+rate_limit_rejections_total = metrics.counter(
+    "rate_limit_rejections_total",
+    "Total requests rejected by the rate limiter (local block list or Redis)",
+    ["source"],
+)
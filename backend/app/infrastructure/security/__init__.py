@@ -8,13 +8,21 @@ from app.infrastructure.security.audit import (
 )
 from app.infrastructure.security.jwt import (
     TokenPayload,
+    TokenService,
     create_access_token,
     create_refresh_token,
     create_reset_token,
     create_verification_token,
     decode_token,
+    get_token_service,
+)
+from app.infrastructure.security.password import (
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
 )
-from app.infrastructure.security.password import hash_password, verify_password
 from app.infrastructure.security.rate_limiter import (
     InMemoryRateLimiter,
     RateLimiter,
@@ -26,7 +34,10 @@ from app.infrastructure.security.rate_limiter import (
 __all__ = [
     # Password
     "hash_password",
+    "hash_password_async",
+    "needs_rehash",
     "verify_password",
+    "verify_password_async",
     # JWT
     "create_access_token",
     "create_refresh_token",
@@ -34,6 +45,8 @@ __all__ = [
     "create_verification_token",
     "create_reset_token",
     "TokenPayload",
+    "TokenService",
+    "get_token_service",
     # Rate limiting
     "RateLimiter",
     "RateLimitExceeded",
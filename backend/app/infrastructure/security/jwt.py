@@ -1,14 +1,34 @@
-"""JWT token utilities."""
+"""JWT token utilities.
+
+Tokens are signed and verified by a TokenService built once per process:
+its keys are constructed from the settings up front instead of being
+parsed from the secret on every call. HS* algorithms use JWT_SECRET;
+RS*/ES* use JWT_PRIVATE_KEY to sign and JWT_PUBLIC_KEY to verify, so other
+services can verify tokens with the public key only.
+
+Verified tokens are kept in a bounded LRU until their exp: a bearer token
+sent on every request is only checked cryptographically once.
+"""
 
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from pydantic import BaseModel
 
-from app.config import settings
+from app.config import Settings, settings
 from app.domain.exceptions import InvalidTokenError
+from app.infrastructure.observability.metrics import cache_hits_total, cache_misses_total
+
+ASYMMETRIC_ALGORITHM_PREFIXES = ("RS", "ES")
+
+CACHE_NAME = "jwt"
 
 
 class TokenPayload(BaseModel):
@@ -20,6 +40,117 @@ class TokenPayload(BaseModel):
     iat: datetime = datetime.utcnow()
 
 
+def _pem(value: str) -> str:
+    """PEM key from a setting, with "\\n" escapes allowed (single-line env vars)."""
+    return value.replace("\\n", "\n")
+
+
+def build_keys(config: Settings) -> tuple[Key | None, Key]:
+    """Build the signing and verification keys of the configured algorithm.
+
+    Returns:
+        (signing key, verification key). The signing key is None on a
+        verify-only service (asymmetric algorithm with only a public key).
+
+    Raises:
+        ValueError: If an asymmetric algorithm has neither key configured.
+    """
+    algorithm = config.JWT_ALGORITHM
+    if not algorithm.startswith(ASYMMETRIC_ALGORITHM_PREFIXES):
+        key = jwk.construct(config.JWT_SECRET, algorithm)
+        return key, key
+
+    signing_key = None
+    if config.JWT_PRIVATE_KEY:
+        signing_key = jwk.construct(_pem(config.JWT_PRIVATE_KEY), algorithm)
+
+    if config.JWT_PUBLIC_KEY:
+        verification_key = jwk.construct(_pem(config.JWT_PUBLIC_KEY), algorithm)
+    elif signing_key is not None:
+        verification_key = signing_key.public_key()
+    else:
+        raise ValueError(f"JWT_PUBLIC_KEY or JWT_PRIVATE_KEY is required for {algorithm}")
+
+    return signing_key, verification_key
+
+
+class TokenService:
+    """Sign and verify JWTs with prebuilt keys and a verified-token LRU."""
+
+    def __init__(self, config: Settings) -> None:
+        self.algorithm = config.JWT_ALGORITHM
+        self._signing_key, self._verification_key = build_keys(config)
+        self._headers = {"kid": config.JWT_KEY_ID} if config.JWT_KEY_ID else None
+        self._cache_size = config.JWT_VERIFIED_CACHE_SIZE
+        # token -> (exp timestamp, payload)
+        self._verified: OrderedDict[str, tuple[float, TokenPayload]] = OrderedDict()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a token.
+
+        Raises:
+            RuntimeError: If this service has no signing key (verify-only).
+        """
+        if self._signing_key is None:
+            raise RuntimeError(f"JWT_PRIVATE_KEY is required to sign {self.algorithm} tokens")
+        return jwt.encode(
+            claims, self._signing_key, algorithm=self.algorithm, headers=self._headers
+        )
+
+    def decode(self, token: str, expected_type: str | None = None) -> TokenPayload:
+        """Verify a token, from the verified-token cache when possible.
+
+        Raises:
+            InvalidTokenError: If token is invalid, expired, or wrong type
+        """
+        payload = self._cached(token)
+        if payload is None:
+            payload = self._verify(token)
+
+        if expected_type and payload.type != expected_type:
+            raise InvalidTokenError(f"Expected {expected_type} token, got {payload.type}")
+        return payload
+
+    def _cached(self, token: str) -> TokenPayload | None:
+        entry = self._verified.get(token)
+        if entry is None:
+            if self._cache_size:
+                cache_misses_total.inc(cache_name=CACHE_NAME)
+            return None
+        if entry[0] <= time.time():
+            # Expired: verify again so the caller gets the usual error
+            self._verified.pop(token, None)
+            return None
+        self._verified.move_to_end(token)
+        cache_hits_total.inc(cache_name=CACHE_NAME)
+        return entry[1]
+
+    def _verify(self, token: str) -> TokenPayload:
+        try:
+            claims = jwt.decode(token, self._verification_key, algorithms=[self.algorithm])
+        except JWTError as e:
+            raise InvalidTokenError(str(e))
+
+        # Claims are validated by jwt.decode: skip pydantic validation
+        payload = TokenPayload.model_construct(
+            sub=claims["sub"],
+            exp=datetime.fromtimestamp(claims["exp"]),
+            type=claims.get("type") or "unknown",
+            iat=datetime.fromtimestamp(claims.get("iat", time.time())),
+        )
+        if self._cache_size:
+            self._verified[token] = (claims["exp"], payload)
+            while len(self._verified) > self._cache_size:
+                self._verified.popitem(last=False)
+        return payload
+
+
+@lru_cache
+def get_token_service() -> TokenService:
+    """Get the process-wide token service."""
+    return TokenService(settings)
+
+
 def create_access_token(user_id: UUID) -> str:
     """Create access token for user."""
     expires = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -29,7 +160,7 @@ def create_access_token(user_id: UUID) -> str:
         "type": "access",
         "iat": datetime.utcnow(),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return get_token_service().encode(payload)
 
 
 def create_refresh_token(user_id: UUID) -> str:
@@ -41,7 +172,7 @@ def create_refresh_token(user_id: UUID) -> str:
         "type": "refresh",
         "iat": datetime.utcnow(),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return get_token_service().encode(payload)
 
 
 def create_verification_token() -> str:
@@ -68,25 +199,7 @@ def decode_token(token: str, expected_type: str | None = None) -> TokenPayload:
     Raises:
         InvalidTokenError: If token is invalid, expired, or wrong type
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-
-        token_type = payload.get("type")
-        if expected_type and token_type != expected_type:
-            raise InvalidTokenError(f"Expected {expected_type} token, got {token_type}")
-
-        return TokenPayload(
-            sub=payload["sub"],
-            exp=datetime.fromtimestamp(payload["exp"]),
-            type=token_type or "unknown",
-            iat=datetime.fromtimestamp(payload.get("iat", datetime.utcnow().timestamp())),
-        )
-    except JWTError as e:
-        raise InvalidTokenError(str(e))
+    return get_token_service().decode(token, expected_type)
 
 
 def get_token_expiry(token_type: str) -> datetime:
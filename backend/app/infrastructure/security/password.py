@@ -1,12 +1,34 @@
-"""Password hashing utilities."""
+"""Password hashing utilities.
+
+bcrypt is deliberately slow (about 250 ms at cost 12) and would block the
+event loop for that long. The async helpers run it in a dedicated bounded
+thread pool (bcrypt releases the GIL while hashing); the sync functions are
+kept for scripts such as the admin seed. Hashes made with another cost than
+PASSWORD_BCRYPT_ROUNDS are upgraded on the next successful login.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import bcrypt
 
+from app.config import settings
+from app.infrastructure.observability.metrics import (
+    password_hash_duration_seconds,
+    password_hash_queue_depth,
+    password_hash_queue_wait_seconds,
+)
+
+_executor: ThreadPoolExecutor | None = None
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.PASSWORD_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -16,3 +38,67 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     password_bytes = plain_password.encode("utf-8")
     hashed_bytes = hashed_password.encode("utf-8")
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Check if a bcrypt hash was made with another cost than the current one."""
+    # Format: $2b$<cost>$<salt and hash>
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.PASSWORD_BCRYPT_ROUNDS
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the password hashing pool."""
+    return await _run_in_pool("hash", hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash in the password hashing pool."""
+    return await _run_in_pool("verify", verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_pool() -> None:
+    """Stop the password hashing pool (idempotent)."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_pool(operation: str, func: Callable[..., Any], *args: str) -> Any:
+    """Run a bcrypt call in the pool, recording queue depth, wait and duration."""
+    submitted = time.perf_counter()
+
+    def task() -> Any:
+        started = time.perf_counter()
+        password_hash_queue_depth.dec()
+        password_hash_queue_wait_seconds.observe(started - submitted)
+        try:
+            return func(*args)
+        finally:
+            password_hash_duration_seconds.observe(
+                time.perf_counter() - started, operation=operation
+            )
+
+    def on_done(future: Future) -> None:
+        # A task cancelled while still queued never ran: leave the queue here
+        if future.cancelled():
+            password_hash_queue_depth.dec()
+
+    password_hash_queue_depth.inc()
+    future = _get_pool().submit(task)
+    future.add_done_callback(on_done)
+    return await asyncio.wrap_future(future)
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Get or create the password hashing pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+            thread_name_prefix="password-hash",
+        )
+    return _executor
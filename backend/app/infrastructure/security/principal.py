@@ -0,0 +1,185 @@
+"""Authenticated principal resolution with a short-TTL cache.
+
+Protected routes only need the role, active flag and Boond resource id of
+the caller. They are cached by user id in an in-process LRU in front of
+Redis, so steady-state authentication costs no database query. The user
+admin use cases invalidate both levels; the local TTL is kept shorter than
+the Redis one because another worker's LRU is only dropped on expiry.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.value_objects import UserRole
+from app.infrastructure.database.repositories import UserRepository
+from app.infrastructure.observability.metrics import cache_hits_total, cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "principal"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authorization view of a user, as cached for request authentication."""
+
+    id: UUID
+    role: UserRole
+    is_active: bool
+    boond_resource_id: str | None = None
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if the user is an admin."""
+        return self.role == UserRole.ADMIN
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": str(self.id),
+                "role": str(self.role),
+                "is_active": self.is_active,
+                "boond_resource_id": self.boond_resource_id,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, value: str) -> "Principal":
+        data = json.loads(value)
+        return cls(
+            id=UUID(data["id"]),
+            role=UserRole(data["role"]),
+            is_active=data["is_active"],
+            boond_resource_id=data.get("boond_resource_id"),
+        )
+
+
+class PrincipalCache:
+    """Principals by user id: in-process LRU in front of Redis, both with a TTL.
+
+    Redis errors and unreadable entries are logged and treated as misses:
+    authentication falls back to the database instead of failing.
+    """
+
+    KEY_PREFIX = "principal:"
+
+    def __init__(
+        self,
+        redis: Redis | None,
+        ttl_seconds: int,
+        local_ttl_seconds: float,
+        max_size: int,
+    ) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._local_ttl_seconds = local_ttl_seconds
+        self._max_size = max_size
+        self._local: OrderedDict[UUID, tuple[float, Principal]] = OrderedDict()
+
+    async def get(self, user_id: UUID) -> Principal | None:
+        """Get a cached principal, None on miss."""
+        entry = self._local.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            self._local.move_to_end(user_id)
+            cache_hits_total.inc(cache_name=CACHE_NAME)
+            return entry[1]
+
+        principal = None
+        if self._redis is not None:
+            try:
+                value = await self._redis.get(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Principal cache read failed: {e}")
+                value = None
+            if value:
+                try:
+                    principal = Principal.from_json(value)
+                except (ValueError, KeyError, TypeError) as e:
+                    # Corrupt or older-format entry: reload from the database
+                    logger.warning(f"Invalid cached principal for {user_id}: {e}")
+                    await self.invalidate(user_id)
+
+        if principal is None:
+            self._local.pop(user_id, None)
+            cache_misses_total.inc(cache_name=CACHE_NAME)
+            return None
+
+        self._store_local(principal)
+        cache_hits_total.inc(cache_name=CACHE_NAME)
+        return principal
+
+    async def set(self, principal: Principal) -> None:
+        """Cache a principal."""
+        self._store_local(principal)
+        if self._redis is not None:
+            try:
+                await self._redis.set(
+                    self._key(principal.id), principal.to_json(), ex=self._ttl_seconds
+                )
+            except RedisError as e:
+                logger.warning(f"Principal cache write failed: {e}")
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop a user's cached principal (role, activation or profile changed)."""
+        self._local.pop(user_id, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Principal cache invalidation failed: {e}")
+
+    def _store_local(self, principal: Principal) -> None:
+        self._local[principal.id] = (time.monotonic() + self._local_ttl_seconds, principal)
+        self._local.move_to_end(principal.id)
+        while len(self._local) > self._max_size:
+            self._local.popitem(last=False)
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+
+@lru_cache
+def get_principal_cache() -> PrincipalCache:
+    """Get the process-wide principal cache."""
+    redis = None
+    if settings.PRINCIPAL_CACHE_ENABLED:
+        redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return PrincipalCache(
+        redis=redis,
+        ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        local_ttl_seconds=settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+        max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    )
+
+
+async def resolve_principal(db: AsyncSession, user_id: UUID) -> Principal | None:
+    """Get the principal of a user from the cache, or the database on miss."""
+    cache = get_principal_cache() if settings.PRINCIPAL_CACHE_ENABLED else None
+    if cache is not None:
+        principal = await cache.get(user_id)
+        if principal is not None:
+            return principal
+
+    user = await UserRepository(db).get_by_id(user_id)
+    if not user:
+        return None
+
+    principal = Principal(
+        id=user.id,
+        role=user.role,
+        is_active=user.is_active,
+        boond_resource_id=user.boond_resource_id,
+    )
+    if cache is not None:
+        await cache.set(principal)
+    return principal
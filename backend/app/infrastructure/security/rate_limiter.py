@@ -1,19 +1,37 @@
 """
 Rate limiting infrastructure.
 
-Provides token bucket rate limiting with in-memory and Redis backends.
+Sliding window counter: each key keeps the request count of the current
+fixed window and of the previous one. A request is allowed while the
+current count plus the previous count, weighted by how much of the previous
+window still overlaps the sliding window, stays under the limit. Memory is
+one small record per key whatever the traffic.
+
+The Redis backend runs the check and the increment in a single Lua script:
+one round-trip, and no race between them. Keys known to be over their limit
+are remembered in process until they may pass again, so a client hammering
+a limited route is rejected without touching Redis.
 """
 
+import logging
+import math
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from threading import Lock
 from typing import Any
 
 from fastapi import HTTPException, Request, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.infrastructure.observability.metrics import rate_limit_rejections_total
+
+logger = logging.getLogger(__name__)
 
 
 class RateLimitExceeded(HTTPException):
@@ -45,11 +63,49 @@ class RateLimitResult:
     limit: int
 
 
+def sliding_window_result(
+    allowed: bool,
+    current: int,
+    previous: int,
+    limit: int,
+    window: int,
+    now: float,
+) -> RateLimitResult:
+    """Build the result of a sliding window counter check.
+
+    Args:
+        allowed: Whether the request was counted.
+        current: Count of the current window (including the request if allowed).
+        previous: Count of the previous window.
+        limit: Maximum number of requests per window.
+        window: Window in seconds.
+        now: Time of the check.
+    """
+    window_start = now - now % window
+    previous_weight = 1 - (now - window_start) / window
+    if allowed:
+        used = previous * previous_weight + current
+        return RateLimitResult(
+            allowed=True,
+            remaining=max(0, math.floor(limit - used)),
+            reset_at=window_start + window,
+            limit=limit,
+        )
+
+    # First time at which previous * weight + current + 1 <= limit again
+    if current < limit and previous:
+        reset_at = window_start + (1 - (limit - 1 - current) / previous) * window
+    else:
+        # Only once the current window has slid out enough, in the next one
+        reset_at = window_start + window + (1 - (limit - 1) / max(current, 1)) * window
+    return RateLimitResult(allowed=False, remaining=0, reset_at=reset_at, limit=limit)
+
+
 class RateLimiter(ABC):
     """
     Abstract base class for rate limiters.
 
-    Implements the token bucket algorithm for rate limiting.
+    Implements the sliding window counter algorithm for rate limiting.
     """
 
     @abstractmethod
@@ -75,113 +131,134 @@ class RateLimiter(ABC):
 
 class InMemoryRateLimiter(RateLimiter):
     """
-    In-memory rate limiter using sliding window algorithm.
+    In-memory rate limiter using the sliding window counter algorithm.
 
     Suitable for single-instance deployments.
     """
 
     def __init__(self):
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        # key -> (window index, current count, previous count)
+        self._counters: dict[str, tuple[int, int, int]] = {}
         self._lock = Lock()
 
     async def check(self, key: str, limit: int, window: int) -> RateLimitResult:
-        """Check rate limit using sliding window."""
+        """Check rate limit using sliding window counters."""
         now = time.time()
-        window_start = now - window
+        index = int(now // window)
+        previous_weight = 1 - (now % window) / window
 
         with self._lock:
-            # Remove old requests outside the window
-            self._requests[key] = [ts for ts in self._requests[key] if ts > window_start]
-
-            current_count = len(self._requests[key])
+            stored_index, current, previous = self._counters.get(key, (index, 0, 0))
+            if stored_index == index - 1:
+                current, previous = 0, current
+            elif stored_index != index:
+                current, previous = 0, 0
 
-            if current_count >= limit:
-                # Rate limit exceeded
-                oldest = min(self._requests[key]) if self._requests[key] else now
-                reset_at = oldest + window
-                return RateLimitResult(
-                    allowed=False,
-                    remaining=0,
-                    reset_at=reset_at,
-                    limit=limit,
-                )
+            allowed = previous * previous_weight + current + 1 <= limit
+            if allowed:
+                current += 1
+                self._counters[key] = (index, current, previous)
 
-            # Allow request and record timestamp
-            self._requests[key].append(now)
-            return RateLimitResult(
-                allowed=True,
-                remaining=limit - current_count - 1,
-                reset_at=now + window,
-                limit=limit,
-            )
+        return sliding_window_result(allowed, current, previous, limit, window, now)
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key."""
         with self._lock:
-            self._requests.pop(key, None)
+            self._counters.pop(key, None)
+
+
+# KEYS[1]: counters hash of the key
+# ARGV: limit, window (s), current window index, weight of the previous window
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local index = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'index', 'current', 'previous')
+local stored = tonumber(state[1])
+local current, previous = 0, 0
+if stored == index then
+    current = tonumber(state[2])
+    previous = tonumber(state[3])
+elseif stored == index - 1 then
+    previous = tonumber(state[2])
+end
+if previous * tonumber(ARGV[4]) + current + 1 > limit then
+    return {0, current, previous}
+end
+current = current + 1
+redis.call('HSET', KEYS[1], 'index', index, 'current', current, 'previous', previous)
+redis.call('EXPIRE', KEYS[1], 2 * tonumber(ARGV[2]))
+return {1, current, previous}
+"""
 
 
 class RedisRateLimiter(RateLimiter):
     """
-    Redis-based rate limiter using sliding window algorithm.
+    Redis-based rate limiter using the sliding window counter algorithm.
 
-    Suitable for distributed deployments.
+    Suitable for distributed deployments. Rejections are remembered locally
+    until the key may pass again (up to local_block_size keys). When Redis
+    is unreachable, the check falls back to a per-process in-memory limiter.
     """
 
-    def __init__(self, redis_client: Any):
+    KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, redis_client: Any, local_block_size: int = 10_000):
         self._redis = redis_client
+        self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._local_block_size = local_block_size
+        # key -> time at which it may pass again
+        self._blocked: OrderedDict[str, float] = OrderedDict()
+        self._fallback = InMemoryRateLimiter()
 
     async def check(self, key: str, limit: int, window: int) -> RateLimitResult:
-        """Check rate limit using Redis sorted sets."""
+        """Check rate limit with the sliding window Lua script."""
         now = time.time()
-        window_start = now - window
-        redis_key = f"ratelimit:{key}"
-
-        # Use a pipeline for atomic operations
-        pipe = self._redis.pipeline()
-
-        # Remove old entries
-        pipe.zremrangebyscore(redis_key, 0, window_start)
-
-        # Count current entries
-        pipe.zcard(redis_key)
-
-        # Execute pipeline
-        results = await pipe.execute()
-        current_count = results[1]
-
-        if current_count >= limit:
-            # Get oldest entry to calculate reset time
-            oldest = await self._redis.zrange(redis_key, 0, 0, withscores=True)
-            reset_at = oldest[0][1] + window if oldest else now + window
+        blocked_until = self._blocked.get(key)
+        if blocked_until is not None:
+            if blocked_until > now:
+                rate_limit_rejections_total.inc(source="local")
+                return RateLimitResult(
+                    allowed=False, remaining=0, reset_at=blocked_until, limit=limit
+                )
+            del self._blocked[key]
 
-            return RateLimitResult(
-                allowed=False,
-                remaining=0,
-                reset_at=reset_at,
-                limit=limit,
+        try:
+            allowed, current, previous = await self._script(
+                keys=[f"{self.KEY_PREFIX}{key}"],
+                args=[limit, window, int(now // window), 1 - (now % window) / window],
             )
+        except RedisError as e:
+            logger.warning(f"Rate limit check failed, using in-memory limits: {e}")
+            return await self._fallback.check(key, limit, window)
 
-        # Add new entry and set expiry
-        pipe = self._redis.pipeline()
-        pipe.zadd(redis_key, {str(now): now})
-        pipe.expire(redis_key, window)
-        await pipe.execute()
-
-        return RateLimitResult(
-            allowed=True,
-            remaining=limit - current_count - 1,
-            reset_at=now + window,
-            limit=limit,
+        result = sliding_window_result(
+            bool(allowed), int(current), int(previous), limit, window, now
         )
+        if not result.allowed:
+            rate_limit_rejections_total.inc(source="redis")
+            self._block(key, result.reset_at)
+        return result
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key."""
-        await self._redis.delete(f"ratelimit:{key}")
+        self._blocked.pop(key, None)
+        await self._fallback.reset(key)
+        await self._redis.delete(f"{self.KEY_PREFIX}{key}")
+
+    def _block(self, key: str, until: float) -> None:
+        self._blocked[key] = until
+        self._blocked.move_to_end(key)
+        while len(self._blocked) > self._local_block_size:
+            self._blocked.popitem(last=False)
 
 
-# Default in-memory rate limiter
-_default_limiter = InMemoryRateLimiter()
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter, shared by all rate limited routes."""
+    return RedisRateLimiter(
+        Redis.from_url(settings.REDIS_URL),
+        local_block_size=settings.RATE_LIMIT_LOCAL_BLOCK_SIZE,
+    )
 
 
 def rate_limit(
@@ -193,11 +270,14 @@ def rate_limit(
     """
     Rate limiting decorator for FastAPI endpoints.
 
+    Limits are counted per endpoint: the key is the endpoint name followed
+    by key_func(request).
+
     Args:
         limit: Maximum requests allowed in the window
         window: Time window in seconds
         key_func: Function to extract rate limit key from request
-        limiter: RateLimiter instance (defaults to in-memory)
+        limiter: RateLimiter instance (defaults to the shared Redis limiter)
 
     Example:
         @router.get("/api/resource")
@@ -214,9 +294,10 @@ def rate_limit(
         return request.client.host if request.client else "unknown"
 
     actual_key_func = key_func or get_default_key
-    actual_limiter = limiter or _default_limiter
 
     def decorator(func: Callable) -> Callable:
+        scope = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Find request in args or kwargs
@@ -232,13 +313,13 @@ def rate_limit(
                 return await func(*args, **kwargs)
 
             # Get rate limit key
-            key = actual_key_func(request)
+            key = f"{scope}:{actual_key_func(request)}"
 
             # Check rate limit
-            result = await actual_limiter.check(key, limit, window)
+            result = await (limiter or get_rate_limiter()).check(key, limit, window)
 
             if not result.allowed:
-                retry_after = int(result.reset_at - time.time())
+                retry_after = math.ceil(result.reset_at - time.time())
                 raise RateLimitExceeded(
                     limit=limit,
                     window=window,
@@ -226,8 +226,6 @@ class ServiceFactory:
 
         return ListCooptationsUseCase(
             cooptation_repository=self.cooptation_repository,
-            candidate_repository=self.candidate_repository,
-            opportunity_repository=self.opportunity_repository,
         )
 
     def create_get_cooptation_use_case(self):
@@ -322,14 +320,26 @@ class ServiceFactory:
     def create_update_user_use_case(self):
         """Create UpdateUserUseCase."""
         from app.application.use_cases.admin.users import UpdateUserUseCase
+        from app.infrastructure.security.principal import get_principal_cache
+        from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
-        return UpdateUserUseCase(user_repository=self.user_repository)
+        return UpdateUserUseCase(
+            user_repository=self.user_repository,
+            principal_cache=get_principal_cache(),
+            unit_of_work=SqlAlchemyUnitOfWork(self._db),
+        )
 
     def create_delete_user_use_case(self):
         """Create DeleteUserUseCase."""
         from app.application.use_cases.admin.users import DeleteUserUseCase
+        from app.infrastructure.security.principal import get_principal_cache
+        from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
-        return DeleteUserUseCase(user_repository=self.user_repository)
+        return DeleteUserUseCase(
+            user_repository=self.user_repository,
+            principal_cache=get_principal_cache(),
+            unit_of_work=SqlAlchemyUnitOfWork(self._db),
+        )
 
     def create_get_boond_status_use_case(self):
         """Create GetBoondStatusUseCase."""
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -455,64 +456,85 @@ class TurnoverITClient:
             logger.warning(f"Failed to fetch skills: {e}")
             return []
 
-    async def fetch_all_skills(self) -> list[dict[str, str]]:
-        """Fetch all skills from Turnover-IT with pagination.
+    async def iter_skill_pages(self) -> AsyncIterator[list[dict[str, str]]]:
+        """Stream skills from Turnover-IT one API page at a time.
 
-        Iterates through all pages to get the complete list of skills.
+        Unlike fetch_all_skills, failures are raised so callers never mistake
+        a partial nomenclature for the complete one.
 
-        Returns:
-            Complete list of skills with name and slug.
+        Yields:
+            Skills of each page with name and slug.
+
+        Raises:
+            TurnoverITError: If the API key is missing or a page cannot be fetched.
         """
         if not self._is_configured():
-            logger.warning("Turnover-IT API key not configured - cannot fetch skills")
-            return []
+            raise TurnoverITError("API key not configured")
 
-        all_skills: list[dict[str, str]] = []
         page = 1
         max_pages = 50  # Safety limit
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                while page <= max_pages:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            while page <= max_pages:
+                try:
                     response = await client.get(
                         f"{self.base_url.replace('/v2', '')}/skills",
                         headers=self._get_headers(),
                         params={"page": page},
                     )
+                except httpx.HTTPError as e:
+                    raise TurnoverITError(f"Erreur de connexion: {str(e)}")
 
-                    if response.status_code != 200:
-                        logger.warning(
-                            f"Failed to fetch skills page {page}: {response.status_code}"
-                        )
-                        break
+                if response.status_code != 200:
+                    raise TurnoverITError(
+                        f"Échec de récupération des skills (page {page}): {response.status_code}"
+                    )
 
-                    data = response.json()
-                    members = data.get("hydra:member", [])
+                data = response.json()
+                members = data.get("hydra:member", [])
 
-                    if not members:
-                        break
+                if not members:
+                    return
 
-                    for skill in members:
-                        all_skills.append(
-                            {
-                                "name": skill.get("name", ""),
-                                "slug": skill.get("slug", ""),
-                            }
-                        )
+                yield [
+                    {"name": skill.get("name", ""), "slug": skill.get("slug", "")}
+                    for skill in members
+                ]
 
-                    # Check if there's a next page
-                    view = data.get("hydra:view", {})
-                    if "hydra:next" not in view:
-                        break
+                # Check if there's a next page
+                view = data.get("hydra:view", {})
+                if "hydra:next" not in view:
+                    return
 
-                    page += 1
+                page += 1
 
-            logger.info(f"Fetched {len(all_skills)} skills from Turnover-IT ({page} pages)")
+    async def fetch_all_skills(self) -> list[dict[str, str]]:
+        """Fetch all skills from Turnover-IT with pagination.
+
+        Iterates through all pages to get the complete list of skills.
+
+        Returns:
+            Complete list of skills with name and slug (the pages fetched
+            so far if a page fails).
+        """
+        if not self._is_configured():
+            logger.warning("Turnover-IT API key not configured - cannot fetch skills")
+            return []
+
+        all_skills: list[dict[str, str]] = []
+        pages = 0
+
+        try:
+            async for skills in self.iter_skill_pages():
+                all_skills.extend(skills)
+                pages += 1
+
+            logger.info(f"Fetched {len(all_skills)} skills from Turnover-IT ({pages} pages)")
             return all_skills
 
         except Exception as e:
             logger.error(f"Failed to fetch all skills: {e}")
-            return all_skills if all_skills else []
+            return all_skills
 
     async def health_check(self) -> bool:
         """Check Turnover-IT API availability.
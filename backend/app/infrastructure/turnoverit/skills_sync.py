@@ -0,0 +1,66 @@
+"""Turnover-IT skills nomenclature sync.
+
+Single implementation used by the anonymizer (periodic sync) and the
+HR/admin manual sync endpoints.
+"""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.anonymizer.skills_snapshot import get_skills_store
+from app.infrastructure.database.connection import background_session_factory
+from app.infrastructure.database.repositories import SkillsMergeResult, TurnoverITSkillRepository
+from app.infrastructure.turnoverit.client import TurnoverITClient
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_skills_from_turnoverit(
+    client: TurnoverITClient,
+    session_factory: async_sessionmaker[AsyncSession] = background_session_factory,
+) -> SkillsMergeResult | None:
+    """Replace the cached skills with the current Turnover-IT nomenclature.
+
+    All API pages are fetched first, without any database connection. They
+    are then staged and merged (upsert + delete of skills no longer listed)
+    in one short transaction on a session of its own, so the table is never
+    empty or partial for readers and the caller's session is left alone.
+    Nothing changes if a page fails or no skill is returned.
+
+    Args:
+        client: Turnover-IT API client.
+        session_factory: Factory of the session used for the merge.
+
+    Returns:
+        Added/updated/removed counts, or None if no skill was fetched.
+
+    Raises:
+        TurnoverITError: If a page cannot be fetched.
+    """
+    logger.info("Starting Turnover-IT skills sync...")
+    skills = [skill async for page in client.iter_skill_pages() for skill in page]
+    if not skills:
+        logger.warning("No skills fetched from Turnover-IT")
+        return None
+
+    async with session_factory() as session:
+        repository = TurnoverITSkillRepository(session)
+        try:
+            await repository.create_staging_table()
+            await repository.stage(skills)
+            result = await repository.merge_staged()
+            await repository.update_sync_metadata(result.total)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    # Reload the shared snapshot on next access
+    get_skills_store().invalidate()
+
+    logger.info(
+        f"Synced {result.total} skills from Turnover-IT "
+        f"({result.added} added, {result.updated} updated, {result.removed} removed)"
+    )
+    return result
@@ -83,6 +83,15 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         """
         await self._session.rollback()
 
+    async def release(self) -> None:
+        """
+        Commit the work done so far and return the connection to the pool.
+
+        The session keeps its loaded entities (no expiry on commit) and
+        checks out a connection again on the next repository call.
+        """
+        await self._session.commit()
+
     @property
     def session(self) -> AsyncSession:
         """Get the underlying session (for advanced use cases)."""
@@ -5,11 +5,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi.errors import RateLimitExceeded
 
 from app.api.middleware.correlation import CorrelationIdMiddleware
 from app.api.middleware.error_handler import error_handler_middleware
-from app.api.middleware.rate_limiter import limiter, rate_limit_exceeded_handler
+from app.api.middleware.rate_limiter import rate_limit_exceeded_handler
 from app.api.middleware.security_headers import SecurityHeadersMiddleware
 from app.api.routes.v1 import (
     admin_router,
@@ -27,9 +26,14 @@ from app.api.routes.v1 import (
     users_router,
 )
 from app.config import settings
+from app.infrastructure.anonymizer.skills_snapshot import get_skills_store
+from app.infrastructure.cv_transformer import get_cv_text_extraction_service
 from app.infrastructure.database.connection import engine
 from app.infrastructure.database.seed import seed_admin_user
 from app.infrastructure.logging import configure_logging
+from app.infrastructure.security.jwt import get_token_service
+from app.infrastructure.security.password import shutdown_password_pool
+from app.infrastructure.security.rate_limiter import RateLimitExceeded
 from app.quotation_generator.api import router as quotation_generator_router
 
 
@@ -39,13 +43,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     configure_logging()
 
+    # Build the JWT keys now: a misconfigured key fails the startup, not the first login
+    get_token_service()
+
     # Seed admin user in dev/test
     if not settings.is_production:
         await seed_admin_user()
 
+    # Load the Turnover-IT skills snapshot shared by the anonymizer and skills endpoints
+    await get_skills_store().get_snapshot()
+
     yield
 
     # Shutdown
+    get_cv_text_extraction_service().shutdown()
+    shutdown_password_pool()
     await engine.dispose()
 
 
@@ -59,8 +71,7 @@ app = FastAPI(
     openapi_url="/api/openapi.json" if not settings.is_production else None,
 )
 
-# Add rate limiter state and exception handler
-app.state.limiter = limiter
+# Rate limit exceeded handler (limits checked by the shared sliding window limiter)
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
 # Middleware (order matters - outermost runs first)
@@ -116,12 +116,12 @@ async def get_start_generation_use_case(
     Uses a factory to create GenerateBatchUseCase with fresh DB session
     for background task execution.
     """
-    from app.infrastructure.database.connection import async_session_factory
+    from app.infrastructure.database.connection import background_session_factory
 
     def create_generate_use_case() -> GenerateBatchUseCase:
         """Factory that creates GenerateBatchUseCase with fresh DB session."""
         # Create a new session for the background task
-        session = async_session_factory()
+        session = background_session_factory()
         template_repository = PostgresTemplateRepository(session)
 
         return GenerateBatchUseCase(
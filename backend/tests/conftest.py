@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
+import os
 from collections.abc import AsyncGenerator
 from uuid import UUID, uuid4
 
@@ -30,6 +31,21 @@ from tests.factories import (
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip timing benchmarks (flaky on loaded runners) unless RUN_BENCHMARKS is set."""
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 # ============================================================================
 # Event Loop Configuration
 # ============================================================================
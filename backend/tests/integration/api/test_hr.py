@@ -167,6 +167,17 @@ class TestApplicationsEndpoints:
         )
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_analyze_applications_invalid_posting_id(
+        self, client: AsyncClient, admin_headers: dict
+    ):
+        """Should return 400 for a malformed posting id."""
+        response = await client.post(
+            "/api/v1/hr/job-postings/not-a-uuid/applications/analyze",
+            headers=admin_headers,
+        )
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_get_application_not_found(self, client: AsyncClient, admin_headers: dict):
         """Should return 404 for non-existent application."""
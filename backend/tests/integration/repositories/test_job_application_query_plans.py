@@ -0,0 +1,193 @@
+"""Query plan tests for the posting applications list (PostgreSQL only).
+
+Seeds job applications on a throwaway PostgreSQL database, creates the
+migration indexes, then runs EXPLAIN on the statements built by
+JobApplicationRepository and checks they are read in index order (cursor
+pages as an index range). Skipped unless TEST_POSTGRES_URL
+(postgresql+asyncpg://...) points to an empty database: the tables are
+created and dropped by the test.
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.entities import ApplicationStatus
+from app.infrastructure.database.models import Base, JobPostingModel, OpportunityModel
+from app.infrastructure.database.repositories import JobApplicationRepository
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+MIGRATIONS = Path(__file__).parents[3] / "alembic" / "versions"
+POSTINGS = 20
+APPLICATIONS_PER_POSTING = 500
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+def _migration_indexes(filename: str) -> dict[str, str]:
+    spec = importlib.util.spec_from_file_location(
+        filename.removesuffix(".py"), MIGRATIONS / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.INDEXES
+
+
+def _plan_nodes(plan: dict) -> list[dict]:
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_engine():
+    """PostgreSQL engine with the schema, the list indexes and seeded applications."""
+    engine = create_async_engine(POSTGRES_URL)
+    indexes = {
+        **_migration_indexes("028_add_keyset_pagination_indexes.py"),
+        **_migration_indexes("029_add_job_application_sort_indexes.py"),
+    }
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for name, definition in indexes.items():
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
+
+    async with AsyncSession(engine) as session:
+        opportunity = OpportunityModel(external_id="plan-test", title="Plan", reference="PLAN-1")
+        session.add(opportunity)
+        await session.flush()
+        posting_ids = []
+        for i in range(POSTINGS):
+            posting = JobPostingModel(
+                opportunity_id=opportunity.id,
+                title=f"Poste {i}",
+                description="Description",
+                qualifications="Qualifications",
+                location_country="France",
+                application_token=f"plan-test-{uuid4().hex}",
+            )
+            session.add(posting)
+            await session.flush()
+            posting_ids.append(posting.id)
+        await session.execute(
+            text(
+                """
+                INSERT INTO job_applications (
+                    id, job_posting_id, first_name, last_name, email, phone, job_title,
+                    cv_s3_key, cv_filename, is_read, status, availability, employment_status,
+                    tjm_current, tjm_desired, salary_current, salary_desired,
+                    matching_score, prescreen_score, created_at, updated_at
+                )
+                SELECT
+                    gen_random_uuid(), posting_id, 'Jean', 'Dupont',
+                    'candidat' || n || '@example.com', '0600000000', 'Développeur',
+                    'cv/' || n || '.pdf', 'cv.pdf', n % 3 = 0,
+                    (ARRAY['en_cours', 'valide', 'refuse'])[n % 3 + 1],
+                    (ARRAY['asap', '1_month', '3_months'])[n % 3 + 1],
+                    (ARRAY['freelance', 'employee', 'freelance,employee'])[n % 3 + 1],
+                    400 + n % 300, CASE WHEN n % 4 = 0 THEN NULL ELSE 450 + n % 350 END,
+                    40000 + n % 30000, CASE WHEN n % 5 = 0 THEN NULL ELSE 45000 + n % 35000 END,
+                    CASE WHEN n % 7 = 0 THEN NULL ELSE n % 101 END, n % 97,
+                    now() - n * interval '1 minute', now()
+                FROM unnest(CAST(:posting_ids AS uuid[])) AS posting_id,
+                    generate_series(1, :per_posting) AS n
+                """
+            ),
+            {"posting_ids": posting_ids, "per_posting": APPLICATIONS_PER_POSTING},
+        )
+        await session.commit()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE job_applications"))
+
+    yield engine, posting_ids[0]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _next_cursor(engine, posting_id, **filters) -> str:
+    """Cursor of the second page of a posting list."""
+    async with AsyncSession(engine) as session:
+        page = await JobApplicationRepository(session).list_page_by_posting(
+            posting_id, skip=0, limit=20, **filters
+        )
+    assert page.next_cursor is not None
+    return page.next_cursor
+
+
+async def _explain_list(engine, posting_id, cursor=None, **filters) -> list[dict]:
+    """Plan nodes of the page query run by list_page_by_posting."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statements and "FROM job_applications" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSession(engine) as session:
+            await JobApplicationRepository(session).list_page_by_posting(
+                posting_id, skip=0, limit=20, cursor=cursor, **filters
+            )
+            statement, parameters = statements[0]
+            conn = await session.connection()
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return _plan_nodes(plan[0]["Plan"])
+
+
+# (filters, index of the sort, sort column expected in the cursor Index Cond)
+LIST_CASES = [
+    ({"sort_by": "score"}, "ix_job_applications_posting_score", "matching_score"),
+    ({"sort_by": "prescreen"}, "ix_job_applications_posting_prescreen", "prescreen_score"),
+    ({"sort_by": "tjm"}, "ix_job_applications_posting_tjm", "tjm_desired"),
+    ({"sort_by": "salary"}, "ix_job_applications_posting_salary", "salary_desired"),
+    ({"sort_by": "date"}, "ix_job_applications_posting_created_at_id", "created_at"),
+    (
+        {"sort_by": "date", "status": ApplicationStatus.EN_COURS},
+        "ix_job_applications_posting_status_created_at_id",
+        "created_at",
+    ),
+]
+
+
+class TestJobApplicationListPlans:
+    """Pages of a posting are read in index order, without a sort."""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(("filters", "index_name", "sort_column"), LIST_CASES)
+    async def test_list_uses_matching_index(self, seeded_engine, filters, index_name, sort_column):
+        nodes = await _explain_list(*seeded_engine, **filters)
+
+        scans = {node.get("Index Name") for node in nodes if "Index" in node["Node Type"]}
+        assert index_name in scans
+        assert not any(node["Node Type"] in ("Sort", "Seq Scan") for node in nodes)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(("filters", "index_name", "sort_column"), LIST_CASES)
+    async def test_cursor_page_is_an_index_range(
+        self, seeded_engine, filters, index_name, sort_column
+    ):
+        engine, posting_id = seeded_engine
+        cursor = await _next_cursor(engine, posting_id, **filters)
+
+        nodes = await _explain_list(engine, posting_id, cursor=cursor, **filters)
+
+        # The keyset comparison bounds the index scan instead of filtering its rows
+        scans = [node for node in nodes if node.get("Index Name") == index_name]
+        assert scans
+        assert any(sort_column in scan.get("Index Cond", "") for scan in scans)
+        assert not any(node["Node Type"] in ("Sort", "Seq Scan") for node in nodes)
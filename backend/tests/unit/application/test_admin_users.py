@@ -1,7 +1,7 @@
 """Unit tests for admin user use cases."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, call
 from uuid import uuid4
 
 import pytest
@@ -185,6 +185,27 @@ class TestChangeUserRoleUseCase:
         assert result is not None
         mock_user_repository.save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_change_role_invalidates_principal(
+        self, mock_user_repository, sample_user, admin_user
+    ):
+        """Test that the user's cached principal is dropped once the role change is committed."""
+        mock_user_repository.get_by_id.return_value = sample_user
+        mock_user_repository.save.return_value = sample_user
+        principal_cache, unit_of_work = AsyncMock(), AsyncMock()
+        calls = MagicMock()
+        calls.attach_mock(unit_of_work.commit, "commit")
+        calls.attach_mock(principal_cache.invalidate, "invalidate")
+
+        use_case = ChangeUserRoleUseCase(
+            user_repository=mock_user_repository,
+            principal_cache=principal_cache,
+            unit_of_work=unit_of_work,
+        )
+        await use_case.execute(sample_user.id, "commercial", admin_user.id)
+
+        assert calls.mock_calls == [call.commit(), call.invalidate(sample_user.id)]
+
     @pytest.mark.asyncio
     async def test_change_role_invalid(self, mock_user_repository, sample_user, admin_user):
         """Test changing to an invalid role."""
@@ -260,6 +281,27 @@ class TestDeactivateUserUseCase:
         with pytest.raises(CannotModifyOwnAccountError):
             await use_case.execute(admin_user.id, admin_user.id)
 
+    @pytest.mark.asyncio
+    async def test_deactivate_user_invalidates_principal(
+        self, mock_user_repository, sample_user, admin_user
+    ):
+        """Test that a deactivated user's cached principal is dropped after the commit."""
+        mock_user_repository.get_by_id.return_value = sample_user
+        mock_user_repository.save.return_value = sample_user
+        principal_cache, unit_of_work = AsyncMock(), AsyncMock()
+        calls = MagicMock()
+        calls.attach_mock(unit_of_work.commit, "commit")
+        calls.attach_mock(principal_cache.invalidate, "invalidate")
+
+        use_case = DeactivateUserUseCase(
+            user_repository=mock_user_repository,
+            principal_cache=principal_cache,
+            unit_of_work=unit_of_work,
+        )
+        await use_case.execute(sample_user.id, admin_user.id)
+
+        assert calls.mock_calls == [call.commit(), call.invalidate(sample_user.id)]
+
     @pytest.mark.asyncio
     async def test_deactivate_user_not_found(self, mock_user_repository, admin_user):
         """Test deactivating a user that doesn't exist."""
@@ -311,8 +353,12 @@ class TestDeleteUserUseCase:
         """Test delete operation failure."""
         mock_user_repository.get_by_id.return_value = sample_user
         mock_user_repository.delete.return_value = False
+        principal_cache = AsyncMock()
 
-        use_case = DeleteUserUseCase(user_repository=mock_user_repository)
+        use_case = DeleteUserUseCase(
+            user_repository=mock_user_repository, principal_cache=principal_cache
+        )
 
         with pytest.raises(RuntimeError):
             await use_case.execute(sample_user.id, admin_user.id)
+        principal_cache.invalidate.assert_not_awaited()
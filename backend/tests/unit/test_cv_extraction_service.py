@@ -0,0 +1,269 @@
+"""Tests for CvTextExtractionService (off-loop CV text extraction)."""
+
+import asyncio
+import io
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from docx import Document
+
+from app.infrastructure.cv_transformer.extraction_service import CvTextExtractionService
+from app.infrastructure.cv_transformer.extractors import ExtractedDocument, content_hash
+from app.infrastructure.cv_transformer.text_cache import ExtractedTextCache
+from app.infrastructure.observability.metrics import (
+    cv_extraction_duration_seconds,
+    cv_extraction_failures_total,
+)
+
+
+def _make_docx(text: str) -> bytes:
+    """Build a minimal DOCX file containing one paragraph."""
+    document = Document()
+    document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _slow_extract(content: bytes, filename: str, max_chars: int | None = None) -> ExtractedDocument:
+    time.sleep(0.5)
+    return ExtractedDocument(text="too late", page_count=1)
+
+
+@pytest.fixture
+def thread_service():
+    service = CvTextExtractionService(executor="thread", max_workers=1, timeout_seconds=5)
+    yield service
+    service.shutdown()
+
+
+class TestCvTextExtractionService:
+    """Tests for pooled extraction, timeouts and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_extracts_docx_text_in_thread_pool(self, thread_service):
+        text = await thread_service.extract_text(_make_docx("Développeur Python"), "cv.docx")
+
+        assert text == "Développeur Python"
+
+    @pytest.mark.asyncio
+    async def test_extracts_docx_in_process_pool(self):
+        service = CvTextExtractionService(executor="process", max_workers=1, timeout_seconds=60)
+        try:
+            document = await service.extract_document(_make_docx("Data Engineer"), "CV.DOCX")
+        finally:
+            service.shutdown()
+
+        assert document.text == "Data Engineer"
+        assert document.page_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format_rejected_without_pool(self, thread_service):
+        with pytest.raises(ValueError, match="non supporté"):
+            await thread_service.extract_text(b"content", "cv.odt")
+
+        assert thread_service._pool is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_document_raises_value_error(self, thread_service):
+        with pytest.raises(ValueError, match="PDF"):
+            await thread_service.extract_text(b"not a pdf", "cv.pdf")
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_value_error_and_resets_pool(self):
+        service = CvTextExtractionService(executor="thread", max_workers=1, timeout_seconds=0.05)
+        before = _failure_count("docx", "timeout")
+
+        with patch(
+            "app.infrastructure.cv_transformer.extraction_service.extract_document",
+            _slow_extract,
+        ):
+            with pytest.raises(ValueError, match="délai"):
+                await service.extract_text(b"content", "cv.docx")
+
+        assert service._pool is None
+        assert _failure_count("docx", "timeout") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_reset_pool_terminates_running_workers(self):
+        service = CvTextExtractionService(executor="process", max_workers=1)
+        loop = asyncio.get_running_loop()
+        running = loop.run_in_executor(service._get_pool(), time.sleep, 30)
+        (worker,) = list(service._workers.processes)
+        while not worker.is_alive():
+            await asyncio.sleep(0.01)
+
+        service._reset_pool()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert service._pool is None
+        running.cancel()
+
+    def test_worker_imports_exclude_settings_and_llm_clients(self):
+        modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "import app.infrastructure.cv_transformer.extraction_worker\n"
+                "import app.infrastructure.cv_transformer.extractors\n"
+                "print(' '.join(sys.modules))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+
+        assert "app.config" not in modules
+        assert "anthropic" not in modules
+        assert "google.genai" not in modules
+
+    @pytest.mark.asyncio
+    async def test_records_duration_metrics(self, thread_service):
+        before = _observation_count("pdf")
+
+        with patch(
+            "app.infrastructure.cv_transformer.extraction_service.extract_document",
+            return_value=ExtractedDocument(text="CV", page_count=3),
+        ):
+            await thread_service.extract_text(b"content", "cv.pdf")
+
+        assert _observation_count("pdf") == before + 1
+
+
+class TestExtractedTextCacheLookup:
+    """Tests for the content-hash cache consulted before parsing."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_extraction(self):
+        text_cache = AsyncMock()
+        text_cache.get.return_value = ExtractedDocument(text="cached", page_count=2)
+        service = CvTextExtractionService(executor="thread", text_cache=text_cache)
+
+        with patch(
+            "app.infrastructure.cv_transformer.extraction_service.extract_document"
+        ) as mock_extract:
+            text = await service.extract_text(b"same bytes", "cv.pdf")
+
+        assert text == "cached"
+        text_cache.get.assert_called_once_with(content_hash(b"same bytes"))
+        mock_extract.assert_not_called()
+        text_cache.set.assert_not_called()
+        assert service._pool is None
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_extraction(self):
+        text_cache = AsyncMock()
+        text_cache.get.return_value = None
+        service = CvTextExtractionService(executor="thread", text_cache=text_cache)
+        content = _make_docx("Chef de projet")
+
+        try:
+            document = await service.extract_document(content, "cv.docx")
+        finally:
+            service.shutdown()
+
+        text_cache.set.assert_called_once_with(content_hash(content), document)
+
+    @pytest.mark.asyncio
+    async def test_budgeted_request_served_from_full_cached_text(self):
+        text_cache = AsyncMock()
+        text_cache.get.return_value = ExtractedDocument(text="x" * 50, page_count=1)
+        service = CvTextExtractionService(executor="thread", text_cache=text_cache)
+
+        document = await service.extract_document(b"bytes", "cv.pdf", max_chars=10)
+
+        assert document.text == "x" * 10
+        assert document.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_truncated_extraction_not_cached(self):
+        text_cache = AsyncMock()
+        text_cache.get.return_value = None
+        service = CvTextExtractionService(executor="thread", text_cache=text_cache)
+
+        try:
+            document = await service.extract_document(_make_docx("y" * 500), "cv.docx", 100)
+        finally:
+            service.shutdown()
+
+        assert document.truncated is True
+        text_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_not_cached(self):
+        text_cache = AsyncMock()
+        text_cache.get.return_value = None
+        service = CvTextExtractionService(executor="thread", text_cache=text_cache)
+
+        try:
+            with pytest.raises(ValueError):
+                await service.extract_text(b"not a pdf", "cv.pdf")
+        finally:
+            service.shutdown()
+
+        text_cache.set.assert_not_called()
+
+
+class TestExtractedTextCacheRetention:
+    """Tests for the retention of cached CV texts (personal data)."""
+
+    @staticmethod
+    def _cache(repository: AsyncMock, ttl_days: int = 30) -> tuple:
+        session = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        cache = ExtractedTextCache(session_factory, ttl_days=ttl_days)
+        patcher = patch(
+            "app.infrastructure.cv_transformer.text_cache.CvExtractedTextRepository",
+            return_value=repository,
+        )
+        patcher.start()
+        return cache, session, patcher
+
+    @pytest.mark.asyncio
+    async def test_get_ignores_texts_unused_for_ttl(self):
+        repository = AsyncMock()
+        repository.get.return_value = None
+        cache, session, patcher = self._cache(repository, ttl_days=7)
+        try:
+            assert await cache.get("hash") is None
+        finally:
+            patcher.stop()
+
+        used_since = repository.get.await_args.kwargs["used_since"]
+        assert abs(used_since - (datetime.utcnow() - timedelta(days=7))) < timedelta(minutes=1)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_purges_expired_texts(self):
+        repository = AsyncMock()
+        repository.delete_unused_since.return_value = 3
+        cache, session, patcher = self._cache(repository, ttl_days=30)
+        document = ExtractedDocument(text="CV", page_count=1)
+        try:
+            await cache.set("hash", document)
+        finally:
+            patcher.stop()
+
+        repository.save.assert_awaited_once()
+        (cutoff,) = repository.delete_unused_since.await_args.args
+        assert abs(cutoff - (datetime.utcnow() - timedelta(days=30))) < timedelta(minutes=1)
+        session.commit.assert_awaited_once()
+
+
+def _failure_count(file_format: str, reason: str) -> float:
+    for value in cv_extraction_failures_total.get_all():
+        if value.labels == {"format": file_format, "reason": reason}:
+            return value.value
+    return 0
+
+
+def _observation_count(file_format: str) -> int:
+    data = cv_extraction_duration_seconds.get_all().get(f'format="{file_format}"')
+    return data["count"] if data else 0
@@ -0,0 +1,95 @@
+"""Tests for PDF/DOCX text extractors (page streaming and character budget)."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docx import Document
+
+from app.infrastructure.cv_transformer.extractors import (
+    extract_document,
+    extract_text_from_pdf,
+    iter_pdf_pages,
+)
+
+
+def _mock_reader(page_texts: list[str]) -> MagicMock:
+    """Build a PdfReader mock whose pages return the given texts."""
+    reader = MagicMock()
+    reader.pages = [MagicMock(**{"extract_text.return_value": text}) for text in page_texts]
+    return reader
+
+
+def _make_docx(text: str) -> bytes:
+    document = Document()
+    document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class TestPdfPageStreaming:
+    """Tests for lazy page extraction with early cut-off."""
+
+    def test_iter_pdf_pages_is_lazy_and_skips_empty_pages(self):
+        reader = _mock_reader(["Page 1", "", "Page 3"])
+
+        with patch("app.infrastructure.cv_transformer.extractors.PdfReader", return_value=reader):
+            pages = iter_pdf_pages(b"%PDF")
+            assert next(pages) == "Page 1"
+            reader.pages[2].extract_text.assert_not_called()
+            assert list(pages) == ["Page 3"]
+
+    def test_budget_stops_reading_pages(self):
+        reader = _mock_reader(["a" * 60, "b" * 60, "c" * 60, "d" * 60])
+
+        with patch("app.infrastructure.cv_transformer.extractors.PdfReader", return_value=reader):
+            document = extract_document(b"%PDF", "cv.pdf", max_chars=100)
+
+        assert document.text == "a" * 60 + "\n\n" + "b" * 38
+        assert document.page_count == 2
+        assert document.truncated is True
+        reader.pages[2].extract_text.assert_not_called()
+        reader.pages[3].extract_text.assert_not_called()
+
+    def test_full_mode_reads_every_page(self):
+        reader = _mock_reader(["a" * 60, "b" * 60, "c" * 60])
+
+        with patch("app.infrastructure.cv_transformer.extractors.PdfReader", return_value=reader):
+            document = extract_document(b"%PDF", "cv.pdf")
+
+        assert document.page_count == 3
+        assert document.truncated is False
+        assert document.text.endswith("c" * 60)
+
+    def test_budget_larger_than_document_is_not_truncated(self):
+        reader = _mock_reader(["Page 1", "Page 2"])
+
+        with patch("app.infrastructure.cv_transformer.extractors.PdfReader", return_value=reader):
+            text = extract_text_from_pdf(b"%PDF", max_chars=10000)
+
+        assert text == "Page 1\n\nPage 2"
+
+    def test_pdf_without_text_raises(self):
+        with patch(
+            "app.infrastructure.cv_transformer.extractors.PdfReader",
+            return_value=_mock_reader(["", ""]),
+        ):
+            with pytest.raises(ValueError, match="texte extractible"):
+                extract_text_from_pdf(b"%PDF")
+
+
+class TestDocxBudget:
+    """Tests for the character budget applied to DOCX output."""
+
+    def test_docx_text_cut_at_budget(self):
+        document = extract_document(_make_docx("x" * 500), "cv.docx", max_chars=100)
+
+        assert document.text == "x" * 100
+        assert document.truncated is True
+
+    def test_docx_full_mode(self):
+        document = extract_document(_make_docx("Consultant SAP"), "cv.docx")
+
+        assert document.text == "Consultant SAP"
+        assert document.truncated is False
@@ -0,0 +1,107 @@
+"""Tests for the database engine settings."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config import Settings
+from app.infrastructure.database.connection import (
+    MeteredQueuePool,
+    _end_connection_hold,
+    _set_background_statement_timeout,
+    _start_connection_hold,
+    engine_options,
+)
+from app.infrastructure.observability.metrics import db_connection_hold_seconds
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(_env_file=None, **overrides)
+
+
+class TestEngineOptions:
+    """Tests for engine_options."""
+
+    def test_pool_settings_from_config(self):
+        options = engine_options(
+            _settings(
+                DB_POOL_SIZE=20,
+                DB_MAX_OVERFLOW=5,
+                DB_POOL_TIMEOUT_SECONDS=2.5,
+                DB_POOL_RECYCLE_SECONDS=120,
+                DB_POOL_PRE_PING=True,
+            )
+        )
+
+        assert options["poolclass"] is MeteredQueuePool
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["pool_timeout"] == 2.5
+        assert options["pool_recycle"] == 120
+        assert options["pool_pre_ping"] is True
+        assert options["echo"] is False
+
+    def test_asyncpg_statement_cache_and_timeout(self):
+        options = engine_options(
+            _settings(
+                DATABASE_URL="postgresql://user:pass@db:5432/app",
+                DB_STATEMENT_CACHE_SIZE=0,
+                DB_STATEMENT_TIMEOUT_MS=5000,
+            )
+        )
+
+        assert options["connect_args"] == {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "server_settings": {"statement_timeout": "5000"},
+        }
+
+    def test_sqlite_keeps_default_pool(self):
+        options = engine_options(_settings(DATABASE_URL="sqlite+aiosqlite:///:memory:"))
+
+        assert options == {"echo": False, "pool_pre_ping": False}
+
+
+class TestBackgroundStatementTimeout:
+    """Background sessions raise the statement timeout per transaction."""
+
+    def test_sets_local_timeout_on_postgresql(self):
+        connection = MagicMock()
+        connection.dialect.name = "postgresql"
+
+        _set_background_statement_timeout(MagicMock(), MagicMock(), connection)
+
+        statement = connection.exec_driver_sql.call_args.args[0]
+        assert statement.startswith("SET LOCAL statement_timeout = ")
+
+    def test_other_dialects_are_left_alone(self):
+        connection = MagicMock()
+        connection.dialect.name = "sqlite"
+
+        _set_background_statement_timeout(MagicMock(), MagicMock(), connection)
+
+        connection.exec_driver_sql.assert_not_called()
+
+
+class TestConnectionHold:
+    """Connection hold time is recorded per route when the transaction ends."""
+
+    def test_hold_recorded_once_per_transaction(self):
+        session = SimpleNamespace(info={"route": "/test/hold"})
+
+        _start_connection_hold(session, MagicMock(), MagicMock())
+        _end_connection_hold(session, SimpleNamespace(parent=object()))  # nested: still held
+        _end_connection_hold(session, SimpleNamespace(parent=None))
+        _end_connection_hold(session, SimpleNamespace(parent=None))  # no connection begun
+
+        assert db_connection_hold_seconds.get_all()['route="/test/hold"']["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_release_commits_the_session(self):
+        session = AsyncMock()
+
+        await SqlAlchemyUnitOfWork(session).release()
+
+        session.commit.assert_awaited_once()
@@ -11,7 +11,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.domain.exceptions import CvMatchingError
-from app.infrastructure.matching.gemini_matcher import GeminiMatchingService
+from app.infrastructure.matching.gemini_matcher import (
+    BatchMatchingCandidate,
+    GeminiMatchingService,
+)
 
 # ============================================================================
 # Fixtures
@@ -400,6 +403,174 @@ class TestCalculateMatchEnhanced:
         assert result["score_global"] == 100
 
 
+# ============================================================================
+# calculate_match_batch Tests
+# ============================================================================
+
+
+def _batch_payload(sample_enhanced_response: str, candidate_ids: list[str]) -> str:
+    """Build a batch JSON array response from the single-candidate fixture."""
+    items = []
+    for index, candidate_id in enumerate(candidate_ids):
+        item = json.loads(sample_enhanced_response)
+        item["candidate_id"] = candidate_id
+        item["score_global"] = 50 + index
+        items.append(item)
+    return json.dumps(items)
+
+
+class TestCalculateMatchBatch:
+    """Tests for the calculate_match_batch method."""
+
+    @pytest.mark.asyncio
+    @patch("app.infrastructure.matching.gemini_matcher.genai")
+    async def test_batch_sends_one_request_for_several_candidates(
+        self, mock_genai, mock_settings, sample_enhanced_response
+    ):
+        """Test that candidates of one batch share a single request and job description."""
+        mock_genai_client = MagicMock()
+        mock_genai.Client.return_value = mock_genai_client
+        mock_generate = AsyncMock(
+            return_value=_make_response(_batch_payload(sample_enhanced_response, ["a", "b", "c"]))
+        )
+        mock_genai_client.aio.models.generate_content = mock_generate
+
+        service = GeminiMatchingService(mock_settings)
+        results = await service.calculate_match_batch(
+            candidates=[
+                BatchMatchingCandidate(candidate_id=cid, cv_text=f"CV {cid}") for cid in "abc"
+            ],
+            job_title_offer="Developpeur Python",
+            job_description="Description unique de l'offre",
+            required_skills=["Python"],
+        )
+
+        mock_generate.assert_called_once()
+        prompt = mock_generate.call_args.kwargs["contents"]
+        assert prompt.count("Description unique de l'offre") == 1
+        assert "## CANDIDAT b" in prompt
+        assert {cid: r["score_global"] for cid, r in results.items()} == {
+            "a": 50,
+            "b": 51,
+            "c": 52,
+        }
+        assert results["a"]["score"] == 50
+
+    @pytest.mark.asyncio
+    @patch("app.infrastructure.matching.gemini_matcher.genai")
+    async def test_batch_splits_candidates_by_batch_size(
+        self, mock_genai, mock_settings, sample_enhanced_response
+    ):
+        """Test that candidates are packed in groups of BATCH_MAX_CANDIDATES."""
+        mock_genai_client = MagicMock()
+        mock_genai.Client.return_value = mock_genai_client
+        mock_generate = AsyncMock(
+            side_effect=[
+                _make_response(_batch_payload(sample_enhanced_response, ["0", "1"])),
+                _make_response(_batch_payload(sample_enhanced_response, ["2", "3"])),
+            ]
+        )
+        mock_genai_client.aio.models.generate_content = mock_generate
+
+        service = GeminiMatchingService(mock_settings)
+        service.BATCH_MAX_CANDIDATES = 2
+        results = await service.calculate_match_batch(
+            candidates=[
+                BatchMatchingCandidate(candidate_id=str(i), cv_text="CV") for i in range(4)
+            ],
+            job_title_offer="Dev",
+            job_description="Description",
+        )
+
+        assert mock_generate.call_count == 2
+        assert set(results) == {"0", "1", "2", "3"}
+
+    @pytest.mark.asyncio
+    @patch("app.infrastructure.matching.gemini_matcher.genai")
+    async def test_batch_falls_back_to_single_calls_for_missing_candidates(
+        self, mock_genai, mock_settings, sample_enhanced_response
+    ):
+        """Test that candidates absent from the batch response are analysed one by one."""
+        mock_genai_client = MagicMock()
+        mock_genai.Client.return_value = mock_genai_client
+        mock_generate = AsyncMock(
+            side_effect=[
+                _make_response(_batch_payload(sample_enhanced_response, ["a"])),
+                _make_response(sample_enhanced_response),
+            ]
+        )
+        mock_genai_client.aio.models.generate_content = mock_generate
+
+        service = GeminiMatchingService(mock_settings)
+        results = await service.calculate_match_batch(
+            candidates=[
+                BatchMatchingCandidate(candidate_id="a", cv_text="CV a"),
+                BatchMatchingCandidate(candidate_id="b", cv_text="CV b"),
+            ],
+            job_title_offer="Dev",
+            job_description="Description",
+        )
+
+        assert mock_generate.call_count == 2
+        assert results["a"]["score_global"] == 50
+        assert results["b"]["score_global"] == 72
+
+    @pytest.mark.asyncio
+    @patch("app.infrastructure.matching.gemini_matcher.genai")
+    async def test_batch_invalid_response_falls_back_and_omits_failures(
+        self, mock_genai, mock_settings, sample_enhanced_response
+    ):
+        """Test that a malformed batch triggers single calls and failed ones are omitted."""
+        mock_genai_client = MagicMock()
+        mock_genai.Client.return_value = mock_genai_client
+        mock_generate = AsyncMock(
+            side_effect=[
+                _make_response("not json at all"),
+                _make_response(sample_enhanced_response),
+                Exception("API quota exceeded"),
+            ]
+        )
+        mock_genai_client.aio.models.generate_content = mock_generate
+
+        service = GeminiMatchingService(mock_settings)
+        results = await service.calculate_match_batch(
+            candidates=[
+                BatchMatchingCandidate(candidate_id="a", cv_text="CV a"),
+                BatchMatchingCandidate(candidate_id="b", cv_text="CV b"),
+            ],
+            job_title_offer="Dev",
+            job_description="Description",
+        )
+
+        assert mock_generate.call_count == 3
+        assert list(results) == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_defaults_when_not_configured(self, mock_settings_no_key):
+        """Test that every candidate gets the default result without API key."""
+        service = GeminiMatchingService(mock_settings_no_key)
+        results = await service.calculate_match_batch(
+            candidates=[BatchMatchingCandidate(candidate_id="a", cv_text="CV")],
+            job_title_offer="Dev",
+            job_description="Description",
+        )
+
+        assert results["a"]["score_global"] == 0
+
+    def test_parse_batch_response_skips_entries_without_id(
+        self, mock_settings, sample_enhanced_response
+    ):
+        """Test that only array entries carrying a candidate_id are kept."""
+        service = GeminiMatchingService(mock_settings)
+        payload = json.loads(_batch_payload(sample_enhanced_response, ["a"]))
+        payload.append(json.loads(sample_enhanced_response))
+
+        results = service._parse_batch_response(f"```json\n{json.dumps(payload)}\n```")
+
+        assert list(results) == ["a"]
+        assert "candidate_id" not in results["a"]
+
+
 # ============================================================================
 # calculate_match (Legacy) Tests
 # ============================================================================
@@ -0,0 +1,94 @@
+"""Tests for JobPostingAnonymizer skills prompt modes."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.anonymizer.job_posting_anonymizer import JobPostingAnonymizer
+
+SKILLS = [
+    {"name": "Java", "slug": "java"},
+    {"name": "Python", "slug": "python"},
+    {"name": "Spring Boot", "slug": "spring-boot"},
+    {"name": "Angular", "slug": "angular"},
+    {"name": "Kubernetes", "slug": "kubernetes"},
+]
+
+
+def _anonymizer(mode: str, gemini_skills: list[list[str]]) -> JobPostingAnonymizer:
+    settings = MagicMock(
+        GEMINI_API_KEY="test-key",
+        ANONYMIZER_SKILLS_MODE=mode,
+        ANONYMIZER_SKILLS_LIMIT=300,
+    )
+    anonymizer = JobPostingAnonymizer(settings, MagicMock(), turnoverit_client=MagicMock())
+    anonymizer.ensure_skills_synced = AsyncMock()
+    anonymizer.get_cached_skills = AsyncMock(return_value=SKILLS)
+
+    responses = [
+        MagicMock(
+            text=json.dumps(
+                {
+                    "title": "Développeur Java (H/F)",
+                    "description": "Description",
+                    "qualifications": "Profil",
+                    "skills": skills,
+                }
+            )
+        )
+        for skills in gemini_skills
+    ]
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(side_effect=responses)
+    anonymizer._client = client
+    return anonymizer
+
+
+def _prompts(anonymizer: JobPostingAnonymizer) -> list[str]:
+    generate = anonymizer._client.aio.models.generate_content
+    return [call.kwargs["contents"] for call in generate.call_args_list]
+
+
+class TestAnonymizeSkillsMode:
+    """Tests for the skills list sent to Gemini."""
+
+    @pytest.mark.asyncio
+    async def test_retrieval_sends_only_mentioned_skills(self):
+        anonymizer = _anonymizer("retrieval", [["java", "spring-boot"]])
+
+        result = await anonymizer.anonymize("Développeur Java", "API Spring Boot")
+
+        (prompt,) = _prompts(anonymizer)
+        assert "slug: java)" in prompt
+        assert "slug: spring-boot)" in prompt
+        assert "slug: python)" not in prompt
+        assert result.skills == ["java", "spring-boot"]
+
+    @pytest.mark.asyncio
+    async def test_retrieval_falls_back_to_full_list(self):
+        anonymizer = _anonymizer("retrieval", [[]])
+
+        await anonymizer.anonymize("Chef de projet", "Pilotage budgétaire")
+
+        (prompt,) = _prompts(anonymizer)
+        assert all(f"slug: {s['slug']})" in prompt for s in SKILLS)
+
+    @pytest.mark.asyncio
+    async def test_full_mode_sends_every_skill(self):
+        anonymizer = _anonymizer("full", [["java"]])
+
+        await anonymizer.anonymize("Développeur Java", "API Spring Boot")
+
+        (prompt,) = _prompts(anonymizer)
+        assert all(f"slug: {s['slug']})" in prompt for s in SKILLS)
+
+    @pytest.mark.asyncio
+    async def test_compare_mode_returns_retrieval_result(self):
+        anonymizer = _anonymizer("compare", [["java"], ["java", "kubernetes"]])
+
+        result = await anonymizer.anonymize("Développeur Java", "API Spring Boot")
+
+        retrieval_prompt, full_prompt = _prompts(anonymizer)
+        assert len(retrieval_prompt) < len(full_prompt)
+        assert result.skills == ["java"]
@@ -0,0 +1,62 @@
+"""Tests for LocalMatchingScorer (CPU-only CV pre-scoring)."""
+
+from app.infrastructure.matching.local_scorer import LocalMatchingScorer, tokenize
+
+CV_PYTHON = """
+Jean DUPONT - Développeur Python senior
+8 ans d'expérience : FastAPI, PostgreSQL, Docker, Kubernetes.
+Analyse de données avec Pandas. Missions chez BNP Paribas.
+"""
+
+CV_JAVA = """
+Marie MARTIN - Développeuse Java
+Spring Boot, Hibernate, Oracle. Méthodologie Agile Scrum.
+"""
+
+
+class TestTokenize:
+    """Tests for text normalization and tokenization."""
+
+    def test_strips_accents_and_lowercases(self):
+        assert tokenize("Développeur Sénior") == ["developpeur", "senior"]
+
+    def test_keeps_technology_markers(self):
+        assert tokenize("C#, C++ et Node.js.") == ["c#", "c++", "node.js"]
+
+    def test_drops_stopwords(self):
+        assert tokenize("maîtrise de la data") == ["data"]
+
+
+class TestLocalMatchingScorer:
+    """Tests for provisional scoring."""
+
+    def test_matching_profile_scores_higher(self):
+        scorer = LocalMatchingScorer()
+        skills = ["Python", "FastAPI", "Kubernetes"]
+        qualifications = "Maîtrise de Python et Docker, expérience Kubernetes"
+
+        python_result = scorer.score(CV_PYTHON, skills, qualifications)
+        java_result = scorer.score(CV_JAVA, skills, qualifications)
+
+        assert python_result.score > 70
+        assert java_result.score < 20
+        assert python_result.matched_skills == skills
+        assert java_result.missing_skills == skills
+
+    def test_multi_word_skill_matched_as_phrase(self):
+        scorer = LocalMatchingScorer()
+
+        result = scorer.score(CV_PYTHON, ["Analyse de données", "Spring Boot"])
+
+        assert result.matched_skills == ["Analyse de données"]
+        assert result.missing_skills == ["Spring Boot"]
+        assert result.score == 50
+
+    def test_empty_cv_scores_zero(self):
+        result = LocalMatchingScorer().score("", ["Python"], "Python")
+
+        assert result.score == 0
+        assert result.missing_skills == ["Python"]
+
+    def test_no_criteria_scores_zero(self):
+        assert LocalMatchingScorer().score(CV_PYTHON, [], "").score == 0
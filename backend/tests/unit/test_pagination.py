@@ -0,0 +1,219 @@
+"""Tests for offset (COUNT(*) OVER ()) and keyset cursor pagination."""
+
+import base64
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import result_tuple
+
+from app.infrastructure.database.models import PublishedOpportunityModel
+from app.infrastructure.database.repositories import InvalidCursorError, SortKey, fetch_page
+from app.infrastructure.database.repositories.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_ranges,
+)
+
+QUERY = select(PublishedOpportunityModel).order_by(PublishedOpportunityModel.created_at.desc())
+KEYS = [
+    SortKey(PublishedOpportunityModel.created_at, nullable=False),
+    SortKey(PublishedOpportunityModel.id, nullable=False),
+]
+KEYED_ROW = result_tuple(["PublishedOpportunityModel", "sort_key_0", "sort_key_1", "total_count"])
+CURSOR_ROW = result_tuple(["PublishedOpportunityModel", "sort_key_0", "sort_key_1"])
+
+
+def _session(*results: list[tuple]) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.side_effect = [
+        MagicMock(all=MagicMock(return_value=rows), scalar=MagicMock(return_value=rows))
+        for rows in results
+    ]
+    return session
+
+
+class TestFetchPage:
+    """Tests for fetch_page."""
+
+    @pytest.mark.asyncio
+    async def test_total_read_from_window_column(self):
+        session = _session([("first", 42), ("second", 42)])
+
+        page = await fetch_page(session, QUERY, skip=20, limit=2)
+
+        assert page.total == 42
+        assert [row[0] for row in page.items] == ["first", "second"]
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "count(*) OVER () AS total_count" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_first_page_needs_no_count(self):
+        session = _session([])
+
+        page = await fetch_page(session, QUERY, skip=0, limit=20)
+
+        assert page.items == []
+        assert page.total == 0
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_page_past_the_end_counts_separately(self):
+        session = _session([], 7)
+
+        page = await fetch_page(session, QUERY, skip=40, limit=20)
+
+        assert page.items == []
+        assert page.total == 7
+        assert session.execute.await_count == 2
+        count_sql = str(session.execute.await_args.args[0])
+        assert "count(*)" in count_sql
+        assert "ORDER BY" not in count_sql
+
+    @pytest.mark.asyncio
+    async def test_offset_page_with_keys_returns_next_cursor(self):
+        created_at, last_id = datetime(2026, 3, 1, 9, 30), uuid4()
+        session = _session(
+            [
+                KEYED_ROW(("first", datetime(2026, 3, 2), uuid4(), 5)),
+                KEYED_ROW(("second", created_at, last_id, 5)),
+            ]
+        )
+
+        page = await fetch_page(session, QUERY, skip=0, limit=2, keys=KEYS)
+
+        assert decode_cursor(KEYS, page.next_cursor) == ([created_at, last_id], 5)
+        sql = str(session.execute.await_args.args[0])
+        assert (
+            "ORDER BY published_opportunities.created_at DESC, published_opportunities.id DESC"
+            in sql
+        )
+
+    @pytest.mark.asyncio
+    async def test_last_offset_page_has_no_cursor(self):
+        session = _session([KEYED_ROW(("last", datetime(2026, 3, 1), uuid4(), 3))])
+
+        page = await fetch_page(session, QUERY, skip=2, limit=2, keys=KEYS)
+
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_reads_after_cursor_row_with_carried_total(self):
+        cursor = encode_cursor(KEYS, [datetime(2026, 3, 1), uuid4()], 12)
+        rows = [CURSOR_ROW((f"row-{i}", datetime(2026, 2, i), uuid4())) for i in (1, 2, 3)]
+        session = _session(rows)
+
+        page = await fetch_page(session, QUERY, skip=0, limit=2, keys=KEYS, cursor=cursor)
+
+        assert [row[0] for row in page.items] == ["row-1", "row-2"]
+        assert page.total == 12
+        assert decode_cursor(KEYS, page.next_cursor) == ([datetime(2026, 2, 2), rows[1][2]], 12)
+        session.execute.assert_awaited_once()  # no COUNT on cursor pages
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "(published_opportunities.created_at, published_opportunities.id) < (" in sql
+        assert " OR " not in sql
+        assert "OFFSET" not in sql
+        assert "OVER ()" not in sql
+        assert session.execute.await_args.args[0]._limit == 3  # one extra row
+
+    @pytest.mark.asyncio
+    async def test_cursor_without_total_counts_separately(self):
+        cursor = encode_cursor(KEYS, [datetime(2026, 3, 1), uuid4()])
+        session = _session([CURSOR_ROW(("row", datetime(2026, 2, 1), uuid4()))], 12)
+
+        page = await fetch_page(session, QUERY, skip=0, limit=2, keys=KEYS, cursor=cursor)
+
+        assert page.total == 12
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nullable_leading_key_reads_null_rows_after_the_bounded_range(self):
+        keys = [SortKey(PublishedOpportunityModel.end_date), *KEYS]
+        cursor = encode_cursor(keys, [datetime(2026, 4, 1), datetime(2026, 3, 1), uuid4()], 9)
+        row = result_tuple(["PublishedOpportunityModel", "sort_key_0", "sort_key_1", "sort_key_2"])
+        session = _session(
+            [row(("dated", datetime(2026, 3, 1), datetime(2026, 2, 1), uuid4()))],
+            [row((f"undated-{i}", None, datetime(2026, 1, i), uuid4())) for i in (1, 2)],
+        )
+
+        page = await fetch_page(session, QUERY, skip=0, limit=2, keys=keys, cursor=cursor)
+
+        assert [r[0] for r in page.items] == ["dated", "undated-1"]
+        assert decode_cursor(keys, page.next_cursor)[0][0] is None
+        bounded, nulls = (
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.await_args_list
+        )
+        assert "published_opportunities.end_date <= " in bounded
+        assert (
+            "(published_opportunities.end_date, published_opportunities.created_at, "
+            "published_opportunities.id) < (" in bounded
+        )
+        assert "published_opportunities.end_date IS NULL" in nulls
+        assert session.execute.await_args_list[1].args[0]._limit == 2  # rest of the page
+
+    def test_null_leading_cursor_value_stays_in_the_null_range(self):
+        keys = [SortKey(PublishedOpportunityModel.end_date), *KEYS]
+
+        (after,) = keyset_ranges(keys, [None, datetime(2026, 3, 1), uuid4()])
+
+        sql = str(after.compile(dialect=postgresql.dialect()))
+        assert "published_opportunities.end_date IS NULL AND " in sql
+        assert "(published_opportunities.created_at, published_opportunities.id) < (" in sql
+
+    def test_mixed_directions_use_the_expanded_predicate(self):
+        keys = [SortKey(PublishedOpportunityModel.end_date, descending=False), *KEYS]
+
+        (after,) = keyset_ranges(keys, [datetime(2026, 4, 1), datetime(2026, 3, 1), uuid4()])
+
+        sql = str(after.compile(dialect=postgresql.dialect()))
+        assert "published_opportunities.end_date > " in sql
+        assert " OR " in sql
+
+    @pytest.mark.asyncio
+    async def test_cursor_of_another_ordering_is_rejected(self):
+        cursor = encode_cursor(KEYS[:1], [datetime(2026, 3, 1)])
+
+        with pytest.raises(InvalidCursorError):
+            await fetch_page(_session(), QUERY, skip=0, limit=2, keys=KEYS, cursor=cursor)
+
+
+class TestCursorEncoding:
+    """Tests for the opaque cursor format."""
+
+    def test_round_trip_keeps_types(self):
+        values = [datetime(2026, 3, 1, 9, 30), uuid4()]
+
+        assert decode_cursor(KEYS, encode_cursor(KEYS, values, 3)) == (values, 3)
+
+    def test_null_key_value_round_trips(self):
+        keys = [SortKey(PublishedOpportunityModel.end_date), KEYS[1]]
+        values = [None, uuid4()]
+
+        assert decode_cursor(keys, encode_cursor(keys, values)) == (values, None)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"v": ["abc", {"uuid": str(uuid4())}]},  # wrong type for created_at
+            {"t": 10**9},  # forged total
+        ],
+    )
+    def test_altered_cursor_is_rejected(self, change):
+        cursor = encode_cursor(KEYS, [datetime(2026, 3, 1), uuid4()], 12)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        altered = json.dumps(payload | change).encode()
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(KEYS, base64.urlsafe_b64encode(altered).decode())
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJ2IjpbXX0"])
+    def test_malformed_cursor_is_a_value_error(self, cursor):
+        with pytest.raises(ValueError, match="Curseur de pagination invalide"):
+            decode_cursor(KEYS, cursor)
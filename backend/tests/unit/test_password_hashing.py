@@ -0,0 +1,62 @@
+"""Tests for password hashing off the event loop."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.observability.metrics import password_hash_queue_depth
+from app.infrastructure.security import password
+from app.infrastructure.security.password import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt():
+    """Use the minimum bcrypt cost and a fresh pool in each test."""
+    with patch.object(password.settings, "PASSWORD_BCRYPT_ROUNDS", 4):
+        yield
+    password.shutdown_password_pool()
+
+
+class TestPasswordHashing:
+    """Tests for the async password helpers."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_round_trip(self):
+        hashed = await hash_password_async("s3cret")
+
+        assert hashed.startswith("$2b$04$")
+        assert await verify_password_async("s3cret", hashed)
+        assert not await verify_password_async("wrong", hashed)
+
+    @pytest.mark.asyncio
+    async def test_runs_outside_event_loop_thread(self):
+        threads = []
+        original = password.hash_password
+
+        def recording_hash(value: str) -> str:
+            threads.append(threading.current_thread().name)
+            return original(value)
+
+        with patch.object(password, "hash_password", recording_hash):
+            await hash_password_async("s3cret")
+
+        assert threads[0].startswith("password-hash")
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_returns_to_zero(self):
+        before = password_hash_queue_depth.get_all()
+        before_value = before[0].value if before else 0.0
+
+        await hash_password_async("s3cret")
+
+        assert password_hash_queue_depth.get_all()[0].value == before_value
+
+    def test_needs_rehash_compares_cost(self):
+        assert not needs_rehash("$2b$04$" + "h" * 53)
+        assert needs_rehash("$2b$12$" + "h" * 53)
+        assert needs_rehash("not-a-bcrypt-hash")
@@ -0,0 +1,170 @@
+"""Tests for the authenticated principal cache."""
+
+import json
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.dependencies import authenticate
+from app.domain.value_objects import UserRole
+from app.infrastructure.security.principal import (
+    Principal,
+    PrincipalCache,
+    resolve_principal,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis storing strings in a dict."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.get = AsyncMock(side_effect=self.data.get)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+def _principal(**overrides) -> Principal:
+    values = {"id": uuid4(), "role": UserRole.RH, "is_active": True, "boond_resource_id": "42"}
+    values.update(overrides)
+    return Principal(**values)
+
+
+def _cache(redis=None, **overrides) -> PrincipalCache:
+    options = {"ttl_seconds": 60, "local_ttl_seconds": 10.0, "max_size": 16}
+    options.update(overrides)
+    return PrincipalCache(redis=redis, **options)
+
+
+class TestPrincipalCache:
+    """Tests for PrincipalCache."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self):
+        redis = FakeRedis()
+        cache = _cache(redis)
+        principal = _principal()
+
+        await cache.set(principal)
+
+        assert await cache.get(principal.id) == principal
+        redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_after_local_expiry(self):
+        redis = FakeRedis()
+        principal = _principal()
+        await _cache(redis).set(principal)
+
+        # Another worker: empty LRU, same Redis
+        cache = _cache(redis, local_ttl_seconds=0)
+
+        assert await cache.get(principal.id) == principal
+        redis.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_both_levels(self):
+        redis = FakeRedis()
+        cache = _cache(redis)
+        principal = _principal()
+        await cache.set(principal)
+
+        await cache.invalidate(principal.id)
+
+        assert await cache.get(principal.id) is None
+        assert redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        redis = FakeRedis()
+        redis.get.side_effect = RedisConnectionError("down")
+
+        assert await _cache(redis).get(uuid4()) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not json",
+            '{"id": "not-a-uuid", "role": "rh", "is_active": true}',
+            '{"role": "rh", "is_active": true}',
+            json.dumps({"id": str(uuid4()), "role": "unknown", "is_active": True}),
+            "[]",
+        ],
+    )
+    async def test_unreadable_entry_is_a_miss_and_dropped(self, value):
+        redis = FakeRedis()
+        user_id = uuid4()
+        redis.data[f"{PrincipalCache.KEY_PREFIX}{user_id}"] = value
+
+        assert await _cache(redis).get(user_id) is None
+        assert redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self):
+        cache = _cache(max_size=2)
+        first, second, third = _principal(), _principal(), _principal()
+        await cache.set(first)
+        await cache.set(second)
+        await cache.get(first.id)
+
+        await cache.set(third)
+
+        assert await cache.get(second.id) is None
+        assert await cache.get(first.id) == first
+
+    def test_json_round_trip(self):
+        principal = _principal(role=UserRole.ADMIN, boond_resource_id=None)
+
+        assert Principal.from_json(principal.to_json()) == principal
+        assert principal.is_admin
+
+
+class TestResolvePrincipal:
+    """Tests for resolve_principal and the authenticate dependency."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_user_then_caches(self):
+        cache = _cache()
+        user = _principal()
+        with (
+            patch(
+                "app.infrastructure.security.principal.get_principal_cache",
+                return_value=cache,
+            ),
+            patch("app.infrastructure.security.principal.UserRepository") as repository,
+        ):
+            repository.return_value.get_by_id = AsyncMock(return_value=user)
+
+            assert await resolve_principal(AsyncMock(), user.id) == user
+            assert await resolve_principal(AsyncMock(), user.id) == user
+
+        repository.return_value.get_by_id.assert_awaited_once_with(user.id)
+
+    @pytest.mark.asyncio
+    async def test_authenticate_rejects_deactivated_account(self):
+        principal = _principal(is_active=False)
+        with (
+            patch(
+                "app.api.dependencies.decode_token",
+                return_value=type("Payload", (), {"sub": str(principal.id)}),
+            ),
+            patch(
+                "app.api.dependencies.resolve_principal",
+                AsyncMock(return_value=principal),
+            ),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await authenticate(AsyncMock(), "Bearer token")
+            assert exc_info.value.status_code == 403
+
+            assert await authenticate(AsyncMock(), "Bearer token", require_active=False) == (
+                principal
+            )
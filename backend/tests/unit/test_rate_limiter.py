@@ -0,0 +1,183 @@
+"""Tests for the sliding window rate limiter."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.middleware.rate_limiter import Limiter, parse_rate, rate_limit_exceeded_handler
+from app.infrastructure.security.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimitExceeded,
+    RedisRateLimiter,
+    sliding_window_result,
+)
+
+NOW = 1_000_040.0  # 20 s into the 60 s window starting at 1_000_020
+
+
+class FakeRedis:
+    """Redis whose registered script is the Python twin of the Lua script."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, float]] = {}
+        self.script = AsyncMock(side_effect=self._run)
+
+    def register_script(self, source: str):
+        return self.script
+
+    async def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+
+    async def _run(self, keys: list[str], args: list) -> list[int]:
+        limit, window, index, weight = args
+        state = self.hashes.get(keys[0], {})
+        current = previous = 0
+        if state.get("index") == index:
+            current, previous = state["current"], state["previous"]
+        elif state.get("index") == index - 1:
+            previous = state["current"]
+        if previous * weight + current + 1 > limit:
+            return [0, current, previous]
+        current += 1
+        self.hashes[keys[0]] = {"index": index, "current": current, "previous": previous}
+        return [1, current, previous]
+
+
+@pytest.fixture
+def clock():
+    with patch("app.infrastructure.security.rate_limiter.time.time", return_value=NOW) as now:
+        yield now
+
+
+class TestSlidingWindow:
+    """Tests for the sliding window counter algorithm."""
+
+    @pytest.mark.asyncio
+    async def test_limit_within_window(self, clock):
+        limiter = InMemoryRateLimiter()
+
+        results = [await limiter.check("k", 3, 60) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_previous_window_weighted(self, clock):
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            await limiter.check("k", 3, 60)
+
+        # 30 s into the next window: half of the previous 3 requests still count
+        clock.return_value = NOW + 70
+        results = [await limiter.check("k", 3, 60) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, False, False]
+        assert results[1].reset_at == pytest.approx(1_000_080 + 40)
+
+    @pytest.mark.asyncio
+    async def test_counters_dropped_after_two_windows(self, clock):
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            await limiter.check("k", 3, 60)
+
+        clock.return_value = NOW + 120
+
+        assert (await limiter.check("k", 3, 60)).remaining == 2
+
+    def test_reset_at_in_next_window_when_current_full(self):
+        result = sliding_window_result(False, 4, 0, 4, 60, NOW)
+
+        # 4 * (1 - g) <= 3 once a quarter of the next window has passed
+        assert result.reset_at == pytest.approx(1_000_020 + 60 + 15)
+
+
+class TestRedisRateLimiter:
+    """Tests for RedisRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_one_script_call_per_check(self, clock):
+        redis = FakeRedis()
+        limiter = RedisRateLimiter(redis)
+
+        results = [await limiter.check("k", 2, 60) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert redis.script.await_count == 3
+        assert redis.script.await_args.kwargs["keys"] == ["ratelimit:k"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_key_shed_locally_until_reset_at(self, clock):
+        redis = FakeRedis()
+        limiter = RedisRateLimiter(redis)
+        for _ in range(3):
+            await limiter.check("k", 2, 60)
+
+        assert not (await limiter.check("k", 2, 60)).allowed
+        assert redis.script.await_count == 3
+
+        clock.return_value = NOW + 200
+        assert (await limiter.check("k", 2, 60)).allowed
+        assert redis.script.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_local_block(self, clock):
+        redis = FakeRedis()
+        limiter = RedisRateLimiter(redis)
+        for _ in range(3):
+            await limiter.check("k", 2, 60)
+
+        await limiter.reset("k")
+
+        assert (await limiter.check("k", 2, 60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_memory(self, clock):
+        redis = FakeRedis()
+        redis.script.side_effect = RedisConnectionError("down")
+        limiter = RedisRateLimiter(redis)
+
+        results = [await limiter.check("k", 1, 60) for _ in range(2)]
+
+        assert [r.allowed for r in results] == [True, False]
+
+
+class TestRouteLimits:
+    """Tests for the route limiter and its 429 response."""
+
+    def test_parse_rate(self):
+        assert parse_rate("5/minute") == (5, 60)
+        assert parse_rate("10/hours") == (10, 3600)
+        with pytest.raises(ValueError):
+            parse_rate("5 per fortnight")
+
+    def test_limits_counted_per_route(self):
+        limiter = RedisRateLimiter(FakeRedis())
+        route_limiter = Limiter(key_func=lambda request: "ip:1.2.3.4")
+        app = FastAPI()
+        app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+        @app.get("/a")
+        @route_limiter.limit("1/minute")
+        async def route_a(request: Request):
+            return {}
+
+        @app.get("/b")
+        @route_limiter.limit("1/minute")
+        async def route_b(request: Request):
+            return {}
+
+        client = TestClient(app)
+        with patch(
+            "app.infrastructure.security.rate_limiter.get_rate_limiter", return_value=limiter
+        ):
+            assert client.get("/a").status_code == 200
+            assert client.get("/b").status_code == 200
+            response = client.get("/a")
+
+        assert response.status_code == 429
+        assert response.json()["detail"] == "Trop de requêtes. Veuillez réessayer plus tard."
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.headers["X-RateLimit-Limit"] == "1"
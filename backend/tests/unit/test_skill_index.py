@@ -0,0 +1,212 @@
+"""Tests for the Turnover-IT skill matching index."""
+
+import time
+from difflib import SequenceMatcher
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.anonymizer.job_posting_anonymizer import JobPostingAnonymizer
+from app.infrastructure.anonymizer.skill_index import SkillMatchIndex, get_skill_index
+
+REAL_SKILLS = [
+    "Java",
+    "JavaScript",
+    "TypeScript",
+    "Python",
+    "PostgreSQL",
+    "MySQL",
+    "SQL Server",
+    "Kubernetes",
+    "Docker",
+    "Terraform",
+    "Angular",
+    "React",
+    "React Native",
+    "Vue.js",
+    "Node.js",
+    "Spring Boot",
+    "ASP.NET Core",
+    "C#",
+    "Amazon Web Services",
+    "Microsoft Azure",
+    "Google Cloud Platform",
+    "Apache Kafka",
+    "Elasticsearch",
+    "Ansible",
+    "Jenkins",
+    "GitLab CI",
+    "SAP S/4HANA",
+    "Salesforce",
+    "Power BI",
+    "Scrum",
+]
+
+QUERIES = [
+    "Pyhton",
+    "javascrpt",
+    "Postgres",
+    "postgre sql",
+    "React.js",
+    "Kubernete",
+    "spring-boot",
+    "asp.net core",
+    "Azure Microsoft",
+    "Google Cloud",
+    "kafka apache",
+    "Elastic Search",
+    "Gitlab-CI",
+    "SAP S4 HANA",
+    "PowerBI",
+    "Docker",
+    "COBOL",
+    "Rust",
+]
+
+
+def _skills(names: list[str]) -> list[dict[str, str]]:
+    return [{"name": name, "slug": name.lower().replace(" ", "-")} for name in names]
+
+
+def _nomenclature(size: int) -> list[dict[str, str]]:
+    """Real skills padded with synthetic names to a Turnover-IT sized list."""
+    prefixes = ["Apache", "Oracle", "Microsoft", "Cloud", "Data", "Open", "Net", "Web"]
+    suffixes = ["Studio", "Server", "Framework", "Engine", "Platform", "Toolkit", "Suite"]
+    names = list(REAL_SKILLS)
+    i = 0
+    while len(names) < size:
+        names.append(f"{prefixes[i % len(prefixes)]} {suffixes[i % len(suffixes)]} {i}")
+        i += 1
+    return _skills(sorted(names))
+
+
+def _reference_match(
+    query: str, skills: list[dict[str, str]], threshold: float = 0.7
+) -> str | None:
+    """Full scan with SequenceMatcher (previous implementation)."""
+    name_to_slug = {s["name"].lower(): s["slug"] for s in skills}
+    query = query.lower().strip()
+    if query in name_to_slug:
+        return name_to_slug[query]
+    best_match, best_score = None, 0.0
+    for name in name_to_slug:
+        score = SequenceMatcher(None, query, name).ratio()
+        if score > best_score and score >= threshold:
+            best_score, best_match = score, name
+    return name_to_slug[best_match] if best_match else None
+
+
+class TestSkillMatchIndex:
+    """Tests for SkillMatchIndex lookups."""
+
+    def test_exact_match_is_case_insensitive(self):
+        index = SkillMatchIndex(_skills(["PostgreSQL", "Python"]))
+
+        assert index.best_match("  postgresql ") == ("postgresql", "postgresql", 1.0)
+
+    def test_fuzzy_match_above_threshold(self):
+        index = SkillMatchIndex(_skills(REAL_SKILLS))
+
+        name, slug, score = index.best_match("Pyhton")
+
+        assert slug == "python"
+        assert 0.7 <= score < 1.0
+
+    def test_no_match_below_threshold(self):
+        index = SkillMatchIndex(_skills(REAL_SKILLS))
+
+        assert index.best_match("COBOL") is None
+        assert index.best_match("Pyhton", threshold=0.99) is None
+
+    def test_empty_index(self):
+        index = SkillMatchIndex([])
+
+        assert len(index) == 0
+        assert index.best_match("Java") is None
+
+    def test_same_results_as_full_scan(self):
+        skills = _nomenclature(3000)
+        index = SkillMatchIndex(skills)
+
+        for query in QUERIES:
+            match = index.best_match(query)
+            assert (match[1] if match else None) == _reference_match(query, skills), query
+
+    def test_retrieve_skills_mentioned_in_posting(self):
+        index = SkillMatchIndex(_nomenclature(3000))
+
+        selected = index.retrieve(
+            "Développeur Java / Spring Boot (H/F) : microservices sur Kubernetes, "
+            "base PostgreSQL, front React. Méthode Scrum.",
+            limit=300,
+        )
+        slugs = {s["slug"] for s in selected}
+
+        assert {"java", "spring-boot", "kubernetes", "postgresql", "react", "scrum"} <= slugs
+        assert "python" not in slugs
+        assert len(selected) < 50
+
+    def test_retrieve_matches_separator_variants(self):
+        index = SkillMatchIndex(
+            [
+                {"name": "Node.js", "slug": "node-js"},
+                {"name": "ASP.NET Core", "slug": "asp-net-core"},
+            ]
+        )
+
+        selected = index.retrieve("Stack NodeJS et asp.net core", limit=10)
+
+        assert [s["slug"] for s in selected] == ["node-js", "asp-net-core"]
+
+    def test_retrieve_ranks_fully_mentioned_skills_first(self):
+        index = SkillMatchIndex(_skills(["Java", "Java EE", "Jakarta EE", "React"]))
+
+        selected = index.retrieve("Développeur Java", limit=1)
+
+        assert [s["slug"] for s in selected] == ["java"]
+
+    def test_shared_index_rebuilt_when_skills_change(self):
+        skills = _skills(["Java", "Python"])
+
+        first = get_skill_index(skills)
+        assert get_skill_index(list(skills)) is first
+
+        rebuilt = get_skill_index(_skills(["Java", "Python", "Go"]))
+        assert rebuilt is not first
+        assert len(rebuilt) == 3
+
+
+class TestMatchSkillsToNomenclature:
+    """Tests for JobPostingAnonymizer.match_skills_to_nomenclature."""
+
+    def test_matches_and_deduplicates_slugs(self):
+        anonymizer = JobPostingAnonymizer(MagicMock(), MagicMock(), turnoverit_client=MagicMock())
+
+        slugs = anonymizer.match_skills_to_nomenclature(
+            ["Python", "pyhton", "Kubernete", "COBOL"], _skills(REAL_SKILLS)
+        )
+
+        assert slugs == ["python", "kubernetes"]
+
+
+@pytest.mark.benchmark
+class TestSkillIndexBenchmark:
+    """Index lookups against the full SequenceMatcher scan on a 5000-skill list."""
+
+    def test_index_faster_than_full_scan(self):
+        skills = _nomenclature(5000)
+        index = SkillMatchIndex(skills)
+        queries = QUERIES[:6]
+
+        start = time.perf_counter()
+        for query in queries:
+            _reference_match(query, skills)
+        scan_seconds = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for _ in range(10):
+            for query in queries:
+                index.best_match(query)
+        index_seconds = (time.perf_counter() - start) / (10 * len(queries))
+
+        assert index_seconds * 10 < scan_seconds
@@ -0,0 +1,158 @@
+"""Tests for the HR skills autocomplete endpoint."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.v1.hr import get_turnoverit_skills
+from app.infrastructure.anonymizer.skills_snapshot import SkillsSnapshot
+from app.infrastructure.database.repositories import TurnoverITSkillRepository
+
+SNAPSHOT = SkillsSnapshot(
+    version=datetime(2026, 10, 1, 12, 0),
+    skills=({"name": "Java", "slug": "java"}, {"name": "Python", "slug": "python"}),
+)
+
+
+class TestTurnoverITSkillRepositorySearch:
+    """Tests for the trigram autocomplete query."""
+
+    @pytest.mark.asyncio
+    async def test_query_ranks_prefix_then_similarity_with_limit(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+        await TurnoverITSkillRepository(session).search(" Ja_va% ", limit=15)
+
+        statement = session.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert "lower(turnoverit_skills.name) %% " in sql  # pg_trgm operator
+        assert "similarity(lower(turnoverit_skills.name)" in sql
+        assert "LIMIT" in sql
+        assert "%ja\\_va\\%%" in params.values()  # wildcards escaped
+        assert "ja_va%" in params.values()  # raw term for similarity
+        assert 15 in params.values()
+
+
+@pytest.fixture
+def hr_access():
+    with patch("app.api.routes.v1.hr.require_hr_access", new=AsyncMock()):
+        yield
+
+
+@pytest.fixture
+def skills_store():
+    store = MagicMock()
+    store.get_snapshot = AsyncMock(return_value=SNAPSHOT)
+    with patch("app.api.routes.v1.hr.get_skills_store", return_value=store):
+        yield store
+
+
+class TestGetTurnoverITSkills:
+    """Tests for GET /hr/skills."""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_trigram_query(self, hr_access, skills_store):
+        with patch("app.api.routes.v1.hr.TurnoverITSkillRepository") as repository_class:
+            repository_class.return_value.search = AsyncMock(
+                return_value=[{"name": "Java", "slug": "java"}]
+            )
+
+            result = await get_turnoverit_skills(
+                db=MagicMock(),
+                response=Response(),
+                search="jav",
+                limit=10,
+                authorization="",
+                if_none_match=None,
+            )
+
+        repository_class.return_value.search.assert_awaited_once_with("jav", 10)
+        assert [s.slug for s in result.skills] == ["java"]
+        skills_store.get_snapshot.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_list_has_etag_and_cache_control(self, hr_access, skills_store):
+        response = Response()
+
+        result = await get_turnoverit_skills(
+            db=MagicMock(),
+            response=response,
+            search=None,
+            limit=20,
+            authorization="",
+            if_none_match=None,
+        )
+
+        assert result.total == 2
+        assert response.headers["ETag"].startswith('W/"skills-')
+        assert response.headers["Cache-Control"] == "private, max-age=300"
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_not_modified(self, hr_access, skills_store):
+        first = Response()
+        await get_turnoverit_skills(
+            db=MagicMock(),
+            response=first,
+            search=None,
+            limit=20,
+            authorization="",
+            if_none_match=None,
+        )
+
+        result = await get_turnoverit_skills(
+            db=MagicMock(),
+            response=Response(),
+            search=None,
+            limit=20,
+            authorization="",
+            if_none_match=first.headers["ETag"],
+        )
+
+        assert result.status_code == 304
+        assert result.headers["ETag"] == first.headers["ETag"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ['"other", {etag}', '"other",{etag}', "*", "{strong}"],
+    )
+    async def test_etag_list_wildcard_and_weak_match(self, hr_access, skills_store, if_none_match):
+        first = Response()
+        await get_turnoverit_skills(
+            db=MagicMock(),
+            response=first,
+            search=None,
+            limit=20,
+            authorization="",
+            if_none_match=None,
+        )
+        etag = first.headers["ETag"]
+
+        result = await get_turnoverit_skills(
+            db=MagicMock(),
+            response=Response(),
+            search=None,
+            limit=20,
+            authorization="",
+            if_none_match=if_none_match.format(etag=etag, strong=etag.removeprefix("W/")),
+        )
+
+        assert result.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_other_etag_returns_full_list(self, hr_access, skills_store):
+        result = await get_turnoverit_skills(
+            db=MagicMock(),
+            response=Response(),
+            search=None,
+            limit=1,
+            authorization="",
+            if_none_match='W/"skills-0-0", "x"',
+        )
+
+        assert result.total == 2
@@ -0,0 +1,151 @@
+"""Tests for the process-wide Turnover-IT skills snapshot."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.anonymizer.job_posting_anonymizer import JobPostingAnonymizer
+from app.infrastructure.anonymizer.skills_snapshot import SkillsSnapshot, TurnoverITSkillsStore
+
+SYNCED_AT = datetime(2026, 10, 1, 12, 0)
+
+
+class FakeSkillsTable:
+    """Session factory serving a metadata version and skill rows."""
+
+    def __init__(self, version: datetime | None, rows: list[tuple[str, str]]) -> None:
+        self.version = version
+        self.rows = rows
+        self.queries = 0
+        self.error: Exception | None = None
+
+    def __call__(self):
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=self._execute)
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    async def _execute(self, statement):
+        self.queries += 1
+        if self.error:
+            raise self.error
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = self.version
+        result.all.return_value = list(self.rows)
+        return result
+
+
+class TestTurnoverITSkillsStore:
+    """Tests for snapshot loading and versioned refresh."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_once_then_served_from_memory(self):
+        table = FakeSkillsTable(SYNCED_AT, [("Java", "java"), ("Python", "python")])
+        store = TurnoverITSkillsStore(table)
+
+        first = await store.get_snapshot()
+        second = await store.get_snapshot()
+
+        assert second is first
+        assert table.queries == 2  # metadata + skills
+        assert first.version == SYNCED_AT
+        assert first.slugs == frozenset({"java", "python"})
+        assert first.name_to_slug["python"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_keeps_snapshot(self):
+        table = FakeSkillsTable(SYNCED_AT, [("Java", "java")])
+        store = TurnoverITSkillsStore(table)
+        first = await store.get_snapshot()
+
+        store.invalidate()
+        second = await store.get_snapshot()
+
+        assert second is first
+        assert table.queries == 3  # only the metadata check
+
+    @pytest.mark.asyncio
+    async def test_new_sync_version_reloads_skills(self):
+        table = FakeSkillsTable(SYNCED_AT, [("Java", "java")])
+        store = TurnoverITSkillsStore(table, refresh_check_seconds=0)
+        await store.get_snapshot()
+
+        table.version = SYNCED_AT + timedelta(days=30)
+        table.rows = [("Java", "java"), ("Go", "go")]
+        snapshot = await store.get_snapshot()
+
+        assert snapshot.version == table.version
+        assert [s["slug"] for s in snapshot.skills] == ["java", "go"]
+        assert snapshot.index.best_match("go")[1] == "go"
+
+    @pytest.mark.asyncio
+    async def test_unreadable_table_gives_unavailable_snapshot(self):
+        table = FakeSkillsTable(None, [])
+        table.error = RuntimeError('relation "turnoverit_skills" does not exist')
+        store = TurnoverITSkillsStore(table)
+
+        snapshot = await store.get_snapshot()
+
+        assert snapshot.loaded is False
+        assert snapshot.skills == ()
+
+    def test_search_is_case_insensitive(self):
+        snapshot = SkillsSnapshot(
+            version=SYNCED_AT,
+            skills=(
+                {"name": "PostgreSQL", "slug": "postgresql"},
+                {"name": "MySQL", "slug": "mysql"},
+            ),
+        )
+
+        assert [s["slug"] for s in snapshot.search("sql")] == ["postgresql", "mysql"]
+        assert [s["slug"] for s in snapshot.search("POSTGRE")] == ["postgresql"]
+        assert len(snapshot.search(None)) == 2
+
+
+class TestEnsureSkillsSynced:
+    """Tests for the anonymizer sync check based on the snapshot."""
+
+    def _anonymizer(self, snapshot: SkillsSnapshot) -> JobPostingAnonymizer:
+        store = MagicMock()
+        store.get_snapshot = AsyncMock(return_value=snapshot)
+        anonymizer = JobPostingAnonymizer(
+            MagicMock(), MagicMock(), turnoverit_client=MagicMock(), skills_store=store
+        )
+        anonymizer.sync_skills = AsyncMock(return_value=0)
+        return anonymizer
+
+    @pytest.mark.asyncio
+    async def test_recent_sync_skips_sync(self):
+        snapshot = SkillsSnapshot(
+            version=datetime.now(UTC).replace(tzinfo=None),
+            skills=({"name": "Java", "slug": "java"},),
+        )
+        anonymizer = self._anonymizer(snapshot)
+
+        await anonymizer.ensure_skills_synced()
+
+        anonymizer.sync_skills.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_sync_triggers_sync(self):
+        snapshot = SkillsSnapshot(
+            version=datetime.now(UTC) - timedelta(days=31),
+            skills=({"name": "Java", "slug": "java"},),
+        )
+        anonymizer = self._anonymizer(snapshot)
+
+        await anonymizer.ensure_skills_synced()
+
+        anonymizer.sync_skills.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_table_skips_sync(self):
+        anonymizer = self._anonymizer(SkillsSnapshot.unavailable())
+
+        await anonymizer.ensure_skills_synced()
+
+        anonymizer.sync_skills.assert_not_called()
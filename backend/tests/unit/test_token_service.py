@@ -0,0 +1,204 @@
+"""Tests for the JWT token service."""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError
+
+from app.config import Settings
+from app.domain.exceptions import InvalidTokenError
+from app.infrastructure.security.jwt import TokenPayload, TokenService
+
+SECRET = "test-secret"
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(_env_file=None, JWT_SECRET=SECRET, **overrides)
+
+
+def _claims(token_type: str = "access", expires_in: timedelta = timedelta(minutes=5)) -> dict:
+    now = datetime.utcnow()
+    return {"sub": str(uuid4()), "exp": now + expires_in, "type": token_type, "iat": now}
+
+
+def _pem_pair(private_key) -> tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+def _legacy_decode(token: str, expected_type: str | None = None) -> TokenPayload:
+    """decode_token before the token service: string secret, validated payload."""
+    try:
+        payload = jwt.decode(token, SECRET, algorithms=["HS256"])
+        token_type = payload.get("type")
+        if expected_type and token_type != expected_type:
+            raise InvalidTokenError(f"Expected {expected_type} token, got {token_type}")
+        return TokenPayload(
+            sub=payload["sub"],
+            exp=datetime.fromtimestamp(payload["exp"]),
+            type=token_type or "unknown",
+            iat=datetime.fromtimestamp(payload.get("iat", datetime.utcnow().timestamp())),
+        )
+    except JWTError as e:
+        raise InvalidTokenError(str(e))
+
+
+class TestTokenService:
+    """Tests for TokenService."""
+
+    def test_round_trip(self):
+        service = TokenService(_settings())
+        claims = _claims()
+
+        payload = service.decode(service.encode(claims), expected_type="access")
+
+        assert payload.sub == claims["sub"]
+        assert payload.type == "access"
+
+    def test_wrong_type_rejected_from_cache_too(self):
+        service = TokenService(_settings())
+        token = service.encode(_claims("refresh"))
+        service.decode(token)
+
+        with pytest.raises(InvalidTokenError, match="Expected access token"):
+            service.decode(token, expected_type="access")
+
+    def test_verified_token_served_from_cache(self):
+        service = TokenService(_settings())
+        token = service.encode(_claims())
+
+        with patch("app.infrastructure.security.jwt.jwt.decode", wraps=jwt.decode) as decode:
+            first = service.decode(token)
+            second = service.decode(token)
+
+        assert first is second
+        decode.assert_called_once()
+
+    def test_cache_disabled(self):
+        service = TokenService(_settings(JWT_VERIFIED_CACHE_SIZE=0))
+        token = service.encode(_claims())
+
+        with patch("app.infrastructure.security.jwt.jwt.decode", wraps=jwt.decode) as decode:
+            service.decode(token)
+            service.decode(token)
+
+        assert decode.call_count == 2
+
+    def test_cached_token_rejected_after_exp(self):
+        service = TokenService(_settings())
+        token = service.encode(_claims(expires_in=timedelta(seconds=2)))
+        service.decode(token)
+
+        with (
+            patch("app.infrastructure.security.jwt.time.time", return_value=time.time() + 5),
+            patch(
+                "app.infrastructure.security.jwt.jwt.decode",
+                side_effect=ExpiredSignatureError("Signature has expired."),
+            ) as decode,
+        ):
+            with pytest.raises(InvalidTokenError, match="expired"):
+                service.decode(token)
+
+        decode.assert_called_once()
+        assert token not in service._verified
+
+    def test_tampered_token_is_verified(self):
+        service = TokenService(_settings())
+        token = service.encode(_claims())
+        service.decode(token)
+
+        with pytest.raises(InvalidTokenError):
+            service.decode(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+    def test_lru_bounded(self):
+        service = TokenService(_settings(JWT_VERIFIED_CACHE_SIZE=2))
+        tokens = [service.encode(_claims()) for _ in range(3)]
+        for token in tokens:
+            service.decode(token)
+
+        assert list(service._verified) == tokens[1:]
+
+    def test_rs256_verify_only_service(self):
+        private_pem, public_pem = _pem_pair(rsa.generate_private_key(65537, 2048))
+        issuer = TokenService(
+            _settings(JWT_ALGORITHM="RS256", JWT_PRIVATE_KEY=private_pem, JWT_KEY_ID="k1")
+        )
+        verifier = TokenService(
+            _settings(JWT_ALGORITHM="RS256", JWT_PUBLIC_KEY=public_pem.replace("\n", "\\n"))
+        )
+        claims = _claims()
+
+        token = issuer.encode(claims)
+
+        assert jwt.get_unverified_header(token)["kid"] == "k1"
+        assert verifier.decode(token).sub == claims["sub"]
+        with pytest.raises(RuntimeError):
+            verifier.encode(claims)
+
+    def test_es256_verifies_with_derived_public_key(self):
+        private_pem, _ = _pem_pair(ec.generate_private_key(ec.SECP256R1()))
+        service = TokenService(_settings(JWT_ALGORITHM="ES256", JWT_PRIVATE_KEY=private_pem))
+
+        assert service.decode(service.encode(_claims())).type == "access"
+
+    def test_asymmetric_without_keys_rejected(self):
+        with pytest.raises(ValueError):
+            TokenService(_settings(JWT_ALGORITHM="RS256"))
+
+
+@pytest.mark.benchmark
+class TestTokenServiceBenchmark:
+    """Encode/decode throughput against the previous python-jose usage."""
+
+    def test_throughput(self):
+        service = TokenService(_settings())
+        claims = _claims()
+        rounds = 2000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            jwt.encode(claims, SECRET, algorithm="HS256")
+        legacy_encode = rounds / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            service.encode(claims)
+        encode = rounds / (time.perf_counter() - start)
+
+        token = service.encode(claims)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            _legacy_decode(token, "access")
+        legacy_decode = rounds / (time.perf_counter() - start)
+
+        cold = TokenService(_settings(JWT_VERIFIED_CACHE_SIZE=0))
+        start = time.perf_counter()
+        for _ in range(rounds):
+            cold.decode(token, "access")
+        uncached_decode = rounds / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            service.decode(token, "access")
+        cached_decode = rounds / (time.perf_counter() - start)
+
+        assert cached_decode > 10 * legacy_decode, (
+            f"HS256 ops/s: encode {legacy_encode:,.0f} -> {encode:,.0f}, "
+            f"decode {legacy_decode:,.0f} -> {uncached_decode:,.0f} uncached, "
+            f"{cached_decode:,.0f} cached"
+        )
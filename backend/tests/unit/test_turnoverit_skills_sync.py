@@ -0,0 +1,202 @@
+"""Tests for the Turnover-IT skills sync (staged bulk upsert)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.domain.exceptions import TurnoverITError
+from app.infrastructure.database.repositories import (
+    SkillsMergeResult,
+    TurnoverITSkillRepository,
+)
+from app.infrastructure.turnoverit.client import TurnoverITClient
+from app.infrastructure.turnoverit.skills_sync import sync_skills_from_turnoverit
+
+PAGES = [
+    [{"name": "Java", "slug": "java"}, {"name": "Python", "slug": "python"}],
+    [{"name": "Go", "slug": "go"}],
+]
+
+
+def _client(pages: list[list[dict[str, str]]], error: Exception | None = None) -> MagicMock:
+    async def iter_skill_pages():
+        for page in pages:
+            yield page
+        if error:
+            raise error
+
+    client = MagicMock()
+    client.iter_skill_pages = iter_skill_pages
+    return client
+
+
+@pytest.fixture
+def repository():
+    repository = MagicMock()
+    repository.create_staging_table = AsyncMock()
+    repository.stage = AsyncMock(side_effect=lambda skills: len(skills))
+    repository.merge_staged = AsyncMock(
+        return_value=SkillsMergeResult(added=1, updated=1, removed=2, total=3)
+    )
+    repository.update_sync_metadata = AsyncMock()
+    with patch(
+        "app.infrastructure.turnoverit.skills_sync.TurnoverITSkillRepository",
+        return_value=repository,
+    ):
+        yield repository
+
+
+@pytest.fixture
+def skills_store():
+    store = MagicMock()
+    with patch("app.infrastructure.turnoverit.skills_sync.get_skills_store", return_value=store):
+        yield store
+
+
+def _session_factory(session: AsyncMock) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory
+
+
+class TestSyncSkillsFromTurnoverIT:
+    """Tests for sync_skills_from_turnoverit."""
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_then_merged_in_one_transaction(self, repository, skills_store):
+        session = AsyncMock()
+        factory = _session_factory(session)
+        pages_fetched = []
+
+        async def iter_skill_pages():
+            for page in PAGES:
+                factory.assert_not_called()
+                pages_fetched.append(page)
+                yield page
+
+        client = MagicMock(iter_skill_pages=iter_skill_pages)
+
+        result = await sync_skills_from_turnoverit(client, factory)
+
+        assert result == SkillsMergeResult(added=1, updated=1, removed=2, total=3)
+        assert pages_fetched == PAGES
+        repository.stage.assert_awaited_once_with(PAGES[0] + PAGES[1])
+        repository.merge_staged.assert_awaited_once()
+        repository.update_sync_metadata.assert_awaited_once_with(3)
+        session.commit.assert_awaited_once()
+        skills_store.invalidate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_skills_opens_no_session(self, repository, skills_store):
+        factory = _session_factory(AsyncMock())
+
+        result = await sync_skills_from_turnoverit(_client([]), factory)
+
+        assert result is None
+        factory.assert_not_called()
+        skills_store.invalidate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_page_failure_opens_no_session(self, repository, skills_store):
+        factory = _session_factory(AsyncMock())
+        client = _client(PAGES[:1], error=TurnoverITError("page 2: 500"))
+
+        with pytest.raises(TurnoverITError):
+            await sync_skills_from_turnoverit(client, factory)
+
+        factory.assert_not_called()
+        repository.merge_staged.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_merge_failure_rolls_back(self, repository, skills_store):
+        session = AsyncMock()
+        repository.merge_staged.side_effect = RuntimeError("deadlock")
+
+        with pytest.raises(RuntimeError):
+            await sync_skills_from_turnoverit(_client(PAGES), _session_factory(session))
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
+        skills_store.invalidate.assert_not_called()
+
+
+class TestTurnoverITSkillRepositoryStage:
+    """Tests for staging a page of skills."""
+
+    @pytest.mark.asyncio
+    async def test_page_staged_with_one_executemany(self):
+        session = AsyncMock()
+        repository = TurnoverITSkillRepository(session)
+
+        staged = await repository.stage(
+            [{"name": "Java", "slug": "java"}, {"name": "Sans slug", "slug": ""}]
+        )
+
+        assert staged == 1
+        session.execute.assert_awaited_once()
+        _, rows = session.execute.await_args.args
+        assert rows == [{"name": "Java", "slug": "java"}]
+
+    @pytest.mark.asyncio
+    async def test_empty_page_not_executed(self):
+        session = AsyncMock()
+
+        assert await TurnoverITSkillRepository(session).stage([]) == 0
+        session.execute.assert_not_called()
+
+
+@pytest.fixture
+def serve_skills():
+    """Route TurnoverITClient HTTP calls to a handler."""
+    real_async_client = httpx.AsyncClient
+
+    def serve(handler) -> TurnoverITClient:
+        transport = httpx.MockTransport(handler)
+        patcher.start().side_effect = lambda **kwargs: real_async_client(
+            transport=transport, **kwargs
+        )
+        settings = MagicMock(TURNOVERIT_API_KEY="key", TURNOVERIT_API_URL="https://api.test/v2")
+        return TurnoverITClient(settings)
+
+    patcher = patch("app.infrastructure.turnoverit.client.httpx.AsyncClient")
+    yield serve
+    patcher.stop()
+
+
+def _page(page: int, has_next: bool) -> httpx.Response:
+    view = {"hydra:next": f"/skills?page={page + 1}"} if has_next else {}
+    return httpx.Response(200, json={"hydra:member": PAGES[page - 1], "hydra:view": view})
+
+
+class TestIterSkillPages:
+    """Tests for TurnoverITClient.iter_skill_pages."""
+
+    @pytest.mark.asyncio
+    async def test_pages_streamed_until_no_next(self, serve_skills):
+        client = serve_skills(
+            lambda request: (
+                _page(1, has_next=True)
+                if request.url.params["page"] == "1"
+                else _page(2, has_next=False)
+            )
+        )
+
+        pages = [page async for page in client.iter_skill_pages()]
+
+        assert pages == PAGES
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises(self, serve_skills):
+        client = serve_skills(
+            lambda request: (
+                _page(1, has_next=True)
+                if request.url.params["page"] == "1"
+                else httpx.Response(500)
+            )
+        )
+
+        with pytest.raises(TurnoverITError):
+            [page async for page in client.iter_skill_pages()]
+        # fetch_all_skills keeps its lenient behaviour (pages fetched so far)
+        assert await client.fetch_all_skills() == PAGES[0]
@@ -0,0 +1,153 @@
+"""Tests for the repository upsert helper and its row snapshots."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.database.models import PublishedOpportunityModel
+from app.infrastructure.database.repositories import RowSnapshots, upsert
+
+
+def _values(**overrides) -> dict:
+    values = {
+        "id": uuid4(),
+        "boond_opportunity_id": "BOOND-1",
+        "title": "Développeur Python",
+        "description": "Description",
+        "skills": ["python"],
+        "original_title": "Original",
+        "original_data": {"client": "ACME"},
+        "end_date": None,
+        "status": "published",
+        "published_by": uuid4(),
+        "created_at": datetime(2026, 1, 1),
+        "updated_at": datetime(2026, 1, 1),
+    }
+    return {**values, **overrides}
+
+
+def _session(values: dict) -> AsyncMock:
+    session = AsyncMock()
+    session.bind = None
+    row = PublishedOpportunityModel(**values)
+    session.execute.return_value = MagicMock(
+        scalar_one=MagicMock(return_value=row),
+        scalar_one_or_none=MagicMock(return_value=row),
+    )
+    return session
+
+
+def _loaded(values: dict) -> RowSnapshots:
+    snapshots = RowSnapshots()
+    snapshots.remember(PublishedOpportunityModel(**values))
+    return snapshots
+
+
+class TestUpsert:
+    """Tests for upsert."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_row_is_inserted_on_conflict_update(self):
+        values = _values()
+        session = _session(values)
+
+        await upsert(session, PublishedOpportunityModel, values, RowSnapshots())
+
+        statement = str(session.execute.await_args.args[0])
+        assert statement.startswith("INSERT INTO published_opportunities")
+        assert "ON CONFLICT (id) DO UPDATE SET" in statement
+        set_clause = statement.split("DO UPDATE SET")[1].split("RETURNING")[0]
+        assert "title = excluded.title" in set_clause
+        assert "created_at" not in set_clause
+        assert "RETURNING" in statement
+
+    @pytest.mark.asyncio
+    async def test_unchanged_loaded_row_sends_nothing(self):
+        values = _values()
+        session = _session(values)
+
+        model = await upsert(
+            session,
+            PublishedOpportunityModel,
+            values,
+            _loaded(values),
+            on_update={"updated_at": datetime(2026, 2, 1)},
+        )
+
+        assert model is None
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_column_only_is_updated(self):
+        values = _values()
+        session = _session(values)
+
+        await upsert(
+            session,
+            PublishedOpportunityModel,
+            {**values, "status": "closed"},
+            _loaded(values),
+            on_update={"updated_at": datetime(2026, 2, 1)},
+        )
+
+        statement = session.execute.await_args.args[0]
+        sql = str(statement)
+        assert sql.startswith("UPDATE published_opportunities SET")
+        set_clause = sql.split(" SET ")[1].split(" WHERE ")[0]
+        assert set_clause == "status=:status, updated_at=:updated_at"
+        assert statement.compile().params["status"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_mutated_json_value_is_detected(self):
+        values = _values()
+        snapshots = RowSnapshots()
+        model = PublishedOpportunityModel(**values)
+        snapshots.remember(model)
+        model.skills.append("fastapi")
+        session = _session(values)
+
+        await upsert(
+            session,
+            PublishedOpportunityModel,
+            {**values, "skills": model.skills},
+            snapshots,
+        )
+
+        assert "SET skills=:skills" in str(session.execute.await_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_deleted_row_is_inserted_again(self):
+        values = _values()
+        session = _session(values)
+        session.execute.side_effect = [
+            MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
+            MagicMock(scalar_one=MagicMock(return_value=PublishedOpportunityModel(**values))),
+        ]
+
+        await upsert(
+            session, PublishedOpportunityModel, {**values, "title": "Autre"}, _loaded(values)
+        )
+
+        update_sql, insert_sql = (str(call.args[0]) for call in session.execute.await_args_list)
+        assert update_sql.startswith("UPDATE")
+        assert insert_sql.startswith("INSERT")
+
+
+class TestRowSnapshots:
+    """Tests for RowSnapshots."""
+
+    def test_unknown_row_has_no_changes(self):
+        assert RowSnapshots().changes(uuid4(), _values()) is None
+
+    def test_unloaded_columns_are_skipped(self):
+        values = _values()
+        model = PublishedOpportunityModel(**values)
+        del model.__dict__["original_data"]
+        snapshots = RowSnapshots()
+        snapshots.remember(model)
+
+        changes = snapshots.changes(values["id"], {**values, "original_data": None})
+
+        assert changes == {}
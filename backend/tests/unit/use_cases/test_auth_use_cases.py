@@ -33,7 +33,7 @@ def create_mock_user(**kwargs) -> User:
         "email": Email("test@example.com"),
         "first_name": "Test",
         "last_name": "User",
-        "password_hash": "hashed_password",
+        "password_hash": "$2b$12$" + "h" * 53,
         "role": UserRole.USER,
         "is_verified": True,
         "is_active": True,
@@ -74,7 +74,10 @@ class TestRegisterUserUseCase:
         with patch(
             "app.application.use_cases.auth.create_verification_token", return_value="test-token"
         ):
-            with patch("app.application.use_cases.auth.hash_password", return_value="hashed"):
+            with patch(
+                "app.application.use_cases.auth.hash_password_async",
+                AsyncMock(return_value="hashed"),
+            ):
                 result = await use_case.execute(command)
 
         assert result.email == "new@example.com"
@@ -122,7 +125,9 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
         command = LoginCommand(email="test@example.com", password="correct_password")
 
-        with patch("app.application.use_cases.auth.verify_password", return_value=True):
+        with patch(
+            "app.application.use_cases.auth.verify_password_async", AsyncMock(return_value=True)
+        ):
             with patch("app.application.use_cases.auth.create_access_token", return_value="access"):
                 with patch(
                     "app.application.use_cases.auth.create_refresh_token", return_value="refresh"
@@ -153,7 +158,9 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
         command = LoginCommand(email="test@example.com", password="wrong_password")
 
-        with patch("app.application.use_cases.auth.verify_password", return_value=False):
+        with patch(
+            "app.application.use_cases.auth.verify_password_async", AsyncMock(return_value=False)
+        ):
             with pytest.raises(InvalidCredentialsError):
                 await use_case.execute(command)
 
@@ -166,7 +173,9 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
         command = LoginCommand(email="test@example.com", password="password")
 
-        with patch("app.application.use_cases.auth.verify_password", return_value=True):
+        with patch(
+            "app.application.use_cases.auth.verify_password_async", AsyncMock(return_value=True)
+        ):
             with pytest.raises(UserNotVerifiedError):
                 await use_case.execute(command)
 
@@ -179,10 +188,53 @@ class TestLoginUseCase:
         use_case = LoginUseCase(mock_user_repository)
         command = LoginCommand(email="test@example.com", password="password")
 
-        with patch("app.application.use_cases.auth.verify_password", return_value=True):
+        with patch(
+            "app.application.use_cases.auth.verify_password_async", AsyncMock(return_value=True)
+        ):
             with pytest.raises(InvalidCredentialsError):
                 await use_case.execute(command)
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_cost(self, mock_user_repository):
+        """Test a hash made with another bcrypt cost is upgraded on login."""
+        user = create_mock_user(password_hash="$2b$10$" + "h" * 53)
+        mock_user_repository.get_by_email = AsyncMock(return_value=user)
+
+        use_case = LoginUseCase(mock_user_repository)
+        command = LoginCommand(email="test@example.com", password="password")
+
+        with (
+            patch(
+                "app.application.use_cases.auth.verify_password_async",
+                AsyncMock(return_value=True),
+            ),
+            patch(
+                "app.application.use_cases.auth.hash_password_async",
+                AsyncMock(return_value="new_hash"),
+            ) as hash_password_async,
+        ):
+            await use_case.execute(command)
+
+        hash_password_async.assert_awaited_once_with("password")
+        assert user.password_hash == "new_hash"
+        mock_user_repository.save.assert_awaited_once_with(user)
+
+    @pytest.mark.asyncio
+    async def test_login_keeps_current_cost_hash(self, mock_user_repository):
+        """Test a hash made with the current bcrypt cost is not rewritten."""
+        user = create_mock_user()
+        mock_user_repository.get_by_email = AsyncMock(return_value=user)
+
+        use_case = LoginUseCase(mock_user_repository)
+        command = LoginCommand(email="test@example.com", password="password")
+
+        with patch(
+            "app.application.use_cases.auth.verify_password_async", AsyncMock(return_value=True)
+        ):
+            await use_case.execute(command)
+
+        mock_user_repository.save.assert_not_called()
+
 
 class TestVerifyEmailUseCase:
     """Tests for VerifyEmailUseCase."""
@@ -279,7 +331,9 @@ class TestResetPasswordUseCase:
 
         use_case = ResetPasswordUseCase(mock_user_repository)
 
-        with patch("app.application.use_cases.auth.hash_password", return_value="new_hash"):
+        with patch(
+            "app.application.use_cases.auth.hash_password_async", AsyncMock(return_value="new_hash")
+        ):
             result = await use_case.execute("valid-reset-token", "NewPassword123!")
 
         assert result is True
@@ -1,6 +1,7 @@
 """Tests for cooptation use cases."""
 
-from unittest.mock import AsyncMock
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -20,6 +21,7 @@ from app.domain.exceptions import (
     OpportunityNotFoundError,
 )
 from app.domain.value_objects import CooptationStatus, Email, UserRole
+from app.infrastructure.database.repositories import CooptationRepository
 
 
 def create_mock_opportunity(**kwargs) -> Opportunity:
@@ -337,56 +339,151 @@ class TestUpdateCooptationStatusUseCase:
             )
 
 
+class FakeRow(tuple):
+    """Tuple with the key access of a SQLAlchemy Row."""
+
+    def __new__(cls, values: dict):
+        row = super().__new__(cls, values.values())
+        row._mapping = values
+        return row
+
+    def __getattr__(self, name: str):
+        try:
+            return self._mapping[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def create_list_row(total_count: int = 1, **kwargs) -> FakeRow:
+    """Factory for database rows read by CooptationRepository.list_page."""
+    values = {
+        "id": uuid4(),
+        "candidate_id": uuid4(),
+        "candidate_name": "John Doe",
+        "candidate_email": "candidate@example.com",
+        "candidate_phone": None,
+        "candidate_daily_rate": 550.0,
+        "candidate_cv_filename": "cv.pdf",
+        "candidate_note": None,
+        "opportunity_id": uuid4(),
+        "opportunity_title": "Test Opportunity",
+        "opportunity_reference": "REF-001",
+        "status": "pending",
+        "submitter_id": uuid4(),
+        "submitter_name": "Test User",
+        "external_positioning_id": None,
+        "rejection_reason": None,
+        "status_history": None,
+        "submitted_at": datetime(2026, 1, 1),
+        "updated_at": datetime(2026, 1, 2),
+    }
+    values.update(kwargs)
+    values["sort_key_0"] = values["submitted_at"]
+    values["sort_key_1"] = values["id"]
+    values["total_count"] = total_count  # COUNT(*) OVER ()
+    return FakeRow(values)
+
+
+def create_session(rows: list[FakeRow]) -> AsyncMock:
+    """Session returning rows for the list query."""
+    result = MagicMock()
+    result.all.return_value = rows
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
 class TestListCooptationsUseCase:
     """Tests for ListCooptationsUseCase."""
 
-    @pytest.fixture
-    def mock_repositories(self):
-        """Create mock repositories."""
-        return {
-            "cooptation_repository": AsyncMock(),
-            "user_repository": AsyncMock(),
-        }
-
     @pytest.mark.asyncio
-    async def test_list_all_cooptations(self, mock_repositories):
+    async def test_list_all_cooptations(self):
         """Test listing all cooptations."""
-        cooptations = [create_mock_cooptation() for _ in range(3)]
-        user = create_mock_user()
+        session = create_session([create_list_row(total_count=23) for _ in range(3)])
+        use_case = ListCooptationsUseCase(CooptationRepository(session))
 
-        mock_repositories["cooptation_repository"].list_all = AsyncMock(return_value=cooptations)
-        mock_repositories["cooptation_repository"].get_stats_by_submitter = AsyncMock(
-            return_value={"total": 3}
-        )
-        mock_repositories["user_repository"].get_by_id = AsyncMock(return_value=user)
-
-        use_case = ListCooptationsUseCase(**mock_repositories)
-
-        result = await use_case.execute(page=1, page_size=10)
+        result = await use_case.execute(page=1, page_size=3)
 
         assert len(result.items) == 3
-        assert result.total == 3
+        assert result.total == 23
         assert result.page == 1
+        assert result.items[0].submitter_name == "Test User"
+        assert result.items[0].status_display == CooptationStatus.PENDING.display_name
+        assert result.next_cursor is not None
 
     @pytest.mark.asyncio
-    async def test_list_cooptations_by_submitter(self, mock_repositories):
+    async def test_list_cooptations_by_submitter(self):
         """Test listing cooptations filtered by submitter."""
         submitter_id = uuid4()
-        cooptations = [create_mock_cooptation(submitter_id=submitter_id) for _ in range(2)]
-        user = create_mock_user(id=submitter_id)
-
-        mock_repositories["cooptation_repository"].list_by_submitter = AsyncMock(
-            return_value=cooptations
-        )
-        mock_repositories["cooptation_repository"].count_by_submitter = AsyncMock(return_value=2)
-        mock_repositories["user_repository"].get_by_id = AsyncMock(return_value=user)
-
-        use_case = ListCooptationsUseCase(**mock_repositories)
+        history = {
+            "from_status": "pending",
+            "to_status": "in_review",
+            "changed_at": "2026-01-02T10:00:00",
+            "changed_by": None,
+            "comment": None,
+        }
+        rows = [
+            create_list_row(
+                total_count=2,
+                submitter_id=submitter_id,
+                status="in_review",
+                status_history=[history],
+            )
+            for _ in range(2)
+        ]
+        session = create_session(rows)
+        use_case = ListCooptationsUseCase(CooptationRepository(session))
 
         result = await use_case.execute(page=1, page_size=10, submitter_id=submitter_id)
 
         assert len(result.items) == 2
         assert result.total == 2
+        assert result.items[0].submitter_id == str(submitter_id)
+        assert result.items[0].status_history[0].to_status == "in_review"
+        list_query = str(session.execute.await_args.args[0])
+        assert "cooptations.submitter_id = " in list_query
+        assert "JOIN candidates" in list_query
+        assert "LEFT OUTER JOIN users" in list_query
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_size", [1, 50])
+    async def test_statement_count_independent_of_page_size(self, page_size):
+        """Should read the page and its total in one statement (no per-row lookups)."""
+        session = create_session([create_list_row(total_count=80) for _ in range(page_size)])
+        use_case = ListCooptationsUseCase(CooptationRepository(session))
+
+        result = await use_case.execute(page=1, page_size=page_size)
+
+        assert len(result.items) == page_size
+        assert result.total == 80
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cursor_reads_rows_after_previous_page(self):
+        """Should filter on the cursor row instead of skipping OFFSET rows."""
+        first_page = await ListCooptationsUseCase(
+            CooptationRepository(create_session([create_list_row(total_count=5)]))
+        ).execute(page=1, page_size=1)
+        session = create_session([create_list_row(), create_list_row()])
+        use_case = ListCooptationsUseCase(CooptationRepository(session))
+
+        result = await use_case.execute(page=2, page_size=1, cursor=first_page.next_cursor)
+
+        assert len(result.items) == 1
+        assert result.total == 5
+        assert result.next_cursor is not None
+        session.execute.assert_awaited_once()  # total carried by the cursor
+        list_query = str(session.execute.await_args.args[0])
+        assert "(cooptations.submitted_at, cooptations.id) < " in list_query
+        assert "OFFSET" not in list_query
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self):
+        """Should reject a cursor that was not issued for this list."""
+        use_case = ListCooptationsUseCase(CooptationRepository(create_session([])))
+
+        with pytest.raises(ValueError, match="Curseur"):
+            await use_case.execute(page=2, page_size=10, cursor="not-a-cursor")
 
 
 class TestGetCooptationStatsUseCase:
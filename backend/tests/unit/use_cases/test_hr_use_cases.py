@@ -1,13 +1,19 @@
 """Tests for HR feature use cases (job postings and applications)."""
 
+import importlib.util
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import result_tuple
 
 from app.application.use_cases.job_applications import (
+    AnalyzePendingApplicationsUseCase,
     GetApplicationCvUrlUseCase,
+    ListApplicationsForPostingUseCase,
     SubmitApplicationCommand,
     SubmitApplicationUseCase,
     UpdateApplicationStatusCommand,
@@ -16,12 +22,14 @@ from app.application.use_cases.job_applications import (
 from app.application.use_cases.job_postings import (
     CreateJobPostingCommand,
     CreateJobPostingUseCase,
+    ListJobPostingsUseCase,
     ListOpenOpportunitiesForHRUseCase,
     PublishJobPostingUseCase,
 )
 from app.domain.entities import (
     ApplicationStatus,
     ContractType,
+    JobApplication,
     JobPostingStatus,
 )
 from app.domain.exceptions import (
@@ -30,6 +38,12 @@ from app.domain.exceptions import (
     JobPostingNotFoundError,
     OpportunityNotFoundError,
 )
+from app.infrastructure.database.models import JobApplicationModel, JobPostingModel
+from app.infrastructure.database.repositories import (
+    JobApplicationRepository,
+    JobPostingRepository,
+    Page,
+)
 
 
 class TestListOpenOpportunitiesForHRUseCase:
@@ -78,8 +92,9 @@ class TestListOpenOpportunitiesForHRUseCase:
         mock_deps["job_posting_repo"].get_all_by_boond_opportunity_ids.return_value = {
             "BOOND-123": posting
         }
-        mock_deps["job_application_repo"].count_by_posting.return_value = 5
-        mock_deps["job_application_repo"].count_unread_by_posting.return_value = 2
+        mock_deps["job_application_repo"].get_stats_by_postings.return_value = {
+            posting_id: {"total": 5, "unread": 2}
+        }
 
         result = await use_case.execute(hr_manager_boond_id="12345")
 
@@ -96,6 +111,10 @@ class TestListOpenOpportunitiesForHRUseCase:
         mock_deps["boond_client"].get_hr_manager_opportunities.assert_called_once_with(
             hr_manager_boond_id="12345"
         )
+        mock_deps["job_application_repo"].get_stats_by_postings.assert_awaited_once_with(
+            [posting_id]
+        )
+        mock_deps["job_application_repo"].count_by_posting.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_list_opportunities_admin_sees_all(self, use_case, mock_deps):
@@ -176,6 +195,319 @@ class TestListOpenOpportunitiesForHRUseCase:
         assert result.items[0].title == "Dev Python"
 
 
+class TestJobApplicationStatsByPostings:
+    """Tests for the grouped application counts of several postings."""
+
+    @pytest.mark.asyncio
+    async def test_counts_aggregated_from_one_grouped_query(self):
+        """Should count total, unread and by status for every posting in one query."""
+        first, second, without_applications = uuid4(), uuid4(), uuid4()
+        result = MagicMock()
+        result.all.return_value = [
+            (first, "en_cours", 3, 2),
+            (first, "valide", 1, 0),
+            (second, "refuse", 4, 1),
+        ]
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        stats = await JobApplicationRepository(session).get_stats_by_postings(
+            [first, second, without_applications]
+        )
+
+        session.execute.assert_awaited_once()
+        assert stats[first]["total"] == 4
+        assert stats[first]["unread"] == 2
+        assert stats[first]["valide"] == 1
+        assert stats[second]["refuse"] == 4
+        assert stats[without_applications]["total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_posting_skips_query(self):
+        """Should not query the database without posting IDs."""
+        session = AsyncMock()
+
+        assert await JobApplicationRepository(session).get_stats_by_postings([]) == {}
+        session.execute.assert_not_called()
+
+
+class TestJobApplicationPageByPosting:
+    """Tests for the applications page of a posting."""
+
+    @pytest.mark.asyncio
+    async def test_page_total_and_stats_in_two_round_trips(self):
+        """Should read the page with its filtered total, then the posting stats."""
+        posting_id = uuid4()
+        page_row = result_tuple(
+            ["JobApplicationModel", "sort_key_0", "sort_key_1", "sort_key_2", "total_count"]
+        )
+        page_result = MagicMock()
+        page_result.all.return_value = [
+            page_row((f"application-{i}", 500, datetime(2026, 1, i), uuid4(), 9)) for i in (1, 2)
+        ]
+        stats_result = MagicMock()
+        stats_result.all.return_value = [(posting_id, "en_cours", 12, 4)]
+        session = AsyncMock()
+        session.execute.side_effect = [page_result, stats_result]
+        repository = JobApplicationRepository(session)
+
+        with patch.object(repository, "_to_entity", side_effect=lambda model: model):
+            page = await repository.list_page_by_posting(
+                posting_id, skip=0, limit=2, status=ApplicationStatus.EN_COURS, sort_by="tjm"
+            )
+
+        assert page.items == ["application-1", "application-2"]
+        assert page.total == 9
+        assert page.next_cursor is not None
+        assert page.stats["total"] == 12
+        assert page.stats["unread"] == 4
+        assert session.execute.await_count == 2
+        list_query = str(session.execute.await_args_list[0].args[0])
+        assert "count(*) OVER ()" in list_query
+        assert "coalesce(job_applications.tjm_desired, job_applications.tjm_current)" in list_query
+        assert "job_applications.cv_text" not in list_query  # deferred
+        assert "job_applications.status_history" not in list_query
+
+
+def _migration_indexes(filename: str) -> dict[str, str]:
+    path = Path(__file__).parents[3] / "alembic" / "versions" / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.INDEXES
+
+
+class TestListApplicationsForPostingUseCase:
+    """Tests for the HR applications list of a posting."""
+
+    @staticmethod
+    def _application(prescreen_score: int | None) -> JobApplication:
+        return JobApplication(
+            job_posting_id=uuid4(),
+            first_name="Jean",
+            last_name="Dupont",
+            email="jean@example.com",
+            phone="+33600000000",
+            job_title="Développeur Python",
+            availability="asap",
+            employment_status="freelance",
+            english_level="fluent",
+            cv_s3_key="cv/jean.pdf",
+            cv_filename="cv.pdf",
+            prescreen_score=prescreen_score,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_does_not_read_cv_texts(self):
+        """Should serve stored prescreen scores without reading any CV text."""
+        scored, unscored = self._application(prescreen_score=60), self._application(None)
+        posting_repo = AsyncMock()
+        posting_repo.get_by_id.return_value = MagicMock(title="Dev Python")
+        application_repo = AsyncMock()
+        application_repo.list_page_by_posting.return_value = Page(
+            items=[scored, unscored], total=2, stats={"total": 2}
+        )
+        use_case = ListApplicationsForPostingUseCase(
+            job_posting_repository=posting_repo,
+            job_application_repository=application_repo,
+            s3_client=AsyncMock(get_presigned_url=AsyncMock(return_value="https://s3/cv.pdf")),
+        )
+
+        result = await use_case.execute(uuid4())
+
+        application_repo.get_cv_texts.assert_not_awaited()
+        assert [item.prescreen_score for item in result.items] == [60, None]
+        assert "status_history" not in result.items[0].model_dump()
+
+
+class TestJobApplicationDocuments:
+    """The CV text is stored in application_documents, apart from the application row."""
+
+    @staticmethod
+    def _session(application: JobApplication) -> AsyncMock:
+        """Session whose upserts return the application row."""
+        session = AsyncMock()
+        session.bind = None
+        row = JobApplicationModel(**JobApplicationRepository(session)._to_values(application))
+        session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=row))
+        return session
+
+    @staticmethod
+    def _statements(session: AsyncMock) -> list[str]:
+        return [str(call.args[0]) for call in session.execute.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_save_writes_cv_text_to_documents(self):
+        application = TestListApplicationsForPostingUseCase._application(prescreen_score=None)
+        application.set_cv_text("Python FastAPI")
+        session = self._session(application)
+
+        saved = await JobApplicationRepository(session).save(application)
+
+        application_upsert, document_upsert = self._statements(session)
+        assert application_upsert.startswith("INSERT INTO job_applications")
+        assert "cv_text" not in application_upsert
+        assert document_upsert.startswith("INSERT INTO application_documents")
+        assert "ON CONFLICT (application_id) DO UPDATE" in document_upsert
+        parameters = session.execute.await_args_list[1].args[0].compile().params
+        assert parameters["application_id"] == application.id
+        assert parameters["cv_text"] == "Python FastAPI"
+        assert saved.cv_text == "Python FastAPI"
+
+    @pytest.mark.asyncio
+    async def test_save_without_loaded_cv_text_keeps_document(self):
+        application = TestListApplicationsForPostingUseCase._application(prescreen_score=None)
+        session = self._session(application)
+
+        await JobApplicationRepository(session).save(application)
+
+        assert len(self._statements(session)) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_cv_texts_reads_documents_only(self):
+        session = AsyncMock()
+        application_id = uuid4()
+        session.execute.return_value = MagicMock(
+            all=MagicMock(return_value=[(application_id, "CV")])
+        )
+
+        texts = await JobApplicationRepository(session).get_cv_texts([application_id])
+
+        assert texts == {application_id: "CV"}
+        query = str(session.execute.await_args.args[0])
+        assert "FROM application_documents" in query
+        assert "job_applications" not in query
+
+
+class TestJobApplicationSortIndexes:
+    """The list ORDER BY must match the index definitions to be read in index order."""
+
+    @pytest.mark.parametrize(
+        ("sort_by", "index_name"),
+        [
+            ("score", "ix_job_applications_posting_score"),
+            ("prescreen", "ix_job_applications_posting_prescreen"),
+            ("tjm", "ix_job_applications_posting_tjm"),
+            ("salary", "ix_job_applications_posting_salary"),
+            ("date", "ix_job_applications_posting_created_at_id"),
+        ],
+    )
+    def test_order_by_matches_index_columns(self, sort_by, index_name):
+        indexes = {
+            **_migration_indexes("028_add_keyset_pagination_indexes.py"),
+            **_migration_indexes("029_add_job_application_sort_indexes.py"),
+        }
+        keys = JobApplicationRepository(AsyncMock())._posting_sort_keys(sort_by, "desc")
+        order_by = ", ".join(
+            str(key.order_by().compile(dialect=postgresql.dialect())) for key in keys
+        )
+
+        assert (
+            f"(job_posting_id, {order_by.replace('job_applications.', '')})"
+            in (indexes[index_name])
+        )
+
+
+class TestListJobPostingsUseCase:
+    """Tests for the HR job postings list."""
+
+    @staticmethod
+    def _row(index: int, with_creator: bool = True) -> tuple:
+        posting = JobPostingModel(
+            id=uuid4(),
+            opportunity_id=uuid4(),
+            title=f"Poste {index}",
+            description="Description",
+            qualifications="Qualifications",
+            location_country="France",
+            contract_types=["FREELANCE"],
+            skills=["Python"],
+            status="published",
+            application_token=f"token-{index}",
+            created_by=uuid4() if with_creator else None,
+            created_at=datetime(2026, 1, 1),
+            updated_at=datetime(2026, 1, 1),
+            view_count=0,
+        )
+        creator = ("Marie", "Curie") if with_creator else (None, None)
+        return (posting, "Opportunité", "REF-1", "Client", *creator, 5, 2)
+
+    @staticmethod
+    def _session(rows: list[tuple], total: int | None = None) -> AsyncMock:
+        """Session returning the page ids, then the joined page rows."""
+        id_row = result_tuple(["id", "sort_key_0", "sort_key_1", "total_count"])
+        ids_result = MagicMock()
+        ids_result.all.return_value = [
+            id_row((row[0].id, row[0].created_at, row[0].id, total or len(rows))) for row in rows
+        ]
+        details_result = MagicMock()
+        details_result.all.return_value = rows
+        session = AsyncMock()
+        session.execute.side_effect = [ids_result, details_result]
+        return session
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_size", [1, 50])
+    async def test_statement_count_independent_of_page_size(self, page_size):
+        """Should run the same statements for 1 or 50 postings (no per-row queries)."""
+        session = self._session([self._row(i) for i in range(page_size)])
+        use_case = ListJobPostingsUseCase(job_posting_repository=JobPostingRepository(session))
+
+        result = await use_case.execute(page=1, page_size=page_size)
+
+        assert len(result.items) == page_size
+        assert session.execute.await_count == 2  # page ids with total + joined page
+
+    @pytest.mark.asyncio
+    async def test_items_built_from_joined_rows(self):
+        """Should map opportunity, creator and application counts from the row."""
+        session = self._session([self._row(1), self._row(2, with_creator=False)])
+        use_case = ListJobPostingsUseCase(job_posting_repository=JobPostingRepository(session))
+
+        result = await use_case.execute()
+
+        first, second = result.items
+        assert first.opportunity_reference == "REF-1"
+        assert first.created_by_name == "Marie Curie"
+        assert first.applications_total == 5
+        assert first.applications_new == 2
+        assert first.application_url.endswith("/postuler/token-1")
+        assert second.created_by_name is None
+        assert result.total == 2
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_reads_postings_after_previous_page(self):
+        """Should read the next page after the cursor row, with the carried total."""
+        first_page = await ListJobPostingsUseCase(
+            job_posting_repository=JobPostingRepository(self._session([self._row(1)], total=3))
+        ).execute(page=1, page_size=1)
+        session = self._session([self._row(2), self._row(3)])
+        use_case = ListJobPostingsUseCase(job_posting_repository=JobPostingRepository(session))
+
+        result = await use_case.execute(page=2, page_size=1, cursor=first_page.next_cursor)
+
+        assert [item.title for item in result.items] == ["Poste 2"]
+        assert result.total == 3
+        assert result.next_cursor is not None
+        assert session.execute.await_count == 2  # page ids + joined page, no count
+        ids_query = str(session.execute.await_args_list[0].args[0])
+        assert "(job_postings.created_at, job_postings.id) < " in ids_query
+        assert "OFFSET" not in ids_query
+
+    @pytest.mark.asyncio
+    async def test_empty_page_skips_details_query(self):
+        """Should not join anything when the page has no postings."""
+        session = self._session([])
+        use_case = ListJobPostingsUseCase(job_posting_repository=JobPostingRepository(session))
+
+        result = await use_case.execute()
+
+        assert result.items == []
+        assert result.total == 0
+        session.execute.assert_awaited_once()
+
+
 class TestCreateJobPostingUseCase:
     """Tests for creating job postings."""
 
@@ -291,6 +623,7 @@ class TestPublishJobPostingUseCase:
             "user_repo": AsyncMock(),
             "turnoverit_client": AsyncMock(),
             "boond_client": AsyncMock(),
+            "unit_of_work": AsyncMock(),
         }
 
     @pytest.fixture
@@ -301,6 +634,7 @@ class TestPublishJobPostingUseCase:
             user_repository=mock_deps["user_repo"],
             turnoverit_client=mock_deps["turnoverit_client"],
             boond_client=mock_deps["boond_client"],
+            unit_of_work=mock_deps["unit_of_work"],
         )
 
     @pytest.mark.asyncio
@@ -360,10 +694,18 @@ class TestPublishJobPostingUseCase:
 
         mock_deps["job_posting_repo"].save.side_effect = mock_save
 
+        calls = []
+        mock_deps["unit_of_work"].release.side_effect = lambda: calls.append("release")
+        mock_deps["turnoverit_client"].create_job.side_effect = lambda payload: (
+            calls.append("create_job") or "TIT-12345"
+        )
+
         result = await use_case.execute(posting_id)
 
         mock_deps["turnoverit_client"].create_job.assert_called_once()
         posting.publish.assert_called_once()
+        # The connection is back in the pool before the Turnover-IT call
+        assert calls == ["release", "create_job"]
 
     @pytest.mark.asyncio
     async def test_publish_already_published_raises_error(self, use_case, mock_deps):
@@ -393,6 +735,7 @@ class TestSubmitApplicationUseCase:
             "job_application_repo": AsyncMock(),
             "s3_client": AsyncMock(),
             "matching_service": AsyncMock(),
+            "text_extractor": AsyncMock(),
         }
 
     @pytest.fixture
@@ -402,6 +745,7 @@ class TestSubmitApplicationUseCase:
             job_application_repository=mock_deps["job_application_repo"],
             s3_client=mock_deps["s3_client"],
             matching_service=mock_deps["matching_service"],
+            text_extractor=mock_deps["text_extractor"],
         )
 
     @pytest.mark.asyncio
@@ -433,33 +777,100 @@ class TestSubmitApplicationUseCase:
 
         mock_deps["job_application_repo"].save.side_effect = mock_save
 
-        with patch(
-            "app.infrastructure.cv_transformer.extractors.extract_text_from_bytes",
-            return_value="CV text",
-        ):
-            command = SubmitApplicationCommand(
-                application_token="test-token",
-                first_name="Jean",
-                last_name="Dupont",
-                email="jean@example.com",
-                phone="+33612345678",
-                job_title="Dev Python",
-                availability="1_month",
-                employment_status="freelance",
-                english_level="professional",
-                tjm_current=450.0,
-                tjm_desired=500.0,
-                cv_content=b"PDF content",
-                cv_filename="cv.pdf",
-                cv_content_type="application/pdf",
-            )
+        mock_deps["text_extractor"].extract_text.return_value = "CV text"
+
+        command = SubmitApplicationCommand(
+            application_token="test-token",
+            first_name="Jean",
+            last_name="Dupont",
+            email="jean@example.com",
+            phone="+33612345678",
+            job_title="Dev Python",
+            availability="1_month",
+            employment_status="freelance",
+            english_level="professional",
+            tjm_current=450.0,
+            tjm_desired=500.0,
+            cv_content=b"PDF content",
+            cv_filename="cv.pdf",
+            cv_content_type="application/pdf",
+        )
 
-            result = await use_case.execute(command)
+        result = await use_case.execute(command)
 
         assert result.success is True
         mock_deps["s3_client"].upload_file.assert_called_once()
+        mock_deps["text_extractor"].extract_text.assert_called_once_with(
+            b"PDF content", "cv.pdf", max_chars=SubmitApplicationUseCase.CV_TEXT_MAX_CHARS
+        )
         mock_deps["job_application_repo"].save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_submit_on_demand_mode_skips_llm(self, mock_deps):
+        """Should only store the local pre-score when LLM scoring is on demand."""
+        use_case = SubmitApplicationUseCase(
+            job_posting_repository=mock_deps["job_posting_repo"],
+            job_application_repository=mock_deps["job_application_repo"],
+            s3_client=mock_deps["s3_client"],
+            matching_service=mock_deps["matching_service"],
+            text_extractor=mock_deps["text_extractor"],
+            llm_mode="on_demand",
+        )
+        posting = MagicMock(
+            id=uuid4(),
+            status=JobPostingStatus.PUBLISHED,
+            title="Dev Python",
+            description="Description",
+            qualifications="Python, Docker",
+            skills=["Python"],
+        )
+        mock_deps["job_posting_repo"].get_by_token.return_value = posting
+        mock_deps["job_application_repo"].exists_by_email_and_posting.return_value = False
+        mock_deps["job_application_repo"].save.side_effect = lambda app: app
+
+        mock_deps["text_extractor"].extract_text.return_value = "Développeur Python et Docker"
+
+        command = SubmitApplicationCommand(
+            application_token="test-token",
+            first_name="Jean",
+            last_name="Dupont",
+            email="jean@example.com",
+            phone="+33612345678",
+            job_title="Dev Python",
+            availability="asap",
+            employment_status="freelance",
+            english_level="professional",
+            cv_content=b"PDF content",
+            cv_filename="cv.pdf",
+            cv_content_type="application/pdf",
+        )
+        result = await use_case.execute(command)
+
+        assert result.success is True
+        mock_deps["matching_service"].calculate_match_enhanced.assert_not_called()
+        saved_application = mock_deps["job_application_repo"].save.call_args[0][0]
+        assert saved_application.prescreen_score > 90
+        assert saved_application.matching_score is None
+
+    @pytest.mark.asyncio
+    async def test_submit_top_n_mode_skips_llm_outside_top(self, mock_deps):
+        """Should skip LLM scoring when the pre-score ranks outside the top N."""
+        use_case = SubmitApplicationUseCase(
+            job_posting_repository=mock_deps["job_posting_repo"],
+            job_application_repository=mock_deps["job_application_repo"],
+            s3_client=mock_deps["s3_client"],
+            matching_service=mock_deps["matching_service"],
+            llm_mode="top_n",
+            llm_top_n=5,
+        )
+        mock_deps["job_application_repo"].count_prescreened_above.return_value = 5
+
+        assert await use_case._should_run_llm_scoring(uuid4(), 40) is False
+
+        mock_deps["job_application_repo"].count_prescreened_above.return_value = 4
+
+        assert await use_case._should_run_llm_scoring(uuid4(), 40) is True
+
     @pytest.mark.asyncio
     async def test_submit_duplicate_application(self, use_case, mock_deps):
         """Should reject duplicate applications."""
@@ -692,3 +1103,100 @@ class TestGetApplicationCvUrlUseCase:
 
         with pytest.raises(JobApplicationNotFoundError):
             await use_case.execute(uuid4())
+
+
+class TestAnalyzePendingApplicationsUseCase:
+    """Tests for batch AI analysis of pre-scored applications."""
+
+    @pytest.fixture
+    def mock_deps(self):
+        return {
+            "job_posting_repo": AsyncMock(),
+            "job_application_repo": AsyncMock(),
+            "matching_service": AsyncMock(),
+            "unit_of_work": AsyncMock(),
+        }
+
+    @pytest.fixture
+    def use_case(self, mock_deps):
+        return AnalyzePendingApplicationsUseCase(
+            job_posting_repository=mock_deps["job_posting_repo"],
+            job_application_repository=mock_deps["job_application_repo"],
+            matching_service=mock_deps["matching_service"],
+            unit_of_work=mock_deps["unit_of_work"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyzes_pending_applications_in_one_batch(self, use_case, mock_deps):
+        """Should batch the pending applications, connection released during the call."""
+        posting_id = uuid4()
+        mock_deps["job_posting_repo"].get_by_id.return_value = MagicMock(
+            id=posting_id, title="Dev Python", skills=["Python"]
+        )
+        pending = MagicMock(id=uuid4(), matching_score=None)
+        failed = MagicMock(id=uuid4(), matching_score=None)
+        mock_deps["job_application_repo"].list_pending_analysis.return_value = [pending, failed]
+        calls = MagicMock()
+        calls.attach_mock(mock_deps["unit_of_work"].release, "release")
+        calls.attach_mock(mock_deps["matching_service"].calculate_match_batch, "batch")
+        mock_deps["job_application_repo"].get_cv_texts.return_value = {
+            pending.id: "CV Python",
+            failed.id: "CV Java",
+        }
+        mock_deps["matching_service"].calculate_match_batch.return_value = {
+            str(pending.id): {"score_global": 74, "synthese": "Bon profil"},
+        }
+
+        result = await use_case.execute(posting_id, top_n=10)
+
+        assert result.analyzed_count == 1
+        assert result.failed_count == 1
+        mock_deps["job_application_repo"].list_pending_analysis.assert_called_once_with(
+            posting_id=posting_id, limit=10
+        )
+        assert [c[0] for c in calls.mock_calls[:2]] == ["release", "batch"]
+        candidates = mock_deps["matching_service"].calculate_match_batch.call_args.kwargs[
+            "candidates"
+        ]
+        assert [c.candidate_id for c in candidates] == [str(pending.id), str(failed.id)]
+        assert candidates[0].cv_text == "CV Python"
+        mock_deps["job_application_repo"].get_cv_texts.assert_awaited_once_with(
+            [pending.id, failed.id]
+        )
+        assert pending.matching_score == 74
+        assert pending.matching_details["summary"] == "Bon profil"
+        mock_deps["job_application_repo"].save.assert_called_once_with(pending)
+
+    @pytest.mark.asyncio
+    async def test_pending_filter_applied_before_limit(self):
+        """Analysed applications must not fill the top N of later calls."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+        )
+
+        await JobApplicationRepository(session).list_pending_analysis(uuid4(), limit=10)
+
+        sql = str(session.execute.await_args.args[0])
+        assert "job_applications.matching_score IS NULL" in sql
+        assert "EXISTS (SELECT application_documents.application_id" in sql
+        assert sql.index("matching_score IS NULL") < sql.index("LIMIT")
+
+    @pytest.mark.asyncio
+    async def test_no_pending_application_skips_matching(self, use_case, mock_deps):
+        """Should not call Gemini when every application is already analysed."""
+        mock_deps["job_posting_repo"].get_by_id.return_value = MagicMock()
+        mock_deps["job_application_repo"].list_pending_analysis.return_value = []
+
+        result = await use_case.execute(uuid4())
+
+        assert result.analyzed_count == 0
+        mock_deps["matching_service"].calculate_match_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_posting_not_found(self, use_case, mock_deps):
+        """Should raise error if posting not found."""
+        mock_deps["job_posting_repo"].get_by_id.return_value = None
+
+        with pytest.raises(JobPostingNotFoundError):
+            await use_case.execute(uuid4())
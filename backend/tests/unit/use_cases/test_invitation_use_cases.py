@@ -258,7 +258,10 @@ class TestAcceptInvitationUseCase:
 
         use_case = AcceptInvitationUseCase(**mock_repositories)
 
-        with patch("app.infrastructure.security.password.hash_password", return_value="hashed"):
+        with patch(
+            "app.infrastructure.security.password.hash_password_async",
+            AsyncMock(return_value="hashed"),
+        ):
             result = await use_case.execute(
                 AcceptInvitationCommand(
                     token="test-token",
@@ -8,8 +8,12 @@ from uuid import uuid4
 
 import pytest
 
+from app.application.use_cases.published_opportunities import (
+    ListPublishedOpportunitiesUseCase,
+)
 from app.domain.entities import PublishedOpportunity
 from app.domain.value_objects import OpportunityStatus
+from app.infrastructure.database.repositories import Page
 
 
 class TestAnonymizeOpportunityUseCase:
@@ -192,6 +196,27 @@ class TestListPublishedOpportunitiesUseCase:
 
         assert len(result) == 0
 
+    @pytest.mark.asyncio
+    async def test_use_case_reads_page_and_total_together(
+        self, mock_repository, sample_opportunities
+    ):
+        """Test that the page and its total come from one repository call."""
+        mock_repository.list_published_page.return_value = Page(
+            items=sample_opportunities, total=12
+        )
+
+        result = await ListPublishedOpportunitiesUseCase(mock_repository).execute(
+            page=2, page_size=2, search="dev"
+        )
+
+        assert [item.title for item in result.items] == [
+            "Développeur Python",
+            "Développeur Java",
+        ]
+        assert result.total == 12
+        mock_repository.list_published_page.assert_awaited_once_with(skip=2, limit=2, search="dev")
+        mock_repository.count_published.assert_not_called()
+
 
 class TestCloseOpportunityUseCase:
     """Tests for closing opportunities."""
@@ -682,7 +682,7 @@ export interface JobApplication {
   boond_sync_error: string | null;
   boond_synced_at: string | null;
   boond_sync_status: 'synced' | 'error' | 'pending' | 'not_applicable';
-  status_history: StatusChange[];
+  status_history?: StatusChange[]; // detail only (absent from list items)
   created_at: string;
   updated_at: string;
 }